@@ -0,0 +1,183 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Coalescing of concurrent action executions on different target entities."""
+
+import asyncio
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from logger_utils import get_logger
+from secops_soar_mcp.utils.models import TargetEntity
+
+logger = get_logger(__name__)
+
+# Fields naming the entity of an item of a per-entity action result, as in
+# the [{"Entity": ..., "EntityResult": ...}] JSON results of SOAR actions.
+RESULT_ENTITY_FIELDS = ("Entity", "entity", "EntityIdentifier", "Identifier")
+
+Execute = Callable[[List[TargetEntity]], Awaitable[Any]]
+
+
+def _entity_key(entity: TargetEntity) -> Tuple[str, str]:
+    return entity.Identifier.upper(), entity.EntityType.upper()
+
+
+def _result_entity(item: Any) -> Any:
+    if isinstance(item, dict):
+        for field in RESULT_ENTITY_FIELDS:
+            if isinstance(item.get(field), str):
+                return item[field]
+    return None
+
+
+def split_result(result: Any, identifiers: Set[str]) -> Any:
+    """Keeps the per-entity results of the given entities in an action result.
+
+    Lists of per-entity results, anywhere in the result and including JSON
+    encoded ones, are filtered down to the items of the given upper-cased
+    entity identifiers. The rest of the result is shared by all entities.
+    """
+    if isinstance(result, dict):
+        return {key: split_result(value, identifiers) for key, value in result.items()}
+    if isinstance(result, list):
+        if result and all(_result_entity(item) is not None for item in result):
+            return [
+                item for item in result if _result_entity(item).upper() in identifiers
+            ]
+        return [split_result(item, identifiers) for item in result]
+    if isinstance(result, str) and result[:1] in ("[", "{"):
+        try:
+            decoded = json.loads(result)
+        except ValueError:
+            return result
+        split = split_result(decoded, identifiers)
+        return result if split == decoded else json.dumps(split)
+    return result
+
+
+class _Batch:
+    def __init__(self, execute: Execute):
+        self.execute = execute
+        self.entities: Dict[Tuple[str, str], TargetEntity] = {}
+        self.callers: List[Tuple[List[TargetEntity], asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def add(self, entities: List[TargetEntity]) -> asyncio.Future:
+        for entity in entities:
+            self.entities.setdefault(_entity_key(entity), entity)
+        future = asyncio.get_running_loop().create_future()
+        self.callers.append((entities, future))
+        return future
+
+
+class ActionCoalescer:
+    """Merges concurrent executions of an action into one, on all their entities.
+
+    Executions submitted with the same key, i.e. the same case, action and
+    parameters, within `window` seconds of the first one run as a single
+    execution on the union of their target entities. Each caller then gets
+    the result with the per-entity results of its own entities only. A batch
+    runs early once it holds `max_entities` entities.
+    """
+
+    def __init__(self, window: float, max_entities: int):
+        self._window = window
+        self._max_entities = max_entities
+        self._pending: Dict[Hashable, _Batch] = {}
+        self._running: Set[asyncio.Task] = set()
+        self.requests = 0
+        self.executions = 0
+
+    async def submit(
+        self, key: Hashable, entities: List[TargetEntity], execute: Execute
+    ) -> Any:
+        """Runs `execute` on the entities, along with concurrent submissions.
+
+        Args:
+            key: Identifies the executions that can be merged.
+            entities: The target entities of this execution.
+            execute: Runs the action on a list of target entities. The one of
+                the first submission of a batch runs it.
+
+        Returns:
+            The result of the execution, split for `entities`.
+        """
+        self.requests += 1
+        batch = self._pending.get(key)
+        new_keys = {_entity_key(entity) for entity in entities}
+        if (
+            batch is not None
+            and len(new_keys | batch.entities.keys()) > self._max_entities
+        ):
+            self._flush(key, batch)
+            batch = None
+        if batch is None:
+            batch = _Batch(execute)
+            self._pending[key] = batch
+            batch.flush_handle = asyncio.get_running_loop().call_later(
+                self._window, self._flush, key, batch
+            )
+        future = batch.add(entities)
+        if len(batch.entities) >= self._max_entities:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _Batch):
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        batch.flush_handle.cancel()
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _Batch):
+        self.executions += 1
+        entities = list(batch.entities.values())
+        if len(batch.callers) > 1:
+            logger.info(
+                "Running %d coalesced action executions on %d entities.",
+                len(batch.callers),
+                len(entities),
+            )
+        try:
+            result = await batch.execute(entities)
+        except Exception as e:
+            for _, future in batch.callers:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for caller_entities, future in batch.callers:
+            if future.done():
+                continue
+            if len(batch.callers) == 1:
+                future.set_result(result)
+            else:
+                future.set_result(
+                    split_result(
+                        result, {_entity_key(entity)[0] for entity in caller_entities}
+                    )
+                )
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "executions": self.executions}
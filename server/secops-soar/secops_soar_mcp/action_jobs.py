@@ -0,0 +1,243 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tools running marketplace actions as background jobs."""
+
+from typing import Annotated, Any, Dict, List, Optional
+
+import aiohttp
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field, ValidationError
+from secops_soar_mcp import actions, bindings, marketplace_tools
+from secops_soar_mcp.utils import consts
+from secops_soar_mcp.utils.models import TargetEntity
+from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
+
+MAX_WAIT_SECONDS = 300
+
+
+def register_tools(mcp: FastMCP):
+    @mcp.tool()
+    async def submit_action_job(
+        action_tool_name: Annotated[
+            str,
+            Field(
+                ...,
+                description="The name of the marketplace action tool to run (e.g. slack_wait_for_reply). Its integration must be enabled.",
+            ),
+        ],
+        case_id: Annotated[
+            str, Field(..., description="The ID of the case to run the action on.")
+        ],
+        alert_group_identifiers: Annotated[
+            List[str], Field(..., description="Identifiers for the alert groups.")
+        ],
+        parameters: Annotated[
+            Optional[Dict[str, Any]],
+            Field(
+                default=None,
+                description="The action parameters, named as in the action tool's arguments.",
+            ),
+        ],
+        target_entities: Annotated[
+            List[TargetEntity],
+            PydanticListField(
+                TargetEntity,
+                description="Specific entities to run the action on. If empty, the action runs on the entities of the scope.",
+            ),
+        ],
+        scope: Annotated[
+            str,
+            Field(
+                default=marketplace_tools.DEFAULT_SCOPE,
+                description="The entity scope to run the action on when no target entities are given.",
+            ),
+        ],
+        timeout_seconds: Annotated[
+            float,
+            Field(
+                default=consts.DEFAULT_JOB_TIMEOUT_SECONDS,
+                gt=0,
+                le=86400,
+                description="How long the action may take before the job fails.",
+            ),
+        ],
+    ) -> dict:
+        """Start a long-running marketplace integration action without waiting for it to finish.
+
+        Some integration actions take minutes to complete, such as waiting for a reply on a chat
+        platform or submitting a file to a sandbox and fetching its report. Running them through
+        their action tool blocks until SOAR answers. This tool instead starts the action in the
+        background and immediately returns a job handle, whose result is collected later with
+        `get_job_result` or `wait_for_jobs`.
+
+        Args:
+            action_tool_name (str): The marketplace tool whose action to run, as listed by this server
+                                    (Example: "slack_wait_for_reply").
+            case_id (str): The ID of the case to run the action on.
+            alert_group_identifiers (List[str]): Identifiers for the alert groups.
+            parameters (Optional[Dict[str, Any]]): The action's parameters, using the argument names
+                                                   of the action tool, excluding `case_id`,
+                                                   `alert_group_identifiers`, `target_entities` and
+                                                   `scope`.
+            target_entities (List[TargetEntity]): Specific entities to run the action on.
+            scope (str): The entity scope to use when no target entities are given.
+            timeout_seconds (float): How long to wait for SOAR to complete the action.
+
+        Returns:
+            dict: The job, with its 'job_id', 'action_tool_name', 'case_id', 'status' ("running"),
+                  'submitted_at' and 'duration_seconds'. If the tool or parameters are invalid, no job
+                  is started and a dictionary with a "Failed" Status and a Message is returned.
+
+        **Workflow Integration:**
+        - Use for actions documented as long-running or asynchronous, so that the investigation can
+          continue while they run.
+        - Submit several jobs before waiting, to run them in parallel.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Collect the result with `get_job_result`, or wait for several jobs with `wait_for_jobs`.
+        """
+        found = marketplace_tools.find_action(action_tool_name)
+        if found is None:
+            return {
+                "Status": "Failed",
+                "Message": f"Unknown action tool '{action_tool_name}'. Enable its integration with --integrations.",
+            }
+        integration_name, action = found
+        try:
+            arguments = marketplace_tools.validate_action_arguments(
+                action, parameters or {}
+            )
+        except ValidationError as e:
+            return {"Status": "Failed", "Message": f"Invalid parameters: {e}"}
+        script_params = marketplace_tools.build_script_params(action, arguments)
+        timeout = aiohttp.ClientTimeout(
+            total=timeout_seconds,
+            connect=bindings.http_client.config.connect_timeout or None,
+            sock_read=timeout_seconds,
+        )
+
+        def run():
+            return actions.execute_manual_action(
+                integration_name,
+                action.action_name,
+                case_id=case_id,
+                alert_group_identifiers=alert_group_identifiers,
+                script_params=script_params,
+                target_entities=target_entities,
+                scope=scope,
+                retry_safe=action.retry_safe,
+                timeout=timeout,
+            )
+
+        job = bindings.job_tracker.submit(
+            run,
+            {"action_tool_name": action_tool_name, "case_id": case_id},
+            actions.is_failure,
+        )
+        return job.to_dict()
+
+    @mcp.tool()
+    async def get_job_result(
+        job_id: Annotated[
+            str,
+            Field(..., description="The ID of the job, as returned by submit_action_job."),
+        ],
+    ) -> dict:
+        """Get the status of a background action job, and its result once it has finished.
+
+        Returns immediately, whether or not the job has finished.
+
+        Args:
+            job_id (str): The ID of the job.
+
+        Returns:
+            dict: The job, with its 'job_id', 'action_tool_name', 'case_id', 'status' ("running",
+                  "succeeded", "failed" or "cancelled"), 'submitted_at' and 'duration_seconds'.
+                  A succeeded job also holds the raw action 'result', a failed one a 'message'.
+                  If the job is unknown, a dictionary with a "Failed" Status and a Message is
+                  returned; results of old jobs are eventually discarded.
+
+        **Workflow Integration:**
+        - Use to check on a job while working on something else.
+
+        **Next Steps (using MCP-enabled tools):**
+        - If the job is still running, continue the investigation and check again later, or use
+          `wait_for_jobs`.
+        """
+        job = bindings.job_tracker.get(job_id)
+        if job is None:
+            return {"Status": "Failed", "Message": f"Unknown job '{job_id}'."}
+        return job.to_dict()
+
+    @mcp.tool()
+    async def wait_for_jobs(
+        job_ids: Annotated[
+            List[str],
+            Field(..., description="The IDs of the jobs to wait for."),
+        ],
+        timeout_seconds: Annotated[
+            float,
+            Field(
+                default=30,
+                ge=0,
+                le=MAX_WAIT_SECONDS,
+                description="The longest time to wait.",
+            ),
+        ],
+        wait_for_all: Annotated[
+            bool,
+            Field(
+                default=False,
+                description="Whether to wait for all of the jobs to finish, rather than the first one.",
+            ),
+        ],
+    ) -> dict:
+        """Wait for background action jobs to finish, returning their results as they complete.
+
+        Returns as soon as one of the jobs finishes (or all of them, with `wait_for_all`), or when
+        the timeout expires, with the results of every job finished so far.
+
+        Args:
+            job_ids (List[str]): The IDs of the jobs to wait for.
+            timeout_seconds (float): The longest time to wait, in seconds. 0 returns immediately.
+            wait_for_all (bool): Whether to wait for all of the jobs rather than the first one.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'finished': The finished jobs, as returned by `get_job_result`.
+                  - 'running': The IDs of the jobs still running.
+                  - 'unknown': The IDs of unknown jobs, if any.
+
+        **Workflow Integration:**
+        - Use after submitting several jobs, to process their results in the order they finish.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Call again with the IDs still running to collect the remaining results.
+        """
+        jobs = []
+        unknown = []
+        for job_id in dict.fromkeys(job_ids):
+            job = bindings.job_tracker.get(job_id)
+            if job is None:
+                unknown.append(job_id)
+            else:
+                jobs.append(job)
+        finished = await bindings.job_tracker.wait(jobs, timeout_seconds, wait_for_all)
+        result = {
+            "finished": [job.to_dict() for job in finished],
+            "running": [job.job_id for job in jobs if not job.done],
+        }
+        if unknown:
+            result["unknown"] = unknown
+        return result
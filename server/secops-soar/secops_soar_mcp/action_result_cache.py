@@ -0,0 +1,170 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the results of entity enrichment actions."""
+
+import collections
+import datetime
+import json
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from secops_soar_mcp.utils.consts import ACTION_RESULT_CACHE_TTL_SECONDS
+from secops_soar_mcp.utils.models import TargetEntity
+
+ENRICHMENT_ACTION_PREFIX = "enrich"
+
+
+def action_type(action_name: str) -> str:
+    """Returns an action name without its integration (e.g. "Enrich IP")."""
+    return action_name.split("_", 1)[-1]
+
+
+def is_cacheable(action_name: str) -> bool:
+    """Whether the results of an action may be cached.
+
+    Enrichment actions ("Enrich Entities", "Enrich IP", ...) only look up the
+    entities they run on, so running them again shortly after returns the
+    same result.
+    """
+    return action_type(action_name).lower().startswith(ENRICHMENT_ACTION_PREFIX)
+
+
+def parse_ttls(value: Optional[str]) -> Dict[str, float]:
+    """Parses TTL overrides like "Enrich Hash=86400,VirusTotalV3_Enrich IP=600".
+
+    Raises:
+        ValueError: If an override is not a name and a number of seconds.
+    """
+    ttls = {}
+    for override in (value or "").split(","):
+        if not override.strip():
+            continue
+        name, separator, seconds = override.rpartition("=")
+        if not separator or not name.strip():
+            raise ValueError(f"Invalid action result cache TTL '{override}'.")
+        ttls[name.strip().lower()] = float(seconds)
+    return ttls
+
+
+class ActionResultCache:
+    """A size-bounded LRU cache of enrichment action results.
+
+    Results are keyed by integration, action, parameters and target entities,
+    and by the case environment when instances are chosen by environment, so
+    that an entity enriched in one case is not enriched again, in the same or
+    another case, until the result expires. Only successful results of
+    actions run on specific target entities are cached, as the entities of a
+    scope depend on the case.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float,
+        ttl_overrides: Dict[str, float],
+        max_entries: int,
+    ):
+        """Initializes the cache.
+
+        Args:
+            default_ttl: Seconds the results of an action are cached for,
+                unless the action has a TTL of its own.
+            ttl_overrides: TTLs by lower-cased action name (e.g.
+                "virustotalv3_enrich hash") or action type ("enrich hash").
+                They take precedence over `ACTION_RESULT_CACHE_TTL_SECONDS`.
+            max_entries: The maximum number of cached results.
+        """
+        self._default_ttl = default_ttl
+        self._ttls = {
+            **{name.lower(): ttl for name, ttl in ACTION_RESULT_CACHE_TTL_SECONDS.items()},
+            **ttl_overrides,
+        }
+        self._max_entries = max_entries
+        self._entries: (
+            "collections.OrderedDict[Hashable, Tuple[float, str, str, Any]]"
+        ) = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl(self, action_name: str) -> float:
+        """Returns the number of seconds the results of an action are cached for."""
+        for name in (action_name, action_type(action_name)):
+            ttl = self._ttls.get(name.lower())
+            if ttl is not None:
+                return ttl
+        return self._default_ttl
+
+    def key(
+        self,
+        integration_name: str,
+        action_name: str,
+        script_params: Dict[str, Any],
+        target_entities: Optional[List[TargetEntity]],
+        environment: Optional[str] = None,
+    ) -> Optional[Hashable]:
+        """Returns the cache key of an action execution, or None if not cacheable.
+
+        `environment` is the environment of the case when it selects the
+        instance the action runs on, so that the results of one environment's
+        instances are not returned in the cases of another.
+        """
+        if not target_entities or not is_cacheable(action_name):
+            return None
+        if self.ttl(action_name) <= 0:
+            return None
+        entities = tuple(
+            sorted(
+                {
+                    (entity.Identifier.upper(), entity.EntityType.upper())
+                    for entity in target_entities
+                }
+            )
+        )
+        return (
+            integration_name,
+            action_name,
+            json.dumps(script_params, sort_keys=True, default=str),
+            entities,
+            environment,
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Returns a fresh cached result, else None.
+
+        The result is the ExecuteManualAction response of the case the action
+        ran on, given under "cached_from_case_id" along with the "cached_at"
+        time.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return {**entry[3], "cached_at": entry[1], "cached_from_case_id": entry[2]}
+
+    def put(
+        self, key: Hashable, action_name: str, case_id: str, result: Dict[str, Any]
+    ):
+        self._entries[key] = (
+            time.monotonic() + self.ttl(action_name),
+            datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            case_id,
+            result,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,273 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Execution of SOAR integration actions."""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from logger_utils import get_logger
+from secops_soar_mcp import bindings, instance_selection
+from secops_soar_mcp.action_result_cache import is_cacheable
+from secops_soar_mcp.http_client import HttpError
+from secops_soar_mcp.utils.consts import Endpoints
+from secops_soar_mcp.utils.models import ApiManualActionDataModel, TargetEntity
+
+logger = get_logger(__name__)
+
+
+def _failed(message: str) -> dict:
+    return {"Status": "Failed", "Message": message}
+
+
+def is_failure(execution_response: Any) -> bool:
+    """Whether an `execute_manual_action` response reports a failure."""
+    return execution_response is None or (
+        isinstance(execution_response, dict)
+        and execution_response.get("Status") == "Failed"
+    )
+
+
+def _never_ran(execution_response: Any) -> bool:
+    """Whether a failed request surely did not run the action: SOAR rejected
+    it (4xx, including 429) or it never reached SOAR."""
+    return isinstance(execution_response, HttpError) and (
+        execution_response.status is None or 400 <= execution_response.status < 500
+    )
+
+
+async def _case_environment(case_id: str) -> Optional[str]:
+    case = await bindings.http_client.get(
+        Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id)
+    )
+    return case.get("environment") if isinstance(case, dict) else None
+
+
+async def execute_manual_action(
+    integration_name: str,
+    action_name: str,
+    case_id: str,
+    alert_group_identifiers: List[str],
+    script_params: Dict[str, Any],
+    target_entities: Optional[List[TargetEntity]] = None,
+    scope: Optional[str] = None,
+    retry_safe: bool = False,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+    refresh_cache: bool = False,
+) -> dict:
+    """Executes an integration action on a case through ExecuteManualAction.
+
+    The integration instance is chosen by `bindings.instance_selector`. If the
+    action fails, it is tried on the other instances when it is retry safe or
+    an enrichment action, or when the failure shows that it never ran.
+    Results of enrichment actions run on target entities are served from
+    `bindings.action_result_cache` when it is enabled. With
+    `bindings.action_coalescer`, concurrent executions of an enrichment or
+    retry safe action on target entities of the same case run as one.
+
+    Args:
+        integration_name: The SOAR identifier of the integration (e.g. "CSV").
+        action_name: The SOAR action name (e.g. "CSV_Ping").
+        case_id: The ID of the case to run the action on.
+        alert_group_identifiers: Identifiers for the alert groups.
+        script_params: The action parameters, keyed by their SOAR names.
+        target_entities: Specific entities to run the action on. When empty,
+            the action runs on the entities selected by `scope`.
+        scope: A predefined entity scope, used when no target entities are given.
+        retry_safe: Whether the action is read-only, so that the request can be
+            retried if it fails transiently.
+        timeout: Overrides the configured timeouts of the HTTP client, for
+            actions that take long to complete.
+        refresh_cache: Whether to run the action even if the action result
+            cache holds a result for it.
+
+    Returns:
+        dict: The raw ExecuteManualAction response, or a dict with a "Failed"
+              Status and a Message explaining why the action was not executed.
+    """
+    if target_entities:
+        # Specific target entities provided, ignore scope parameter
+        final_target_entities = target_entities
+        final_scope = None
+    else:
+        if scope not in bindings.valid_scopes:
+            allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
+            return _failed(
+                f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}"
+            )
+        final_target_entities = []  # Pass empty list for entities when using scope
+        final_scope = scope
+
+    environment = None
+    if bindings.instance_selector.policy == instance_selection.ENVIRONMENT:
+        environment = await _case_environment(case_id)
+
+    cache_key = None
+    if bindings.action_result_cache is not None:
+        cache_key = bindings.action_result_cache.key(
+            integration_name,
+            action_name,
+            script_params,
+            final_target_entities,
+            environment,
+        )
+        if cache_key is not None and not refresh_cache:
+            cached_result = bindings.action_result_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+    if (
+        bindings.action_coalescer is not None
+        and final_target_entities
+        and (retry_safe or is_cacheable(action_name))
+    ):
+        # Enrichment and other read-only actions run on specific entities of
+        # the same case with the same parameters are merged into one
+        # execution on all their entities.
+        coalescing_key = (
+            integration_name,
+            action_name,
+            case_id,
+            tuple(alert_group_identifiers),
+            json.dumps(script_params, sort_keys=True, default=str),
+            timeout,
+        )
+        execution_response = await bindings.action_coalescer.submit(
+            coalescing_key,
+            final_target_entities,
+            lambda entities: _execute(
+                integration_name,
+                action_name,
+                case_id,
+                alert_group_identifiers,
+                script_params,
+                entities,
+                None,
+                environment,
+                retry_safe,
+                timeout,
+            ),
+        )
+    else:
+        execution_response = await _execute(
+            integration_name,
+            action_name,
+            case_id,
+            alert_group_identifiers,
+            script_params,
+            final_target_entities,
+            final_scope,
+            environment,
+            retry_safe,
+            timeout,
+        )
+    if (
+        cache_key is not None
+        and isinstance(execution_response, dict)
+        and not is_failure(execution_response)
+    ):
+        bindings.action_result_cache.put(
+            cache_key, action_name, case_id, execution_response
+        )
+    return execution_response
+
+
+async def _execute(
+    integration_name: str,
+    action_name: str,
+    case_id: str,
+    alert_group_identifiers: List[str],
+    script_params: Dict[str, Any],
+    final_target_entities: List[TargetEntity],
+    final_scope: Optional[str],
+    environment: Optional[str],
+    retry_safe: bool,
+    timeout: Optional[aiohttp.ClientTimeout],
+) -> dict:
+    """Posts an ExecuteManualAction request, failing over between instances.
+
+    `environment` is the case environment instances are chosen by, if any.
+    """
+    try:
+        instances = await bindings.instance_cache.get_instances(integration_name)
+    except Exception as e:
+        logger.error("Error fetching instance for %s: %s", integration_name, e)
+        return _failed(f"Error fetching instance: {e}")
+
+    if not instances:
+        logger.warning("No active integration instance found for %s", integration_name)
+        return _failed("No active instance found.")
+    instance_identifiers = bindings.instance_selector.order(
+        integration_name, instances, environment
+    )
+    if not instance_identifiers:
+        return _failed("Instance found but identifier is missing.")
+    # Read-only actions fail over on any failure; the others only when they
+    # surely never ran, as a failed request may still have run them.
+    read_only = retry_safe or is_cacheable(action_name)
+
+    for attempt, instance_identifier in enumerate(instance_identifiers, 1):
+        action_data = ApiManualActionDataModel(
+            alertGroupIdentifiers=alert_group_identifiers,
+            caseId=case_id,
+            targetEntities=final_target_entities,
+            scope=final_scope,
+            isPredefinedScope=final_scope is not None,
+            actionProvider="Scripts",
+            actionName=action_name,
+            properties={
+                "IntegrationInstance": instance_identifier,
+                "ScriptName": action_name,
+                "ScriptParametersEntityFields": json.dumps(script_params),
+            },
+        )
+        with bindings.instance_selector.track(instance_identifier):
+            try:
+                execution_response = await bindings.http_client.post(
+                    Endpoints.EXECUTE_MANUAL_ACTION,
+                    req=action_data.model_dump(),
+                    retry_safe=retry_safe,
+                    timeout=timeout,
+                    return_errors=True,
+                )
+            except Exception as e:
+                logger.error(
+                    "Error executing action %s for %s: %s",
+                    action_name,
+                    integration_name,
+                    e,
+                )
+                execution_response = _failed(f"Error executing action: {e}")
+        instance_missing = bindings.instance_cache.invalidate_if_instance_missing(
+            integration_name, execution_response
+        )
+        never_ran = instance_missing or _never_ran(execution_response)
+        if isinstance(execution_response, HttpError):
+            execution_response = None
+        if not is_failure(execution_response):
+            bindings.instance_selector.report_success(instance_identifier)
+            break
+        bindings.instance_selector.report_failure(instance_identifier)
+        if not read_only and not never_ran:
+            break
+        if attempt < len(instance_identifiers):
+            logger.warning(
+                "Action %s failed on instance %s of %s, failing over to another instance.",
+                action_name,
+                instance_identifier,
+                integration_name,
+            )
+    # Actions can add comments, entities or insights to the case.
+    bindings.http_client.invalidate_case(case_id)
+    return execution_response
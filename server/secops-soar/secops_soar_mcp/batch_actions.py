@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Running one marketplace action across many cases."""
+
+import asyncio
+import math
+import time
+from typing import Annotated, Any, Dict, List, Optional
+
+from logger_utils import get_logger
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field, ValidationError
+from secops_soar_mcp import actions, marketplace_tools
+from secops_soar_mcp.marketplace import ActionManifest
+from secops_soar_mcp.resilience import TokenBucket
+from secops_soar_mcp.utils.models import BatchActionTarget
+from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
+
+logger = get_logger(__name__)
+
+
+async def run_action_batch(
+    integration_name: str,
+    action: ActionManifest,
+    script_params: Dict[str, Any],
+    targets: List[BatchActionTarget],
+    max_concurrency: int,
+    max_per_second: float,
+) -> Dict[str, Any]:
+    """Runs an action on every target, concurrently and rate limited.
+
+    Every target is executed independently: a failure is recorded in its
+    result and does not stop the others.
+
+    Returns:
+        A dict with "total", "succeeded", "failed" and "duration_seconds", and
+        the per-target "results" in the order of `targets`.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # A bucket of a single token spaces out the start of the executions.
+    pacer = TokenBucket(max_per_second, 1)
+    started = time.monotonic()
+
+    async def run(index: int, target: BatchActionTarget) -> Dict[str, Any]:
+        async with semaphore:
+            await pacer.acquire(math.inf)
+            response = await actions.execute_manual_action(
+                integration_name,
+                action.action_name,
+                case_id=target.case_id,
+                alert_group_identifiers=target.alert_group_identifiers,
+                script_params=script_params,
+                target_entities=target.target_entities,
+                scope=target.scope or marketplace_tools.DEFAULT_SCOPE,
+                retry_safe=action.retry_safe,
+            )
+        result = {"index": index, "case_id": target.case_id}
+        if actions.is_failure(response):
+            result["status"] = "failed"
+            result["message"] = (
+                response.get("Message", "Action failed.")
+                if isinstance(response, dict)
+                else "The action request to SOAR failed."
+            )
+        else:
+            result["status"] = "succeeded"
+            result["response"] = response
+        return result
+
+    outcomes = await asyncio.gather(
+        *(run(index, target) for index, target in enumerate(targets)),
+        return_exceptions=True,
+    )
+    results = []
+    for index, (target, outcome) in enumerate(zip(targets, outcomes)):
+        if isinstance(outcome, Exception):
+            logger.error(
+                "Error running %s on case %s: %s",
+                action.action_name,
+                target.case_id,
+                outcome,
+            )
+            outcome = {
+                "index": index,
+                "case_id": target.case_id,
+                "status": "failed",
+                "message": f"Error executing action: {outcome}",
+            }
+        results.append(outcome)
+    succeeded = sum(1 for result in results if result["status"] == "succeeded")
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "results": results,
+    }
+
+
+def register_tools(mcp: FastMCP):
+    @mcp.tool()
+    async def execute_action_batch(
+        action_tool_name: Annotated[
+            str,
+            Field(
+                ...,
+                description="The name of the marketplace action tool to run (e.g. virus_total_v3_enrich_hash). Its integration must be enabled.",
+            ),
+        ],
+        targets: Annotated[
+            List[BatchActionTarget],
+            PydanticListField(
+                BatchActionTarget,
+                description="The cases, alert groups and entities to run the action on, one execution each.",
+            ),
+        ],
+        parameters: Annotated[
+            Optional[Dict[str, Any]],
+            Field(
+                default=None,
+                description="The action parameters, named as in the action tool's arguments. The same parameters are used for every target.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=5,
+                ge=1,
+                le=50,
+                description="Maximum number of executions running at the same time.",
+            ),
+        ],
+        max_per_second: Annotated[
+            float,
+            Field(
+                default=5.0,
+                gt=0,
+                description="Maximum number of executions started per second.",
+            ),
+        ],
+    ) -> dict:
+        """Run the same marketplace integration action on many cases in one call.
+
+        Runs the action of a marketplace tool (such as an enrichment or an EDR containment action)
+        once per target, where each target is a case with its alert groups and optionally specific
+        entities. Executions run concurrently, within `max_concurrency` and `max_per_second`, and each
+        one succeeds or fails independently.
+
+        Args:
+            action_tool_name (str): The marketplace tool whose action to run, as listed by this server
+                                    (Example: "virus_total_v3_enrich_hash").
+            targets (List[BatchActionTarget]): One entry per execution, with `case_id`,
+                                               `alert_group_identifiers`, and optionally
+                                               `target_entities` or `scope`.
+            parameters (Optional[Dict[str, Any]]): The action's parameters, using the argument names
+                                                   of the action tool, excluding `case_id`,
+                                                   `alert_group_identifiers`, `target_entities` and
+                                                   `scope`.
+            max_concurrency (int): How many executions may run at the same time.
+            max_per_second (float): How many executions may start per second.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'total', 'succeeded', 'failed': Execution counts.
+                  - 'duration_seconds': The time taken by the batch.
+                  - 'results': One entry per target, in order, with its 'index', 'case_id', 'status'
+                    ("succeeded" or "failed"), and the raw action 'response' or a failure 'message'.
+                  If the tool or parameters are invalid, nothing is executed and a dictionary with a
+                  "Failed" Status and a Message is returned.
+
+        **Workflow Integration:**
+        - Use when the same action must run on many cases, e.g. enriching one hash wherever it
+          appears, or containing the same host across related cases.
+        - Check the action tool's own description for its parameters and effects before batching it.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Review failed targets and retry them individually with the action tool.
+        - Document the batch outcome on the affected cases using `post_case_comment`.
+        """
+        found = marketplace_tools.find_action(action_tool_name)
+        if found is None:
+            return {
+                "Status": "Failed",
+                "Message": f"Unknown action tool '{action_tool_name}'. Enable its integration with --integrations.",
+            }
+        integration_name, action = found
+        if not targets:
+            return {"Status": "Failed", "Message": "No targets given."}
+        try:
+            arguments = marketplace_tools.validate_action_arguments(
+                action, parameters or {}
+            )
+        except ValidationError as e:
+            return {"Status": "Failed", "Message": f"Invalid parameters: {e}"}
+        return await run_action_batch(
+            integration_name,
+            action,
+            marketplace_tools.build_script_params(action, arguments),
+            targets,
+            max_concurrency,
+            max_per_second,
+        )
@@ -13,11 +13,20 @@
 # limitations under the License.
 """Bindings for the SOAR client."""
 
+import asyncio
+import inspect
 import os
+from typing import Awaitable, FrozenSet, Iterable, Optional, Union
 
 import dotenv
 from logger_utils import get_logger
-from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.action_coalescing import ActionCoalescer
+from secops_soar_mcp.action_result_cache import ActionResultCache, parse_ttls
+from secops_soar_mcp.case_mirror import CaseMirror
+from secops_soar_mcp.http_client import HttpClient, HttpClientConfig
+from secops_soar_mcp.instance_cache import IntegrationInstanceCache
+from secops_soar_mcp.instance_selection import InstanceSelector
+from secops_soar_mcp.job_tracker import JobTracker
 from secops_soar_mcp.utils import consts
 
 dotenv.load_dotenv()
@@ -26,27 +35,180 @@ logger = get_logger(__name__)
 
 
 http_client: HttpClient = None
-valid_scopes = set()
+instance_cache: IntegrationInstanceCache = None
+instance_selector: InstanceSelector = None
+action_result_cache: Optional[ActionResultCache] = None
+action_coalescer: Optional[ActionCoalescer] = None
+job_tracker: JobTracker = None
+case_mirror: Optional[CaseMirror] = None
+# Replaced as a whole on every refresh, never modified, so that tools check
+# scopes with a plain set lookup.
+valid_scopes: FrozenSet[str] = frozenset()
+_scope_refresh_task: Optional[asyncio.Task] = None
 
 
-async def _get_valid_scopes():
-    valid_scopes_list = await http_client.get(consts.Endpoints.GET_SCOPES)
+async def _get_valid_scopes(use_cache: bool = True):
+    valid_scopes_list = await http_client.get(
+        consts.Endpoints.GET_SCOPES, use_cache=use_cache
+    )
     if valid_scopes_list is None:
         raise RuntimeError(
             "Failed to fetch valid scopes from SOAR, please make sure you have configured the right SOAR credentials. Shutting down..."
         )
-    return set(valid_scopes_list)
+    return frozenset(valid_scopes_list)
+
+
+async def _refresh_scopes_forever(interval: float):
+    """Fetches the valid scopes again every `interval` seconds.
+
+    The previous scopes are kept if SOAR cannot be reached. The response
+    cache is bypassed, as it would otherwise hold the scopes for longer.
+    """
+    global valid_scopes
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            scopes = await _get_valid_scopes(use_cache=False)
+        except Exception as e:
+            logger.warning("Failed to refresh the valid scopes: %s", e)
+            continue
+        if scopes != valid_scopes:
+            logger.info("Valid scopes changed: %s", sorted(scopes))
+        valid_scopes = scopes
 
 
-async def bind():
-    """Binds global variables."""
-    global http_client, valid_scopes
+async def _warm_up(
+    integrations: Union[Iterable[str], Awaitable[Iterable[str]], None],
+):
+    if inspect.isawaitable(integrations):
+        integrations = await integrations
+    if integrations:
+        await instance_cache.warm_up(integrations)
+
+
+async def bind(
+    integrations: Union[Iterable[str], Awaitable[Iterable[str]], None] = None,
+    http_client_config: Optional[HttpClientConfig] = None,
+    case_mirror_path: Optional[str] = None,
+    case_mirror_sync_interval: Optional[float] = None,
+    instance_selection_policy: Optional[str] = None,
+    enable_action_result_cache: Optional[bool] = None,
+    enable_action_coalescing: Optional[bool] = None,
+):
+    """Binds global variables.
+
+    Args:
+        integrations: SOAR identifiers of the enabled integrations whose
+            instances should be cached up front, or an awaitable of them, such
+            as the registration of their tools, which then runs while the
+            valid scopes are fetched.
+        http_client_config: Settings of the HTTP client. Defaults to the
+            settings from the environment.
+        case_mirror_path: The SQLite database of the case mirror. Defaults to
+            the environment; the mirror is disabled if neither is set.
+        case_mirror_sync_interval: Seconds between two syncs of the case
+            mirror. Defaults to the environment, then to the built-in default.
+        instance_selection_policy: How to choose the integration instance an
+            action runs on. Defaults to the environment, then to "first".
+        enable_action_result_cache: Whether to cache the results of
+            enrichment actions. Defaults to the environment.
+        enable_action_coalescing: Whether to merge concurrent executions of
+            read-only actions on entities of the same case. Defaults to the
+            environment.
+    """
+    global http_client, instance_cache, instance_selector, action_result_cache
+    global action_coalescer
+    global job_tracker, case_mirror, valid_scopes, _scope_refresh_task
     http_client = HttpClient(
-        os.getenv(consts.ENV_SOAR_URL), os.getenv(consts.ENV_SOAR_APP_KEY)
+        os.getenv(consts.ENV_SOAR_URL),
+        os.getenv(consts.ENV_SOAR_APP_KEY),
+        http_client_config or HttpClientConfig.from_env(),
+    )
+    instance_cache = IntegrationInstanceCache(
+        http_client,
+        float(
+            os.getenv(
+                consts.ENV_SOAR_INSTANCE_CACHE_TTL_SECONDS,
+                consts.DEFAULT_INSTANCE_CACHE_TTL_SECONDS,
+            )
+        ),
     )
-    valid_scopes = await _get_valid_scopes()
+    instance_selector = InstanceSelector(
+        instance_selection_policy
+        or os.getenv(
+            consts.ENV_SOAR_INSTANCE_SELECTION_POLICY,
+            consts.DEFAULT_INSTANCE_SELECTION_POLICY,
+        ),
+        consts.INSTANCE_FAILURE_COOLDOWN_SECONDS,
+    )
+    if enable_action_result_cache is None:
+        enable_action_result_cache = os.getenv(
+            consts.ENV_SOAR_ACTION_RESULT_CACHE, ""
+        ).lower() in ("1", "true", "yes")
+    if enable_action_result_cache:
+        action_result_cache = ActionResultCache(
+            float(
+                os.getenv(
+                    consts.ENV_SOAR_ACTION_RESULT_CACHE_TTL_SECONDS,
+                    consts.DEFAULT_ACTION_RESULT_CACHE_TTL_SECONDS,
+                )
+            ),
+            parse_ttls(os.getenv(consts.ENV_SOAR_ACTION_RESULT_CACHE_TTLS)),
+            consts.ACTION_RESULT_CACHE_SIZE,
+        )
+    if enable_action_coalescing is None:
+        enable_action_coalescing = os.getenv(
+            consts.ENV_SOAR_ACTION_COALESCING, ""
+        ).lower() in ("1", "true", "yes")
+    if enable_action_coalescing:
+        action_coalescer = ActionCoalescer(
+            float(
+                os.getenv(
+                    consts.ENV_SOAR_ACTION_COALESCING_WINDOW_SECONDS,
+                    consts.DEFAULT_ACTION_COALESCING_WINDOW_SECONDS,
+                )
+            ),
+            consts.ACTION_COALESCING_MAX_ENTITIES,
+        )
+    job_tracker = JobTracker(consts.MAX_FINISHED_JOBS)
+    valid_scopes, _ = await asyncio.gather(
+        _get_valid_scopes(), _warm_up(integrations)
+    )
+    scope_refresh_interval = float(
+        os.getenv(
+            consts.ENV_SOAR_SCOPE_REFRESH_INTERVAL_SECONDS,
+            consts.DEFAULT_SCOPE_REFRESH_INTERVAL_SECONDS,
+        )
+    )
+    if scope_refresh_interval > 0:
+        _scope_refresh_task = asyncio.ensure_future(
+            _refresh_scopes_forever(scope_refresh_interval)
+        )
+    case_mirror_path = case_mirror_path or os.getenv(consts.ENV_SOAR_CASE_MIRROR_PATH)
+    if case_mirror_path:
+        case_mirror = CaseMirror(
+            http_client,
+            case_mirror_path,
+            case_mirror_sync_interval
+            or float(
+                os.getenv(
+                    consts.ENV_SOAR_CASE_MIRROR_SYNC_INTERVAL_SECONDS,
+                    consts.DEFAULT_CASE_MIRROR_SYNC_INTERVAL_SECONDS,
+                )
+            ),
+        )
+        case_mirror.start()
 
 
 async def cleanup():
     """Cleans up global variables."""
-    await http_client.close()
+    if _scope_refresh_task is not None:
+        _scope_refresh_task.cancel()
+        await asyncio.gather(_scope_refresh_task, return_exceptions=True)
+    if job_tracker is not None:
+        await job_tracker.close()
+    if case_mirror is not None:
+        await case_mirror.close()
+    # The client is not created if the settings were invalid.
+    if http_client is not None:
+        await http_client.close()
@@ -0,0 +1,201 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fetching and condensing the details of many cases at once."""
+
+import asyncio
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp import bindings
+from secops_soar_mcp.pagination import collect_pages, find_items_field
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+# Fields kept in a digest, when the SOAR API returns them.
+CASE_DIGEST_FIELDS = (
+    "id",
+    "displayName",
+    "title",
+    "name",
+    "priority",
+    "status",
+    "stage",
+    "assignee",
+    "assignedUser",
+    "environment",
+    "tags",
+    "createTime",
+    "creationTime",
+    "updateTime",
+    "modificationTime",
+)
+ALERT_DIGEST_FIELDS = (
+    "id",
+    "identifier",
+    "displayName",
+    "name",
+    "severity",
+    "priority",
+    "product",
+    "ruleGenerator",
+    "alertGroupIdentifier",
+    "createTime",
+)
+COMMENT_TEXT_FIELDS = ("comment", "text", "Comment")
+COMMENT_TIME_FIELDS = ("createTime", "creationTime", "timestamp")
+MAX_DIGEST_ALERTS = 20
+MAX_COMMENT_CHARS = 280
+
+
+async def fetch_case_details(case_id: str) -> Tuple[Any, Any, Any]:
+    """Fetches a case, its alerts and its comments concurrently.
+
+    Returns:
+        The raw case, alerts and comments responses; each is None if its
+        request failed.
+    """
+    case_coro = bindings.http_client.get(
+        Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id)
+    )
+    case_alerts_coro = bindings.http_client.get(
+        Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
+    )
+    case_comments_coro = bindings.http_client.get(
+        Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)
+    )
+    results = await asyncio.gather(case_coro, case_alerts_coro, case_comments_coro)
+    return results[0], results[1], results[2]
+
+
+def _pick(obj: Any, fields: Iterable[str]) -> Dict[str, Any]:
+    if not isinstance(obj, dict):
+        return {}
+    return {field: obj[field] for field in fields if obj.get(field) is not None}
+
+
+def _items(response: Any) -> List[Any]:
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        items_field = find_items_field(response)
+        if items_field is not None:
+            return response[items_field]
+    return []
+
+
+def _first(obj: Dict[str, Any], fields: Iterable[str]) -> Any:
+    for field in fields:
+        if obj.get(field) is not None:
+            return obj[field]
+    return None
+
+
+def build_case_digest(
+    case_id: str, case: Any, alerts: Any, comments: Any
+) -> Dict[str, Any]:
+    """Condenses a case, its alerts and its comments into a short summary."""
+    digest = {"case_id": case_id, **_pick(case, CASE_DIGEST_FIELDS)}
+    errors = [
+        f"Failed to fetch case {name}."
+        for name, response in (
+            ("details", case),
+            ("alerts", alerts),
+            ("comments", comments),
+        )
+        if response is None
+    ]
+
+    alert_items = _items(alerts)
+    digest["alert_count"] = len(alert_items)
+    digest["alerts"] = [
+        _pick(alert, ALERT_DIGEST_FIELDS)
+        for alert in alert_items[:MAX_DIGEST_ALERTS]
+    ]
+    if isinstance(alerts, dict) and alerts.get("nextPageToken"):
+        digest["more_alerts"] = True
+
+    comment_items = [item for item in _items(comments) if isinstance(item, dict)]
+    digest["comment_count"] = len(comment_items)
+    if comment_items:
+        latest = max(
+            comment_items,
+            key=lambda item: str(_first(item, COMMENT_TIME_FIELDS) or ""),
+        )
+        text = str(_first(latest, COMMENT_TEXT_FIELDS) or "")
+        digest["latest_comment"] = text[:MAX_COMMENT_CHARS]
+    if errors:
+        digest["errors"] = errors
+    return digest
+
+
+async def digest_cases(case_ids: List[str], max_concurrency: int) -> Dict[str, Any]:
+    """Builds the digests of many cases, fetching a bounded number at a time.
+
+    A case whose requests fail gets a digest listing the errors, and does not
+    affect the other cases.
+
+    Returns:
+        A dict with the digests in the order of `case_ids` under "digests",
+        plus "case_count" and the IDs of the cases that could not be fetched
+        at all under "failed_case_ids".
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def digest_case(case_id: str) -> Tuple[Dict[str, Any], bool]:
+        async with semaphore:
+            case, alerts, comments = await fetch_case_details(case_id)
+        failed = case is None and alerts is None and comments is None
+        return build_case_digest(case_id, case, alerts, comments), failed
+
+    results = await asyncio.gather(
+        *(digest_case(case_id) for case_id in case_ids), return_exceptions=True
+    )
+    digests = []
+    failed_case_ids = []
+    for case_id, result in zip(case_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Failed to build the digest of case %s: %s", case_id, result
+            )
+            result = {"case_id": case_id, "errors": [str(result)]}, True
+        digest, failed = result
+        if failed:
+            failed_case_ids.append(case_id)
+        digests.append(digest)
+    return {
+        "case_count": len(case_ids),
+        "failed_case_ids": failed_case_ids,
+        "digests": digests,
+    }
+
+
+async def list_case_ids(case_filter: Optional[str], max_cases: int) -> List[str]:
+    """Lists the IDs of up to `max_cases` cases matching an OData filter."""
+
+    async def fetch(page_token: Optional[str]):
+        params = {}
+        if case_filter:
+            params["$filter"] = case_filter
+        if page_token:
+            params["pageToken"] = page_token
+        return await bindings.http_client.get(
+            Endpoints.BASE_CASE_URL, params=params or None
+        )
+
+    cases = await collect_pages(fetch, None, max_cases, sys.maxsize)
+    if cases is None:
+        raise RuntimeError("Failed to list cases.")
+    return [str(case["id"]) for case in _items(cases) if case.get("id") is not None]
@@ -0,0 +1,257 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collecting the entities of a case, with their details."""
+
+import asyncio
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.pagination import collect_pages, find_items_field
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+ENTITY_IDENTIFIER_FIELDS = ("identifier", "Identifier", "entityIdentifier")
+ENTITY_TYPE_FIELDS = ("entityType", "EntityType", "type")
+ENTITY_ENVIRONMENT_FIELDS = ("environment", "Environment", "entityEnvironment")
+# Flags of an entity's details kept in the entity table.
+ENTITY_FLAGS = (
+    "isSuspicious",
+    "isInternal",
+    "isArtifact",
+    "isEnriched",
+    "isVulnerable",
+    "isPivot",
+)
+ENTITY_TABLE_COLUMNS = (
+    "identifier",
+    "type",
+    "environment",
+    "alert_groups",
+    *ENTITY_FLAGS,
+)
+
+
+def _first(obj: Dict[str, Any], fields: Tuple[str, ...]) -> Any:
+    for field in fields:
+        if obj.get(field) is not None:
+            return obj[field]
+    return None
+
+
+def find_entities(response: Any) -> List[Dict[str, Any]]:
+    """Collects the entities found anywhere in a SOAR response.
+
+    Returns:
+        One dict per entity occurrence, with its "identifier", "type",
+        "environment" (None if absent) and the "alert_group" it was listed
+        under (None if unknown).
+    """
+    entities = []
+    stack: List[Tuple[Any, Optional[str]]] = [(response, None)]
+    while stack:
+        value, alert_group = stack.pop()
+        # Items are pushed in reverse so that entities come out in order.
+        if isinstance(value, list):
+            stack.extend((item, alert_group) for item in reversed(value))
+        elif isinstance(value, dict):
+            alert_group = value.get("alertGroupIdentifier") or alert_group
+            identifier = _first(value, ENTITY_IDENTIFIER_FIELDS)
+            entity_type = _first(value, ENTITY_TYPE_FIELDS)
+            if isinstance(identifier, str) and entity_type is not None:
+                environment = _first(value, ENTITY_ENVIRONMENT_FIELDS)
+                entities.append(
+                    {
+                        "identifier": identifier,
+                        "type": str(entity_type),
+                        "environment": environment,
+                        "alert_group": alert_group,
+                    }
+                )
+            else:
+                stack.extend(
+                    (item, alert_group) for item in reversed(list(value.values()))
+                )
+    return entities
+
+
+def _items(response: Any) -> List[Any]:
+    if isinstance(response, dict):
+        items_field = find_items_field(response)
+        return response[items_field] if items_field is not None else []
+    return response if isinstance(response, list) else []
+
+
+async def list_alert_group_identifiers(
+    http_client: HttpClient, case_id: str
+) -> Optional[List[str]]:
+    """Lists the alert group identifiers of a case, or None on failure."""
+
+    async def fetch(page_token: Optional[str]):
+        return await http_client.get(
+            Endpoints.LIST_ALERT_GROUP_IDENTIFIERS_BY_CASE.format(CASE_ID=case_id),
+            params={"pageToken": page_token} if page_token else None,
+        )
+
+    page = await collect_pages(fetch, None, sys.maxsize, sys.maxsize)
+    if page is None or page.get("error"):
+        return None
+    identifiers = []
+    for item in _items(page):
+        identifier = item.get("alertGroupIdentifier") if isinstance(item, dict) else item
+        if isinstance(identifier, str) and identifier not in identifiers:
+            identifiers.append(identifier)
+    return identifiers
+
+
+def _dedupe(
+    entities: List[Dict[str, Any]], default_environment: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Merges the occurrences of an entity across alert groups."""
+    unique: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+    for entity in entities:
+        environment = entity["environment"] or default_environment
+        key = (entity["identifier"].lower(), entity["type"].lower(), environment)
+        merged = unique.setdefault(
+            key,
+            {
+                "identifier": entity["identifier"],
+                "type": entity["type"],
+                "environment": environment,
+                "alert_groups": [],
+            },
+        )
+        if entity["alert_group"] and entity["alert_group"] not in merged["alert_groups"]:
+            merged["alert_groups"].append(entity["alert_group"])
+    return list(unique.values())
+
+
+def _flags(details: Any) -> Dict[str, Any]:
+    if not isinstance(details, dict):
+        return {}
+    sources = [details]
+    if isinstance(details.get("entity"), dict):
+        sources.insert(0, details["entity"])
+    flags = {}
+    for flag in ENTITY_FLAGS:
+        for source in sources:
+            if source.get(flag) is not None:
+                flags[flag] = source[flag]
+                break
+    return flags
+
+
+async def fetch_entity_details(
+    http_client: HttpClient, entity: Dict[str, Any]
+) -> Any:
+    """Fetches the details SOAR holds about an entity, or None on failure."""
+    return await http_client.post(
+        Endpoints.FETCH_FULL_UNIQUE_ENTITY,
+        req={
+            "EntityIdentifier": entity["identifier"],
+            "EntityType": entity["type"],
+            "EntityEnvironment": entity["environment"],
+            "LastCaseType": 0,
+            "CaseDistributionType": 0,
+        },
+        retry_safe=True,
+    )
+
+
+async def collect_case_entities(
+    http_client: HttpClient,
+    case_id: str,
+    max_concurrency: int,
+    include_details: bool,
+) -> Dict[str, Any]:
+    """Lists the unique entities of a case, with the details of each.
+
+    Lists the case's alert groups, fetches their entities in one request,
+    merges the entities listed under several alert groups, then fetches the
+    details of every unique entity, at most `max_concurrency` at a time.
+
+    Returns:
+        A dict with the "case_id", "entity_count", and an entity table with
+        the names of its "columns" and one row per entity under "rows". The
+        raw entity details are added under "details", in the order of the
+        rows, if `include_details` is set. The identifiers of entities whose
+        details could not be fetched are listed under "failed_entities".
+
+    Raises:
+        RuntimeError: If the alert groups or entities could not be fetched.
+    """
+    case, alert_group_identifiers = await asyncio.gather(
+        http_client.get(Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id)),
+        list_alert_group_identifiers(http_client, case_id),
+    )
+    if alert_group_identifiers is None:
+        raise RuntimeError(f"Failed to list the alert groups of case {case_id}.")
+    entities: List[Dict[str, Any]] = []
+    if alert_group_identifiers:
+        response = await http_client.post(
+            Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES,
+            req={"caseId": case_id, "alertGroupIdentifiers": alert_group_identifiers},
+            retry_safe=True,
+        )
+        if response is None:
+            raise RuntimeError(f"Failed to fetch the entities of case {case_id}.")
+        default_environment = case.get("environment") if isinstance(case, dict) else None
+        entities = _dedupe(find_entities(response), default_environment)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(entity: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await fetch_entity_details(http_client, entity)
+
+    details = await asyncio.gather(
+        *(fetch(entity) for entity in entities), return_exceptions=True
+    )
+    rows = []
+    failed = []
+    for entity, entity_details in zip(entities, details):
+        if isinstance(entity_details, Exception) or entity_details is None:
+            logger.warning(
+                "Failed to fetch the details of entity %s: %s",
+                entity["identifier"],
+                entity_details,
+            )
+            failed.append(entity["identifier"])
+            entity_details = None
+        flags = _flags(entity_details)
+        rows.append(
+            [
+                entity["identifier"],
+                entity["type"],
+                entity["environment"],
+                entity["alert_groups"],
+                *(flags.get(flag) for flag in ENTITY_FLAGS),
+            ]
+        )
+    result = {
+        "case_id": case_id,
+        "entity_count": len(rows),
+        "columns": list(ENTITY_TABLE_COLUMNS),
+        "rows": rows,
+    }
+    if include_details:
+        result["details"] = [
+            None if isinstance(entity_details, Exception) else entity_details
+            for entity_details in details
+        ]
+    if failed:
+        result["failed_entities"] = failed
+    return result
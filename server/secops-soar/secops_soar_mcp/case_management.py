@@ -11,18 +11,60 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import asyncio
 from secops_soar_mcp import bindings
 from mcp.server.fastmcp import FastMCP
+from secops_soar_mcp.case_entities import collect_case_entities
+from secops_soar_mcp.case_ranking import rank_cases, resolve_weights
+from secops_soar_mcp.case_timeline import build_case_timeline
+from secops_soar_mcp.case_digest import (
+    digest_cases,
+    fetch_case_details,
+    list_case_ids,
+)
+from secops_soar_mcp.pagination import collect_pages, fetch_page
+from secops_soar_mcp.projection import project_pages
+from secops_soar_mcp.utils import consts
 from secops_soar_mcp.utils.consts import Endpoints
 from secops_soar_mcp.utils.models import CasePriority
 from logger_utils import get_logger
-from typing import Annotated, Optional, List
+from typing import Annotated, Dict, Optional, List
 from pydantic import Field
 from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
 
 logger = get_logger(__name__)
 
+AutoPaginate = Annotated[
+    bool,
+    Field(
+        default=False,
+        description="Fetch consecutive pages and merge their items into one result, within max_items and max_bytes.",
+    ),
+]
+MaxItems = Annotated[
+    int,
+    Field(
+        default=consts.DEFAULT_PAGINATION_MAX_ITEMS,
+        ge=1,
+        description="With auto_paginate, the maximum number of items to return.",
+    ),
+]
+MaxBytes = Annotated[
+    int,
+    Field(
+        default=consts.DEFAULT_PAGINATION_MAX_BYTES,
+        ge=1,
+        description="With auto_paginate, the maximum size in bytes of the returned items, as JSON.",
+    ),
+]
+
+ResponseFields = Annotated[
+    Optional[List[str]],
+    Field(
+        default=None,
+        description='Only return these fields of each item, matched ignoring case (e.g. ["id", "displayName", "priority"]). Nested fields use dots (e.g. "tags.displayName"). Defaults to all fields.',
+    ),
+]
+
 
 def register_tools(mcp: FastMCP):
     @mcp.tool()
@@ -34,6 +76,10 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        auto_paginate: AutoPaginate,
+        max_items: MaxItems,
+        max_bytes: MaxBytes,
+        fields: ResponseFields,
     ) -> dict:
         """List cases available in the Security Orchestration, Automation, and Response (SOAR) platform.
 
@@ -47,9 +93,16 @@ def register_tools(mcp: FastMCP):
             dict: A dictionary representing the raw API response from the SOAR platform,
                   usually containing a list of case objects with their summary details (e.g., ID, name, status, priority).
                   **Important Triage Note:** Case priority is only an initial indicator. True importance must be assessed by examining the full context (alerts, entities, potential impact, threat intelligence) using tools like `get_case_full_details`.
+                  With `auto_paginate`, the cases of consecutive pages are merged into one list,
+                  along with `pagesFetched`, `truncated` (True if `max_items` or `max_bytes` stopped
+                  the walk) and a `nextPageToken` to resume from, which is null after the last page.
+                  With `fields`, each case only holds the given fields.
 
         **Workflow Integration:**
         - Often the FIRST step in a triage workflow to understand the current incident queue within the SOAR platform.
+        - Use `auto_paginate` to review the whole queue in one call instead of paging through it.
+        - Use `fields` (e.g. ["id", "displayName", "priority", "status"]) to keep the response small when
+          only an overview of many cases is needed.
         - Use the output as a STARTING point, not an end, for cases needing attention.
 
         **Next Steps (using MCP-enabled tools):**
@@ -59,12 +112,21 @@ def register_tools(mcp: FastMCP):
         - Use a tool to change the case priority if initial assessment suggests it's warranted (like `change_case_priority`).
         - Begin enrichment by extracting key indicators from the case summary and using appropriate SIEM, TI, or other security tool MCP integrations.
         """
-        if next_page_token:
-            return await bindings.http_client.get(
-                Endpoints.BASE_CASE_URL,
-                params={"$expand": "tags", "pageToken": next_page_token},
+
+        async def fetch(page_token: Optional[str]):
+            if page_token:
+                return await bindings.http_client.get(
+                    Endpoints.BASE_CASE_URL,
+                    params={"$expand": "tags", "pageToken": page_token},
+                )
+            return await bindings.http_client.get(Endpoints.BASE_CASE_URL)
+
+        fetch_projected = project_pages(fetch, fields)
+        if auto_paginate:
+            return await collect_pages(
+                fetch_projected, next_page_token, max_items, max_bytes
             )
-        return await bindings.http_client.get(Endpoints.BASE_CASE_URL)
+        return await fetch_page(fetch_projected, next_page_token)
 
     @mcp.tool()
     async def post_case_comment(
@@ -115,6 +177,10 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        auto_paginate: AutoPaginate,
+        max_items: MaxItems,
+        max_bytes: MaxBytes,
+        fields: ResponseFields,
     ) -> dict:
         """List the security alerts associated with a specific case ID in the SOAR platform.
 
@@ -133,6 +199,9 @@ def register_tools(mcp: FastMCP):
                   like alert name, source, severity, and timestamp. Alert severity provides
                   initial guidance, but the actual risk depends on the context and evidence
                   within the associated events.
+                  With `auto_paginate`, the alerts of consecutive pages are merged into one list,
+                  along with `pagesFetched`, `truncated` and a `nextPageToken` to resume from.
+                  With `fields`, each alert only holds the given fields.
 
         **Workflow Integration:**
         - Use after identifying a case of interest (e.g., via `list_cases` or `get_case_full_details`).
@@ -146,14 +215,23 @@ def register_tools(mcp: FastMCP):
         - Extract indicators from alert details and use SIEM entity lookup or event search tools for enrichment.
         - Correlate alert details with findings from other security tools (EDR, Network, Cloud, TI) via their MCP tools.
         """
-        if next_page_token:
+
+        async def fetch(page_token: Optional[str]):
+            if page_token:
+                return await bindings.http_client.get(
+                    Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id),
+                    params={"pageToken": page_token},
+                )
             return await bindings.http_client.get(
-                Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id),
-                params={"pageToken": next_page_token},
+                Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
             )
-        return await bindings.http_client.get(
-            Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
-        )
+
+        fetch_projected = project_pages(fetch, fields)
+        if auto_paginate:
+            return await collect_pages(
+                fetch_projected, next_page_token, max_items, max_bytes
+            )
+        return await fetch_page(fetch_projected, next_page_token)
 
     @mcp.tool()
     async def list_alert_group_identifiers_by_case(
@@ -214,6 +292,10 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        auto_paginate: AutoPaginate,
+        max_items: MaxItems,
+        max_bytes: MaxBytes,
+        fields: ResponseFields,
     ):
         """List the underlying security events associated with a specific alert within a given case.
 
@@ -231,6 +313,9 @@ def register_tools(mcp: FastMCP):
             dict: A dictionary representing the raw API response from the SOAR platform,
                   typically containing a list of event objects (potentially in UDM format)
                   related to the specified alert.
+                  With `auto_paginate`, the events of consecutive pages are merged into one list,
+                  along with `pagesFetched`, `truncated` and a `nextPageToken` to resume from.
+                  With `fields`, each event only holds the given fields.
 
         **Workflow Integration:**
         - Use after identifying a specific alert of interest within a SOAR case (e.g., via `list_alerts_by_case`).
@@ -245,18 +330,86 @@ def register_tools(mcp: FastMCP):
         - Correlate event details with other related events using SIEM event search tools.
         - Document findings in the relevant case management system using a commenting tool.
         """
-        if next_page_token:
+
+        async def fetch(page_token: Optional[str]):
+            if page_token:
+                return await bindings.http_client.get(
+                    Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
+                        CASE_ID=case_id, ALERT_ID=alert_id
+                    ),
+                    params={"pageToken": page_token},
+                )
             return await bindings.http_client.get(
                 Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
                     CASE_ID=case_id, ALERT_ID=alert_id
-                ),
-                params={"pageToken": next_page_token},
+                )
             )
-        return await bindings.http_client.get(
-            Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
-                CASE_ID=case_id, ALERT_ID=alert_id
+
+        fetch_projected = project_pages(fetch, fields)
+        if auto_paginate:
+            return await collect_pages(
+                fetch_projected, next_page_token, max_items, max_bytes
             )
-        )
+        return await fetch_page(fetch_projected, next_page_token)
+
+    @mcp.tool()
+    async def get_case_timeline(
+        case_id: Annotated[str, Field(..., description="The ID of the case.")],
+        fields: ResponseFields,
+        max_events: Annotated[
+            int,
+            Field(
+                default=consts.DEFAULT_PAGINATION_MAX_ITEMS,
+                ge=1,
+                description="The maximum number of events to return, earliest first.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=10,
+                ge=1,
+                le=50,
+                description="Maximum number of alerts whose events are fetched at the same time.",
+            ),
+        ],
+    ) -> dict:
+        """Reconstruct the timeline of a case from the events of all its alerts.
+
+        Lists the alerts of the case, then fetches the involved events of every alert concurrently,
+        paging each alert to completion, instead of calling `list_events_by_alert` once per alert
+        and page. Events shared by several alerts appear once, and all events are sorted by time
+        into a single timeline.
+
+        Args:
+            case_id (str): The unique identifier (ID) of the case. (Example: "523")
+            fields (Optional[List[str]]): Only return these fields of each event (e.g.
+                                          ["id", "eventTime", "metadata.eventType"]).
+            max_events (int): The maximum number of events returned, earliest first.
+            max_concurrency (int): How many alerts are fetched concurrently.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'events': The unique events of the case's alerts, earliest first, each with the
+                    IDs of the alerts involving it under 'alertIds'. Events without a time come last.
+                  - 'event_count': The number of unique events, and 'truncated' (True if more than
+                    `max_events`).
+                  - 'alert_count', and 'failed_alert_ids': alerts whose events could not all be
+                    fetched; the timeline may miss some of their events.
+                  If the alerts of the case cannot be listed, a dictionary with a "Failed" Status
+                  and a Message.
+
+        **Workflow Integration:**
+        - Use to understand the sequence of activity behind a case, e.g. initial access, execution
+          and lateral movement, across all its alerts at once.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Extract indicators from the events and enrich them with entity lookup or threat
+          intelligence tools.
+        - Use SIEM event search tools to look for related activity before or after the timeline.
+        - Document the reconstructed sequence of events with `post_case_comment`.
+        """
+        return await build_case_timeline(case_id, fields, max_events, max_concurrency)
 
     @mcp.tool()
     async def change_case_priority(
@@ -354,6 +507,7 @@ def register_tools(mcp: FastMCP):
         return await bindings.http_client.post(
             Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES,
             req={"caseId": case_id, "alertGroupIdentifiers": alert_group_identifiers},
+            retry_safe=True,
         )
 
     @mcp.tool()
@@ -407,8 +561,71 @@ def register_tools(mcp: FastMCP):
                 "LastCaseType": 0,
                 "CaseDistributionType": 0,
             },
+            retry_safe=True,
         )
 
+    @mcp.tool()
+    async def get_case_entities(
+        case_id: Annotated[str, Field(..., description="The ID of the case.")],
+        include_details: Annotated[
+            bool,
+            Field(
+                default=False,
+                description="Also return the full SOAR details of every entity, not just the entity table.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=10,
+                ge=1,
+                le=50,
+                description="Maximum number of entity details fetched at the same time.",
+            ),
+        ],
+    ) -> dict:
+        """Get every entity involved in a case, with its details, in a single call.
+
+        Runs the whole entity lookup of a case on the server: lists the case's alert groups, fetches
+        the entities of all of them, merges entities that appear in several alert groups, and fetches
+        the details of each unique entity concurrently. This replaces calling
+        `list_alert_group_identifiers_by_case`, `get_entities_by_alert_group_identifiers` and then
+        `get_entity_details` once per entity.
+
+        Args:
+            case_id (str): The unique identifier (ID) of the case. (Example: "523")
+            include_details (bool): Whether to also return the raw SOAR details of every entity.
+            max_concurrency (int): How many entity details are fetched concurrently.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'case_id' and 'entity_count'.
+                  - 'columns' and 'rows': A compact entity table with one row per unique entity: its
+                    identifier, type, environment, the alert groups it appears in, and the
+                    isSuspicious, isInternal, isArtifact, isEnriched, isVulnerable and isPivot flags
+                    from its details (null when unknown).
+                  - 'details': With `include_details`, the raw details of each entity, in row order.
+                  - 'failed_entities': Identifiers of entities whose details could not be fetched.
+                  If the alert groups or entities cannot be fetched, a dictionary with a "Failed"
+                  Status and a Message.
+
+        **Workflow Integration:**
+        - Use at the start of an investigation to get the full entity picture of a case in one step.
+        - The identifiers and types in the table can be passed as `target_entities` to integration
+          actions.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Prioritize suspicious, non-internal entities for enrichment with SIEM (`lookup_entity`),
+          threat intelligence or integration enrichment actions.
+        - Use `get_entity_details` to refresh a single entity's details later in the investigation.
+        """
+        try:
+            return await collect_case_entities(
+                bindings.http_client, case_id, max_concurrency, include_details
+            )
+        except RuntimeError as e:
+            return {"Status": "Failed", "Message": str(e)}
+
     @mcp.tool()
     async def search_entity(
         term: Annotated[
@@ -507,6 +724,7 @@ def register_tools(mcp: FastMCP):
                 "NetworkName": network_name,
                 "EnvironmentName": environment_name,
             },
+            retry_safe=True,
         )
 
     @mcp.tool()
@@ -546,18 +764,187 @@ def register_tools(mcp: FastMCP):
         - Document investigation progress using a case commenting tool.
         - Consider adjusting case priority using a priority management tool based on findings.
         """
-        case_coro = bindings.http_client.get(
-            Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id)
-        )
-        case_alerts_coro = bindings.http_client.get(
-            Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
-        )
-        case_comments_coro = bindings.http_client.get(
-            Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)
-        )
-        results = await asyncio.gather(case_coro, case_alerts_coro, case_comments_coro)
+        results = await fetch_case_details(case_id)
         return {
             "case_details:": results[0],
             "case_alerts": results[1],
             "case_comments": results[2],
         }
+
+    @mcp.tool()
+    async def get_cases_digest(
+        case_ids: Annotated[
+            Optional[List[str]],
+            Field(
+                default=None,
+                description="IDs of the cases to summarize. If omitted, cases are listed using case_filter.",
+            ),
+        ],
+        case_filter: Annotated[
+            Optional[str],
+            Field(
+                default=None,
+                description="OData filter selecting the cases to summarize when case_ids is omitted (e.g. \"status eq 'Opened'\"). If omitted, the most recent cases are summarized.",
+            ),
+        ],
+        max_cases: Annotated[
+            int,
+            Field(
+                default=100,
+                ge=1,
+                description="Maximum number of cases to summarize when case_ids is omitted.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=10,
+                ge=1,
+                le=50,
+                description="Maximum number of cases fetched at the same time.",
+            ),
+        ],
+    ) -> dict:
+        """Summarize many cases at once for queue-wide triage.
+
+        For every case, fetches the same data as `get_case_full_details` (case details, alerts and
+        comments), a bounded number of cases at a time, and condenses it into a short digest. A case
+        whose data cannot be fetched is reported with its errors without failing the other cases.
+
+        Args:
+            case_ids (Optional[List[str]]): The cases to summarize. (Example: ["523", "524"])
+            case_filter (Optional[str]): When `case_ids` is omitted, an OData filter applied to the
+                                         case list to select the cases to summarize.
+            max_cases (int): When `case_ids` is omitted, the maximum number of listed cases to summarize.
+            max_concurrency (int): How many cases are fetched concurrently.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'case_count': The number of cases summarized.
+                  - 'failed_case_ids': Cases for which no data could be fetched.
+                  - 'digests': One digest per case, in order, with the case's key fields (e.g. name,
+                    priority, status, stage, assignee), 'alert_count', up to 20 condensed 'alerts',
+                    'comment_count', the 'latest_comment' (truncated), and 'errors' if any of the
+                    case's requests failed.
+                  **Triage Note:** Digests are condensed; use `get_case_full_details` on the cases that
+                  stand out to see their complete data.
+
+        **Workflow Integration:**
+        - Use for morning triage or queue reviews covering many cases, instead of calling
+          `get_case_full_details` once per case.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Pick the cases that need attention based on their alerts, priority and latest comments.
+        - Use `get_case_full_details`, `list_alerts_by_case` or `list_events_by_alert` to dig into them.
+        - Adjust priorities with `change_case_priority` and document decisions with `post_case_comment`.
+        """
+        if case_ids is None:
+            try:
+                case_ids = await list_case_ids(case_filter, max_cases)
+            except RuntimeError as e:
+                return {"Status": "Failed", "Message": str(e)}
+        return await digest_cases(case_ids, max_concurrency)
+
+    @mcp.tool()
+    async def rank_case_queue(
+        case_filter: Annotated[
+            Optional[str],
+            Field(
+                default=None,
+                description="OData filter selecting the cases to rank. Defaults to the open cases (\"status eq 'Opened'\").",
+            ),
+        ],
+        top_k: Annotated[
+            int,
+            Field(
+                default=20,
+                ge=1,
+                le=500,
+                description="Number of best-ranked cases to return.",
+            ),
+        ],
+        max_cases: Annotated[
+            int,
+            Field(
+                default=5000,
+                ge=1,
+                description="Maximum number of cases to list and score.",
+            ),
+        ],
+        weights: Annotated[
+            Optional[Dict[str, float]],
+            Field(
+                default=None,
+                description="Weights of the score components (priority, alerts, age, tags, suspicious_entities), overriding the defaults, e.g. {\"age\": 2, \"tags\": 0}.",
+            ),
+        ],
+        tag_weights: Annotated[
+            Optional[Dict[str, float]],
+            Field(
+                default=None,
+                description="Score of each case tag, matched ignoring case, e.g. {\"VIP\": 1, \"False Positive\": -2}.",
+            ),
+        ],
+        score_entities: Annotated[
+            bool,
+            Field(
+                default=False,
+                description="Also count the suspicious entities of the best candidates, which fetches their entities.",
+            ),
+        ],
+    ) -> dict:
+        """Rank the case queue by a configurable triage score and return the top cases.
+
+        Lists the cases (by default the open ones) and scores all of them locally, instead of
+        re-ranking pages of `list_cases` output by reading them. Each score is a weighted sum of
+        components scaled to [0, 1]: the case `priority`, its number of `alerts` (log scale), its
+        `age` (saturating after 72 hours), and `tags`, the sum of `tag_weights` of its tags. With
+        `score_entities`, the suspicious entities of the best candidates by the other components
+        are counted as well (`suspicious_entities`), which costs requests per entity of those
+        cases only; the entities of the other cases are not counted.
+
+        Args:
+            case_filter (Optional[str]): An OData filter selecting the cases. Defaults to open cases.
+            top_k (int): How many cases to return.
+            max_cases (int): The maximum number of cases scored.
+            weights (Optional[Dict[str, float]]): Component weights overriding the defaults
+                (priority 3, alerts 2, age 1, tags 1, suspicious_entities 2) and
+                SOAR_CASE_RANKING_WEIGHTS.
+            tag_weights (Optional[Dict[str, float]]): Scores of case tags; negative scores demote.
+            score_entities (bool): Whether to count suspicious entities.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'case_count': The number of cases scored, and 'truncated' (True if more cases
+                    matched than `max_cases`).
+                  - 'weights': The component weights used.
+                  - 'missing_components': Weighted components unknown for every case, e.g.
+                    'suspicious_entities' without `score_entities`.
+                  - 'cases': The `top_k` best cases, best first, with their key fields, 'tags',
+                    'score' and the value of each score component under 'components', null for
+                    components unknown for the case, which add nothing to its score.
+                  If the weights are invalid or the cases cannot be listed, a dictionary with a
+                  "Failed" Status and a Message.
+                  **Triage Note:** The score orders the queue; review the top cases with
+                  `get_case_full_details` before acting on them.
+
+        **Workflow Integration:**
+        - Use at the start of a shift or queue review to decide which cases to work on first.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Summarize the top cases with `get_cases_digest`, or investigate them with
+          `get_case_full_details` and `get_case_timeline`.
+        - Align SOAR priorities with the ranking using `change_case_priority`.
+        """
+        try:
+            resolved_weights = resolve_weights(weights)
+            return await rank_cases(
+                case_filter,
+                top_k,
+                max_cases,
+                resolved_weights,
+                tag_weights or {},
+                score_entities,
+            )
+        except (ValueError, RuntimeError) as e:
+            return {"Status": "Failed", "Message": str(e)}
@@ -0,0 +1,701 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local SQLite mirror of SOAR cases, their alerts, comments and entities."""
+
+import asyncio
+import datetime
+import json
+import sqlite3
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp.case_entities import find_entities
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.pagination import collect_pages, find_items_field
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+# The case field SOAR updates on every change, used to sync incrementally.
+CASE_UPDATE_TIME_FIELD = "updateTime"
+# Cases whose alerts, comments and entities are fetched at the same time.
+SYNC_CONCURRENCY = 5
+
+_PRIORITY_RANKS = {
+    "unspecified": 0,
+    "info": 1,
+    "informative": 1,
+    "low": 2,
+    "medium": 3,
+    "high": 4,
+    "critical": 5,
+}
+
+# Columns of the cases table, and the case fields they are read from.
+_CASE_COLUMNS = {
+    "display_name": ("displayName", "title", "name"),
+    "priority": ("priority",),
+    "status": ("status",),
+    "stage": ("stage",),
+    "assignee": ("assignee", "assignedUser"),
+    "environment": ("environment",),
+    "create_time": ("createTime", "creationTime"),
+    "update_time": (CASE_UPDATE_TIME_FIELD, "modificationTime"),
+}
+# Columns the mirrored cases can be sorted by.
+SORT_COLUMNS = ("update_time", "create_time", "priority", "status", "display_name")
+# Values the mirrored cases can be counted by.
+GROUP_BY_VALUES = (
+    "priority",
+    "status",
+    "stage",
+    "assignee",
+    "environment",
+    "tag",
+    "entity_type",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    case_id TEXT PRIMARY KEY,
+    display_name TEXT,
+    priority TEXT COLLATE NOCASE,
+    priority_rank INTEGER,
+    status TEXT COLLATE NOCASE,
+    stage TEXT COLLATE NOCASE,
+    assignee TEXT COLLATE NOCASE,
+    environment TEXT COLLATE NOCASE,
+    create_time TEXT,
+    update_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_priority ON cases (priority_rank);
+CREATE INDEX IF NOT EXISTS cases_status ON cases (status);
+CREATE INDEX IF NOT EXISTS cases_assignee ON cases (assignee);
+CREATE INDEX IF NOT EXISTS cases_update_time ON cases (update_time);
+CREATE TABLE IF NOT EXISTS case_tags (
+    case_id TEXT NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS case_tags_tag ON case_tags (tag);
+CREATE INDEX IF NOT EXISTS case_tags_case_id ON case_tags (case_id);
+CREATE TABLE IF NOT EXISTS alerts (
+    case_id TEXT NOT NULL,
+    alert_id TEXT,
+    name TEXT,
+    severity TEXT,
+    product TEXT,
+    alert_group_identifier TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS alerts_case_id ON alerts (case_id);
+CREATE TABLE IF NOT EXISTS comments (
+    case_id TEXT NOT NULL,
+    comment_id TEXT,
+    text TEXT,
+    create_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_case_id ON comments (case_id);
+CREATE TABLE IF NOT EXISTS entities (
+    case_id TEXT NOT NULL,
+    identifier TEXT NOT NULL COLLATE NOCASE,
+    entity_type TEXT COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS entities_identifier ON entities (identifier);
+CREATE INDEX IF NOT EXISTS entities_case_id ON entities (case_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+# Full-text index over the case titles, alert names and comments. The indexed
+# rows live in case_text_rows, indexed by case so that a case's rows can be
+# replaced without scanning the full-text index, which triggers keep in sync.
+_TEXT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS case_text_rows (
+    row_id INTEGER PRIMARY KEY,
+    case_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS case_text_rows_case_id ON case_text_rows (case_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS case_text USING fts5(
+    text,
+    content='case_text_rows',
+    content_rowid='row_id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS case_text_rows_insert AFTER INSERT ON case_text_rows
+BEGIN
+    INSERT INTO case_text (rowid, text) VALUES (new.row_id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS case_text_rows_delete AFTER DELETE ON case_text_rows
+BEGIN
+    INSERT INTO case_text (case_text, rowid, text)
+    VALUES ('delete', old.row_id, old.text);
+END;
+"""
+_INDEX_TEXT = """
+INSERT INTO case_text_rows (case_id, field, text)
+SELECT case_id, 'title', display_name FROM cases
+WHERE display_name IS NOT NULL {and_case}
+UNION ALL
+SELECT case_id, 'alert', name FROM alerts WHERE name IS NOT NULL {and_case}
+UNION ALL
+SELECT case_id, 'comment', text FROM comments WHERE text IS NOT NULL {and_case}
+"""
+# Weights of matches in each field when ranking the cases found.
+TEXT_FIELD_WEIGHTS = {"title": 3.0, "alert": 2.0, "comment": 1.0}
+MAX_SNIPPETS_PER_CASE = 3
+
+
+def _first(obj: Dict[str, Any], fields: Iterable[str]) -> Any:
+    for field in fields:
+        if obj.get(field) is not None:
+            return obj[field]
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        value = _first(value, ("displayName", "name", "id"))
+    return None if value is None else str(value)
+
+
+def _items(response: Any) -> List[Dict[str, Any]]:
+    if isinstance(response, dict):
+        items_field = find_items_field(response)
+        response = response[items_field] if items_field is not None else []
+    if not isinstance(response, list):
+        return []
+    return [item for item in response if isinstance(item, dict)]
+
+
+def priority_rank(priority: Optional[str]) -> Optional[int]:
+    """Orders priorities such as "PriorityHigh" or "High" by severity."""
+    if not priority:
+        return None
+    name = priority.lower()
+    if name.startswith("priority"):
+        name = name[len("priority") :]
+    return _PRIORITY_RANKS.get(name.strip(" _"))
+
+
+class CaseMirror:
+    """Keeps a local SQLite copy of the SOAR cases, synced in the background.
+
+    Every sync lists the cases updated since the previous one, then fetches
+    the alerts, comments and entities of the cases whose update time changed,
+    so that the details of unchanged cases are never fetched again. Syncs
+    bypass the response cache: stale details stored under a new update time
+    would never be fixed. Queries run against the local database, with indexes on the columns they
+    filter and sort by. Cases deleted in SOAR stay in the mirror until its
+    database file is removed.
+    """
+
+    def __init__(self, http_client: HttpClient, path: str, sync_interval: float):
+        """Opens the mirror database, creating it if needed.
+
+        Args:
+            http_client: The client of the SOAR API.
+            path: The path of the SQLite database file.
+            sync_interval: Seconds between two syncs.
+        """
+        self._http_client = http_client
+        self._sync_interval = sync_interval
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.executescript(_SCHEMA)
+            self.full_text_search = _create_text_index(self._db)
+        self._sync_task: Optional[asyncio.Task] = None
+        self.last_sync: Optional[Dict[str, Any]] = None
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Runs database work in a thread, so that the event loop keeps going."""
+
+        def locked():
+            with self._lock:
+                return fn(self._db)
+
+        return await asyncio.to_thread(locked)
+
+    def start(self):
+        """Starts syncing in the background."""
+        if self._sync_task is None:
+            self._sync_task = asyncio.ensure_future(self._sync_forever())
+
+    async def _sync_forever(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error("Failed to sync the case mirror: %s", e)
+            await asyncio.sleep(self._sync_interval)
+
+    async def close(self):
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+        await self._run(lambda db: db.close())
+
+    async def _list_cases(self, updated_since: Optional[str]) -> List[Dict[str, Any]]:
+        async def fetch(page_token: Optional[str]):
+            params = {"$expand": "tags"}
+            if updated_since:
+                # Cases updated at the watermark itself are listed again: one
+                # may have been updated in the same tick after the last sync.
+                # Those already synced are skipped by their update time.
+                params["$filter"] = f"{CASE_UPDATE_TIME_FIELD} ge '{updated_since}'"
+            if page_token:
+                params["pageToken"] = page_token
+            return await self._http_client.get(
+                Endpoints.BASE_CASE_URL, params=params, use_cache=False
+            )
+
+        cases = []
+        page_token = None
+        while True:
+            page = await collect_pages(fetch, page_token, sys.maxsize, sys.maxsize)
+            if page is None or page.get("error"):
+                raise RuntimeError("Failed to list cases.")
+            cases.extend(_items(page))
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return cases
+
+    async def _fetch_all(self, endpoint: str) -> Optional[List[Dict[str, Any]]]:
+        async def fetch(page_token: Optional[str]):
+            return await self._http_client.get(
+                endpoint,
+                params={"pageToken": page_token} if page_token else None,
+                use_cache=False,
+            )
+
+        page = await collect_pages(fetch, None, sys.maxsize, sys.maxsize)
+        if page is None or page.get("error"):
+            return None
+        return _items(page)
+
+    async def _fetch_case_children(
+        self, case_id: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Tuple]]]:
+        alerts, comments = await asyncio.gather(
+            self._fetch_all(Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)),
+            self._fetch_all(Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)),
+        )
+        if alerts is None or comments is None:
+            return None
+        alert_group_identifiers = sorted(
+            {
+                alert["alertGroupIdentifier"]
+                for alert in alerts
+                if alert.get("alertGroupIdentifier")
+            }
+        )
+        entities = []
+        if alert_group_identifiers:
+            response = await self._http_client.post(
+                Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES,
+                req={
+                    "caseId": case_id,
+                    "alertGroupIdentifiers": alert_group_identifiers,
+                },
+                retry_safe=True,
+            )
+            if response is None:
+                return None
+            entities = sorted(
+                {
+                    (entity["identifier"], entity["type"])
+                    for entity in find_entities(response)
+                }
+            )
+        return alerts, comments, entities
+
+    async def sync(self) -> Dict[str, Any]:
+        """Brings the mirror up to date with SOAR.
+
+        Returns:
+            A summary of the sync, also kept in `last_sync`.
+        """
+        started = datetime.datetime.now(datetime.timezone.utc)
+        watermark = await self._run(lambda db: _get_state(db, "watermark"))
+        try:
+            cases = await self._list_cases(watermark)
+        except RuntimeError:
+            if watermark is None:
+                raise
+            # SOAR may not support filtering on the update time, in which case
+            # the unchanged cases are skipped by comparing update times.
+            logger.warning("Filtered case listing failed, listing all cases.")
+            cases = await self._list_cases(None)
+
+        known = await self._run(
+            lambda db: dict(db.execute("SELECT case_id, update_time FROM cases"))
+        )
+        changed = [
+            case
+            for case in cases
+            if case.get("id") is not None
+            and (
+                str(case["id"]) not in known
+                or known[str(case["id"])] != _text(_first(case, _CASE_COLUMNS["update_time"]))
+            )
+        ]
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+        async def sync_case(case: Dict[str, Any]) -> bool:
+            case_id = str(case["id"])
+            async with semaphore:
+                children = await self._fetch_case_children(case_id)
+            if children is None:
+                logger.warning("Failed to sync case %s, will retry.", case_id)
+                return False
+            await self._run(lambda db: self._store_case(db, case_id, case, *children))
+            return True
+
+        synced = await asyncio.gather(*(sync_case(case) for case in changed))
+        failed = synced.count(False)
+        update_times = [
+            _text(_first(case, _CASE_COLUMNS["update_time"])) for case in cases
+        ]
+        update_times = [value for value in update_times if value]
+        if not failed and update_times:
+            new_watermark = max(update_times + ([watermark] if watermark else []))
+            await self._run(lambda db: _set_state(db, "watermark", new_watermark))
+
+        self.last_sync = {
+            "started_at": started.isoformat(),
+            "duration_seconds": round(
+                (datetime.datetime.now(datetime.timezone.utc) - started).total_seconds(),
+                3,
+            ),
+            "cases_listed": len(cases),
+            "cases_updated": len(changed) - failed,
+            "cases_failed": failed,
+        }
+        if changed:
+            logger.info("Synced the case mirror: %s", self.last_sync)
+        return self.last_sync
+
+    def _store_case(
+        self,
+        db: sqlite3.Connection,
+        case_id: str,
+        case: Dict[str, Any],
+        alerts: List[Dict[str, Any]],
+        comments: List[Dict[str, Any]],
+        entities: List[Tuple[str, Optional[str]]],
+    ):
+        columns = {
+            column: _text(_first(case, fields))
+            for column, fields in _CASE_COLUMNS.items()
+        }
+        columns["priority_rank"] = priority_rank(columns["priority"])
+        tags = {_text(tag) for tag in case.get("tags") or []} - {None}
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO cases (case_id, data, "
+                + ", ".join(columns)
+                + ") VALUES (?, ?"
+                + ", ?" * len(columns)
+                + ")",
+                (case_id, json.dumps(case), *columns.values()),
+            )
+            for table in ("case_tags", "alerts", "comments", "entities"):
+                db.execute(f"DELETE FROM {table} WHERE case_id = ?", (case_id,))
+            db.executemany(
+                "INSERT INTO case_tags (case_id, tag) VALUES (?, ?)",
+                [(case_id, tag) for tag in sorted(tags)],
+            )
+            db.executemany(
+                "INSERT INTO alerts (case_id, alert_id, name, severity, product, "
+                "alert_group_identifier, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        case_id,
+                        _text(_first(alert, ("id", "identifier"))),
+                        _text(_first(alert, ("displayName", "name"))),
+                        _text(alert.get("severity")),
+                        _text(alert.get("product")),
+                        _text(alert.get("alertGroupIdentifier")),
+                        json.dumps(alert),
+                    )
+                    for alert in alerts
+                ],
+            )
+            db.executemany(
+                "INSERT INTO comments (case_id, comment_id, text, create_time, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        case_id,
+                        _text(comment.get("id")),
+                        _text(_first(comment, ("comment", "text", "Comment"))),
+                        _text(
+                            _first(
+                                comment, ("createTime", "creationTime", "timestamp")
+                            )
+                        ),
+                        json.dumps(comment),
+                    )
+                    for comment in comments
+                ],
+            )
+            db.executemany(
+                "INSERT INTO entities (case_id, identifier, entity_type) "
+                "VALUES (?, ?, ?)",
+                [(case_id, *entity) for entity in entities],
+            )
+            if self.full_text_search:
+                db.execute(
+                    "DELETE FROM case_text_rows WHERE case_id = ?", (case_id,)
+                )
+                db.execute(
+                    _INDEX_TEXT.format(and_case="AND case_id = ?"), (case_id,) * 3
+                )
+
+    async def query_cases(
+        self,
+        filters: Dict[str, Optional[str]],
+        sort_by: str,
+        descending: bool,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Returns the mirrored cases matching the filters.
+
+        Args:
+            filters: Values the cases must have; see `_where` for the keys.
+            sort_by: One of `SORT_COLUMNS`.
+            descending: Whether to sort in descending order.
+            limit: The maximum number of cases to return.
+
+        Returns:
+            A dict with the number of matching cases under "total" and the
+            first `limit` of them under "cases".
+        """
+        where, params = _where(filters)
+        order = "priority_rank" if sort_by == "priority" else sort_by
+        direction = "DESC" if descending else "ASC"
+
+        def query(db: sqlite3.Connection) -> Dict[str, Any]:
+            total = db.execute(f"SELECT COUNT(*) FROM cases{where}", params).fetchone()[0]
+            rows = db.execute(
+                "SELECT case_id, display_name, priority, status, stage, assignee, "
+                "environment, create_time, update_time, "
+                "(SELECT COUNT(*) FROM alerts WHERE alerts.case_id = cases.case_id) "
+                "AS alert_count, "
+                "(SELECT group_concat(tag, ',') FROM case_tags "
+                "WHERE case_tags.case_id = cases.case_id) AS tags "
+                f"FROM cases{where} "
+                f"ORDER BY {order} IS NULL, {order} {direction}, case_id {direction} "
+                "LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+            cases = []
+            for row in rows:
+                case = {key: row[key] for key in row.keys() if row[key] is not None}
+                case["tags"] = row["tags"].split(",") if row["tags"] else []
+                cases.append(case)
+            return {"total": total, "cases": cases}
+
+        return await self._run(query)
+
+    async def count_cases(
+        self, group_by: str, filters: Dict[str, Optional[str]]
+    ) -> List[Dict[str, Any]]:
+        """Counts the mirrored cases matching the filters by one of `GROUP_BY_VALUES`.
+
+        Returns:
+            The values and their number of cases, most frequent first.
+        """
+        where, params = _where(filters)
+        if group_by == "tag":
+            sql = (
+                "SELECT tag AS value, COUNT(DISTINCT case_id) AS count FROM case_tags "
+                f"WHERE case_id IN (SELECT case_id FROM cases{where}) GROUP BY tag"
+            )
+        elif group_by == "entity_type":
+            sql = (
+                "SELECT entity_type AS value, COUNT(DISTINCT case_id) AS count "
+                "FROM entities "
+                f"WHERE case_id IN (SELECT case_id FROM cases{where}) "
+                "GROUP BY entity_type"
+            )
+        else:
+            sql = f"SELECT {group_by} AS value, COUNT(*) AS count FROM cases{where} GROUP BY {group_by}"
+
+        def query(db: sqlite3.Connection) -> List[Dict[str, Any]]:
+            rows = db.execute(sql + " ORDER BY count DESC, value", params).fetchall()
+            return [{"value": row["value"], "count": row["count"]} for row in rows]
+
+        return await self._run(query)
+
+    async def search_text(self, query: str, mode: str, limit: int) -> Dict[str, Any]:
+        """Finds the mirrored cases whose title, alerts or comments match a query.
+
+        Args:
+            query: The words to search for.
+            mode: "all_words", "any_word" or "phrase".
+            limit: The maximum number of cases to return.
+
+        Returns:
+            A dict with the number of matching cases under "total" and the best
+            `limit` of them, ranked by relevance, under "cases". Matches in
+            titles rank above matches in alert names, then comments.
+
+        Raises:
+            ValueError: If the query has no words, or cannot be searched for.
+        """
+        match = _match_expression(query, mode)
+
+        def search(db: sqlite3.Connection) -> Dict[str, Any]:
+            try:
+                rows = db.execute(
+                    "SELECT r.case_id, r.field, bm25(case_text) AS rank, "
+                    "snippet(case_text, 0, '[', ']', '...', 12) AS snippet "
+                    "FROM case_text JOIN case_text_rows AS r "
+                    "ON r.row_id = case_text.rowid "
+                    "WHERE case_text MATCH ? ORDER BY rank",
+                    (match,),
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query: {e}")
+            found: Dict[str, Dict[str, Any]] = {}
+            for row in rows:
+                case = found.setdefault(row["case_id"], {"score": 0.0, "matches": []})
+                # bm25() is lower for better matches.
+                case["score"] -= row["rank"] * TEXT_FIELD_WEIGHTS[row["field"]]
+                if len(case["matches"]) < MAX_SNIPPETS_PER_CASE:
+                    case["matches"].append(
+                        {"field": row["field"], "snippet": row["snippet"]}
+                    )
+            ranked = sorted(found.items(), key=lambda item: -item[1]["score"])[:limit]
+            cases = []
+            for case_id, case in ranked:
+                row = db.execute(
+                    "SELECT display_name, priority, status, update_time FROM cases "
+                    "WHERE case_id = ?",
+                    (case_id,),
+                ).fetchone()
+                info = {key: row[key] for key in row.keys() if row[key] is not None}
+                cases.append(
+                    {
+                        "case_id": case_id,
+                        **info,
+                        "score": round(case["score"], 3),
+                        "matches": case["matches"],
+                    }
+                )
+            return {"total": len(found), "cases": cases}
+
+        return await self._run(search)
+
+    async def get_status(self) -> Dict[str, Any]:
+        def query(db: sqlite3.Connection) -> Dict[str, Any]:
+            return {
+                "cases": db.execute("SELECT COUNT(*) FROM cases").fetchone()[0],
+                "watermark": _get_state(db, "watermark"),
+            }
+
+        return {**await self._run(query), "last_sync": self.last_sync}
+
+
+def _create_text_index(db: sqlite3.Connection) -> bool:
+    """Creates the full-text index, filling it from existing mirrors.
+
+    Returns:
+        Whether full-text search is available, which requires SQLite FTS5.
+    """
+    try:
+        db.executescript(_TEXT_SCHEMA)
+    except sqlite3.OperationalError as e:
+        logger.warning("Full-text search of the case mirror is unavailable: %s", e)
+        return False
+    with db:
+        if db.execute("SELECT 1 FROM case_text_rows LIMIT 1").fetchone() is None:
+            db.execute(_INDEX_TEXT.format(and_case=""))
+    return True
+
+
+def _match_expression(query: str, mode: str) -> str:
+    """Turns a query into an FTS5 expression matching its words literally."""
+    words = query.split()
+    if not words:
+        raise ValueError("The search query is empty.")
+    # Quoting makes FTS5 read operators and punctuation as text; words made of
+    # several tokens, like IP addresses or hostnames, match as phrases.
+    quoted = ['"' + word.replace('"', '""') + '"' for word in words]
+    if mode == "phrase":
+        return '"' + " ".join(words).replace('"', '""') + '"'
+    if mode == "any_word":
+        return " OR ".join(quoted)
+    return " AND ".join(quoted)
+
+
+def _where(filters: Dict[str, Optional[str]]) -> Tuple[str, List[Any]]:
+    """Builds the WHERE clause selecting the cases matching the filters.
+
+    The filters are priority, status, stage, assignee and environment (exact
+    matches, ignoring case), tag, entity (an entity identifier), and
+    updated_after (an update time).
+    """
+    clauses = []
+    params: List[Any] = []
+    for column in ("status", "stage", "assignee", "environment"):
+        if filters.get(column):
+            clauses.append(f"{column} = ?")
+            params.append(filters[column])
+    if filters.get("priority"):
+        rank = priority_rank(filters["priority"])
+        if rank is not None:
+            clauses.append("priority_rank = ?")
+            params.append(rank)
+        else:
+            clauses.append("priority = ?")
+            params.append(filters["priority"])
+    if filters.get("tag"):
+        clauses.append(
+            "case_id IN (SELECT case_id FROM case_tags WHERE tag = ?)"
+        )
+        params.append(filters["tag"])
+    if filters.get("entity"):
+        clauses.append(
+            "case_id IN (SELECT case_id FROM entities WHERE identifier = ?)"
+        )
+        params.append(filters["entity"])
+    if filters.get("updated_after"):
+        clauses.append("update_time > ?")
+        params.append(filters["updated_after"])
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _get_state(db: sqlite3.Connection, key: str) -> Optional[str]:
+    row = db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_state(db: sqlite3.Connection, key: str, value: str):
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
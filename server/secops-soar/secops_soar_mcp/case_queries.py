@@ -0,0 +1,269 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tools querying the local mirror of the SOAR cases."""
+
+from typing import Annotated, Literal, Optional
+
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field
+from secops_soar_mcp import bindings
+
+MIRROR_DISABLED = {
+    "Status": "Failed",
+    "Message": "The case mirror is disabled. Start the server with --case-mirror-path to enable it.",
+}
+
+Priority = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description="Only cases with this priority (e.g. PriorityHigh or High).",
+    ),
+]
+Status = Annotated[
+    Optional[str],
+    Field(default=None, description="Only cases with this status (e.g. Opened)."),
+]
+Tag = Annotated[
+    Optional[str], Field(default=None, description="Only cases with this tag.")
+]
+Entity = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description="Only cases involving the entity with this identifier (e.g. an IP address or hostname).",
+    ),
+]
+Assignee = Annotated[
+    Optional[str], Field(default=None, description="Only cases assigned to this user.")
+]
+UpdatedAfter = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description="Only cases updated after this time, as an ISO 8601 timestamp.",
+    ),
+]
+
+
+def register_tools(mcp: FastMCP):
+    @mcp.tool()
+    async def query_mirrored_cases(
+        priority: Priority,
+        status: Status,
+        tag: Tag,
+        entity: Entity,
+        assignee: Assignee,
+        updated_after: UpdatedAfter,
+        sort_by: Annotated[
+            Literal["update_time", "create_time", "priority", "status", "display_name"],
+            Field(default="update_time", description="The field to sort the cases by."),
+        ],
+        descending: Annotated[
+            bool, Field(default=True, description="Whether to sort in descending order.")
+        ],
+        limit: Annotated[
+            int,
+            Field(
+                default=50,
+                ge=1,
+                le=1000,
+                description="The maximum number of cases to return.",
+            ),
+        ],
+    ) -> dict:
+        """Filter and sort SOAR cases instantly, using the server's local mirror of the cases.
+
+        When the case mirror is enabled, the server keeps a local copy of the cases, their alerts,
+        comments and involved entities, synced with SOAR in the background. This tool queries that
+        copy, so it answers in milliseconds even with thousands of cases, but may lag behind SOAR by
+        up to the mirror's sync interval. All filters are optional and combined; text filters ignore
+        case.
+
+        Args:
+            priority (Optional[str]): Only cases with this priority.
+            status (Optional[str]): Only cases with this status.
+            tag (Optional[str]): Only cases with this tag.
+            entity (Optional[str]): Only cases involving this entity identifier.
+            assignee (Optional[str]): Only cases assigned to this user.
+            updated_after (Optional[str]): Only cases updated after this ISO 8601 time.
+            sort_by (str): The field to sort by. Priorities sort by severity.
+            descending (bool): Whether to sort in descending order.
+            limit (int): The maximum number of cases to return.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'total': The number of matching cases.
+                  - 'cases': Up to `limit` cases, with their 'case_id', 'display_name', 'priority',
+                    'status', 'stage', 'assignee', 'environment', 'create_time', 'update_time',
+                    'alert_count' and 'tags'.
+                  - 'mirror': The number of mirrored cases and the outcome of the last sync.
+                  If the mirror is disabled, a dictionary with a "Failed" Status and a Message.
+
+        **Workflow Integration:**
+        - Use for dashboard-style questions, such as the open critical cases or the cases involving
+          a host, instead of paging through `list_cases`.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Use `get_case_full_details` or `get_cases_digest` for the current details of the cases found.
+        """
+        if bindings.case_mirror is None:
+            return MIRROR_DISABLED
+        result = await bindings.case_mirror.query_cases(
+            {
+                "priority": priority,
+                "status": status,
+                "tag": tag,
+                "entity": entity,
+                "assignee": assignee,
+                "updated_after": updated_after,
+            },
+            sort_by,
+            descending,
+            limit,
+        )
+        result["mirror"] = await bindings.case_mirror.get_status()
+        return result
+
+    @mcp.tool()
+    async def count_mirrored_cases(
+        group_by: Annotated[
+            Literal[
+                "priority",
+                "status",
+                "stage",
+                "assignee",
+                "environment",
+                "tag",
+                "entity_type",
+            ],
+            Field(..., description="The field to count the cases by."),
+        ],
+        priority: Priority,
+        status: Status,
+        tag: Tag,
+        entity: Entity,
+        assignee: Assignee,
+        updated_after: UpdatedAfter,
+    ) -> dict:
+        """Count SOAR cases by priority, status, assignee, tag and more, using the local case mirror.
+
+        Aggregates the cases of the server's local case mirror (see `query_mirrored_cases`), such as
+        the number of open cases per assignee or the tags of the cases updated today. The filters
+        are the same as those of `query_mirrored_cases`.
+
+        Args:
+            group_by (str): The field to count by. With "tag" or "entity_type", a case counts once
+                            for each of its tags or entity types.
+            priority, status, tag, entity, assignee, updated_after: Filters, as in
+                                                                    `query_mirrored_cases`.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'counts': The values of the field with their number of cases, most frequent first.
+                  - 'mirror': The number of mirrored cases and the outcome of the last sync.
+                  If the mirror is disabled, a dictionary with a "Failed" Status and a Message.
+
+        **Workflow Integration:**
+        - Use for workload and trend overviews across many cases.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Use `query_mirrored_cases` with the same filters to list the cases behind a count.
+        """
+        if bindings.case_mirror is None:
+            return MIRROR_DISABLED
+        counts = await bindings.case_mirror.count_cases(
+            group_by,
+            {
+                "priority": priority,
+                "status": status,
+                "tag": tag,
+                "entity": entity,
+                "assignee": assignee,
+                "updated_after": updated_after,
+            },
+        )
+        return {"counts": counts, "mirror": await bindings.case_mirror.get_status()}
+
+    @mcp.tool()
+    async def search_cases_text(
+        query: Annotated[
+            str,
+            Field(
+                ...,
+                description="The words to search for, e.g. a hostname, an IP address or a phrase.",
+            ),
+        ],
+        match: Annotated[
+            Literal["all_words", "any_word", "phrase"],
+            Field(
+                default="all_words",
+                description="Whether cases must contain all of the words, any of them, or the exact phrase.",
+            ),
+        ],
+        limit: Annotated[
+            int,
+            Field(
+                default=20,
+                ge=1,
+                le=200,
+                description="The maximum number of cases to return.",
+            ),
+        ],
+    ) -> dict:
+        """Find the SOAR cases whose title, alert names or comments mention a hostname, indicator or phrase.
+
+        Searches a full-text index of the server's local case mirror (see `query_mirrored_cases`)
+        instead of reading the comments of every case through the SOAR API. Words are matched
+        ignoring case and accents; multi-part values such as "10.1.2.3" or "host1.corp.example"
+        match as a whole. Cases are ranked by relevance, with matches in titles ranking above
+        matches in alert names, then in comments.
+
+        Args:
+            query (str): The words to search for.
+            match (str): "all_words" (default), "any_word" or "phrase".
+            limit (int): The maximum number of cases to return.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'total': The number of matching cases.
+                  - 'cases': The best `limit` cases, with their 'case_id', 'display_name',
+                    'priority', 'status', 'update_time', relevance 'score', and up to 3 'matches',
+                    each with the matching 'field' ("title", "alert" or "comment") and a 'snippet'
+                    with the matched words in brackets.
+                  - 'mirror': The number of mirrored cases and the outcome of the last sync.
+                  If the mirror or full-text search is unavailable, or the query is empty, a
+                  dictionary with a "Failed" Status and a Message.
+
+        **Workflow Integration:**
+        - Use to answer "which cases mention this host, user or phrase?" when pivoting on an
+          indicator found during an investigation.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Use `get_case_full_details` on the cases found to read their full context.
+        - Use `search_entity` to look up the indicator as a SOAR entity.
+        """
+        if bindings.case_mirror is None:
+            return MIRROR_DISABLED
+        if not bindings.case_mirror.full_text_search:
+            return {
+                "Status": "Failed",
+                "Message": "Full-text search requires SQLite with FTS5 support.",
+            }
+        try:
+            result = await bindings.case_mirror.search_text(query, match, limit)
+        except ValueError as e:
+            return {"Status": "Failed", "Message": str(e)}
+        result["mirror"] = await bindings.case_mirror.get_status()
+        return result
@@ -0,0 +1,368 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scoring and ranking the case queue."""
+
+import asyncio
+import datetime
+import heapq
+import math
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from logger_utils import get_logger
+from secops_soar_mcp import bindings
+from secops_soar_mcp.case_entities import ENTITY_TABLE_COLUMNS, collect_case_entities
+from secops_soar_mcp.case_mirror import priority_rank
+from secops_soar_mcp.pagination import collect_pages, find_items_field
+from secops_soar_mcp.utils.consts import (
+    CASE_RANKING_WEIGHTS,
+    ENV_SOAR_CASE_RANKING_WEIGHTS,
+    Endpoints,
+)
+
+logger = get_logger(__name__)
+
+OPEN_CASES_FILTER = "status eq 'Opened'"
+MAX_PRIORITY_RANK = 5
+# Cases reach the maximum age score once open for this many hours.
+AGE_HORIZON_HOURS = 72
+# With entity scoring, the entities of this many times top_k of the best
+# cases by the other components are fetched.
+ENTITY_CANDIDATES_FACTOR = 3
+ENTITY_SCORING_CONCURRENCY = 5
+
+# Fields of a case that may hold its number of alerts, tried in order. Cases
+# without any of them have no alerts component.
+ALERT_COUNT_FIELDS = ("alertCount", "alertsCount", "numberOfAlerts")
+CREATE_TIME_FIELDS = ("createTime", "creationTime", "creationTimeUnixTimeInMs")
+RANKED_CASE_FIELDS = (
+    "displayName",
+    "title",
+    "priority",
+    "status",
+    "stage",
+    "assignee",
+    "environment",
+    "createTime",
+)
+SUSPICIOUS_COLUMN = ENTITY_TABLE_COLUMNS.index("isSuspicious")
+
+
+def _first(obj: Dict[str, Any], fields: Iterable[str]) -> Any:
+    for field in fields:
+        if obj.get(field) is not None:
+            return obj[field]
+    return None
+
+
+def parse_weights(value: Optional[str]) -> Dict[str, float]:
+    """Parses score weights like "priority=3,alerts=2,age=0.5".
+
+    Raises:
+        ValueError: If a weight is not a known score component and a number.
+    """
+    weights = {}
+    for override in (value or "").split(","):
+        if not override.strip():
+            continue
+        name, separator, weight = override.partition("=")
+        weights[name.strip()] = float(weight) if separator else float("nan")
+    return validate_weights(weights)
+
+
+def validate_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """Checks that weights are numbers of known score components.
+
+    Raises:
+        ValueError: If they are not.
+    """
+    for name, weight in weights.items():
+        if name not in CASE_RANKING_WEIGHTS:
+            raise ValueError(
+                f"Unknown score component '{name}'. "
+                f"Allowed values are: {', '.join(CASE_RANKING_WEIGHTS)}"
+            )
+        if not isinstance(weight, (int, float)) or math.isnan(weight):
+            raise ValueError(f"Invalid weight for score component '{name}'.")
+    return weights
+
+
+def resolve_weights(overrides: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Returns the default weights, overridden by the environment, then by
+    `overrides`.
+
+    Raises:
+        ValueError: If a weight is invalid.
+    """
+    return {
+        **CASE_RANKING_WEIGHTS,
+        **parse_weights(os.getenv(ENV_SOAR_CASE_RANKING_WEIGHTS)),
+        **validate_weights(overrides or {}),
+    }
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """Converts ISO 8601 strings and epoch milliseconds to epoch seconds."""
+    if isinstance(value, str):
+        try:
+            parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+        return parsed.timestamp()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value / 1000
+    return None
+
+
+def _tag_names(case: Dict[str, Any]) -> List[str]:
+    names = []
+    for tag in case.get("tags") or []:
+        if isinstance(tag, dict):
+            tag = _first(tag, ("displayName", "name", "tag"))
+        if tag is not None:
+            names.append(str(tag).lower())
+    return names
+
+
+def _alert_count(case: Dict[str, Any]) -> Optional[float]:
+    count = _first(case, ALERT_COUNT_FIELDS)
+    if isinstance(count, bool) or not isinstance(count, (int, float, str)):
+        return None
+    try:
+        return float(count)
+    except ValueError:
+        return None
+
+
+def _log_scale(values: List[Optional[float]]) -> List[Optional[float]]:
+    """Scales counts to [0, 1] on a log scale, relative to the largest.
+
+    Unknown counts (None) stay None.
+    """
+    known = [value for value in values if value is not None]
+    largest = math.log1p(max(known, default=0))
+    return [
+        None if value is None else math.log1p(value) / largest if largest else 0.0
+        for value in values
+    ]
+
+
+def score_cases(
+    cases: List[Dict[str, Any]],
+    weights: Dict[str, float],
+    tag_weights: Dict[str, float],
+    suspicious_entities: Optional[Dict[str, int]] = None,
+    now: Optional[float] = None,
+) -> List[Dict[str, Optional[float]]]:
+    """Computes the score components and total score of each case.
+
+    Every component is computed for the whole set of cases at once, column by
+    column, and scaled to [0, 1] except for tags, whose component is the sum
+    of the weights of the case's tags:
+        priority: The case priority, from informative to critical.
+        alerts: The number of alerts, on a log scale relative to the case
+            with the most alerts; None for cases without an alert count.
+        age: The time since the case was created, up to 72 hours.
+        tags: The sum of `tag_weights` of the case's tags.
+        suspicious_entities: The number of suspicious entities, on a log
+            scale like alerts; None for cases absent from
+            `suspicious_entities`, whose entities were not counted.
+
+    Returns:
+        For each case, in order, its components and their weighted sum under
+        "score", to which components that are None add nothing.
+    """
+    now = time.time() if now is None else now
+    tag_weights = {tag.lower(): weight for tag, weight in tag_weights.items()}
+    columns = {
+        "priority": [
+            (priority_rank(case.get("priority")) or 0) / MAX_PRIORITY_RANK
+            for case in cases
+        ],
+        "alerts": _log_scale([_alert_count(case) for case in cases]),
+        "age": [
+            min(max(now - created, 0) / 3600 / AGE_HORIZON_HOURS, 1.0)
+            if created is not None
+            else 0.0
+            for created in (
+                _timestamp(_first(case, CREATE_TIME_FIELDS)) for case in cases
+            )
+        ],
+        "tags": [
+            sum(tag_weights.get(tag, 0.0) for tag in _tag_names(case))
+            for case in cases
+        ],
+        "suspicious_entities": _log_scale(
+            [
+                (suspicious_entities or {}).get(str(case.get("id")))
+                for case in cases
+            ]
+        ),
+    }
+    weighted = [
+        [weight * (value or 0.0) for value in columns[name]]
+        for name, weight in weights.items()
+        if weight
+    ]
+    totals = [sum(values) for values in zip(*weighted)] if weighted else []
+    totals = totals or [0.0] * len(cases)
+    return [
+        {
+            **{
+                name: None if column[index] is None else round(column[index], 4)
+                for name, column in columns.items()
+            },
+            "score": round(totals[index], 4),
+        }
+        for index in range(len(cases))
+    ]
+
+
+async def list_open_cases(case_filter: str, max_cases: int) -> Dict[str, Any]:
+    """Lists up to `max_cases` cases matching an OData filter, with their tags.
+
+    Raises:
+        RuntimeError: If the cases could not be listed.
+    """
+
+    async def fetch(page_token: Optional[str]):
+        params = {"$filter": case_filter, "$expand": "tags"}
+        if page_token:
+            params["pageToken"] = page_token
+        return await bindings.http_client.get(Endpoints.BASE_CASE_URL, params=params)
+
+    response = await collect_pages(fetch, None, max_cases, sys.maxsize)
+    if not isinstance(response, dict):
+        raise RuntimeError("Failed to list cases.")
+    items_field = find_items_field(response)
+    cases = (response.get(items_field) or []) if items_field else []
+    return {
+        "cases": [case for case in cases if isinstance(case, dict)],
+        "truncated": bool(response.get("truncated")),
+    }
+
+
+async def count_suspicious_entities(case_ids: List[str]) -> Dict[str, int]:
+    """Counts the suspicious entities of each case.
+
+    Cases whose entities cannot be fetched are left out.
+    """
+    semaphore = asyncio.Semaphore(ENTITY_SCORING_CONCURRENCY)
+
+    async def count(case_id: str) -> int:
+        async with semaphore:
+            entities = await collect_case_entities(
+                bindings.http_client, case_id, ENTITY_SCORING_CONCURRENCY, False
+            )
+        return sum(1 for row in entities["rows"] if row[SUSPICIOUS_COLUMN])
+
+    results = await asyncio.gather(
+        *(count(case_id) for case_id in case_ids), return_exceptions=True
+    )
+    counts = {}
+    for case_id, result in zip(case_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Failed to count the suspicious entities of case %s: %s",
+                case_id,
+                result,
+            )
+        else:
+            counts[case_id] = result
+    return counts
+
+
+def _top(scores: List[Dict[str, float]], top_k: int) -> List[int]:
+    """Returns the indexes of the `top_k` best scores, best first."""
+    return heapq.nlargest(
+        top_k, range(len(scores)), key=lambda index: scores[index]["score"]
+    )
+
+
+async def rank_cases(
+    case_filter: Optional[str],
+    top_k: int,
+    max_cases: int,
+    weights: Dict[str, float],
+    tag_weights: Dict[str, float],
+    score_entities: bool,
+) -> Dict[str, Any]:
+    """Scores the cases of the queue and returns the best ones.
+
+    With `score_entities`, the suspicious entities of only the
+    `ENTITY_CANDIDATES_FACTOR * top_k` best candidates by the other components
+    are counted, and the cases are scored again. The entities of the other
+    cases are not counted, so a case left out of the candidates may rank
+    lower than it would with its entities counted.
+
+    Returns:
+        A dict with the "case_count" scored, "truncated" if more cases match
+        the filter than `max_cases`, the "weights" used, the
+        "missing_components": weighted components known for none of the
+        cases, and the "cases": the `top_k` best, each with its key fields,
+        "score" and "components", None for those not known for the case.
+
+    Raises:
+        RuntimeError: If the cases could not be listed.
+    """
+    listed = await list_open_cases(case_filter or OPEN_CASES_FILTER, max_cases)
+    cases = listed["cases"]
+    scores = score_cases(cases, weights, tag_weights)
+    if score_entities and weights.get("suspicious_entities", 0) > 0 and cases:
+        candidates = _top(scores, top_k * ENTITY_CANDIDATES_FACTOR)
+        counts = await count_suspicious_entities(
+            [str(cases[index].get("id")) for index in candidates]
+        )
+        scores = score_cases(cases, weights, tag_weights, counts)
+    top = _top(scores, top_k)
+    missing_components = [
+        name
+        for name, weight in weights.items()
+        if weight and cases and all(score[name] is None for score in scores)
+    ]
+    if "alerts" in missing_components:
+        logger.warning(
+            "None of the cases has an alert count (%s); the alerts score "
+            "component is left out.",
+            ", ".join(ALERT_COUNT_FIELDS),
+        )
+
+    ranked = []
+    for index in top:
+        components = dict(scores[index])
+        score = components.pop("score")
+        ranked.append(
+            {
+                "case_id": str(cases[index].get("id")),
+                **{
+                    field: cases[index][field]
+                    for field in RANKED_CASE_FIELDS
+                    if cases[index].get(field) is not None
+                },
+                "tags": _tag_names(cases[index]),
+                "score": score,
+                "components": components,
+            }
+        )
+    return {
+        "case_count": len(cases),
+        "truncated": listed["truncated"],
+        "weights": weights,
+        "missing_components": missing_components,
+        "cases": ranked,
+    }
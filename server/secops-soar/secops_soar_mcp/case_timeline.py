@@ -0,0 +1,227 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Merging the involved events of all the alerts of a case into a timeline."""
+
+import asyncio
+import datetime
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp import bindings
+from secops_soar_mcp.pagination import collect_pages, find_items_field
+from secops_soar_mcp.projection import parse_fields, select_fields
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+# Fields identifying an event and giving its time, tried in order. Dotted
+# paths reach into nested objects, e.g. the metadata of UDM events.
+EVENT_ID_FIELDS = ("id", "eventId", "identifier", "metadata.id")
+EVENT_TIME_FIELDS = (
+    "eventTime",
+    "timestamp",
+    "metadata.eventTimestamp",
+    "startTime",
+    "createTime",
+    "creationTime",
+)
+ALERT_IDS_FIELD = "alertIds"
+# Numeric times above this are milliseconds since the epoch, not seconds.
+MILLISECONDS_THRESHOLD = 10**11
+
+
+def _lookup(event: Dict[str, Any], path: str) -> Any:
+    value: Any = event
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _first(event: Dict[str, Any], paths: Tuple[str, ...]) -> Any:
+    for path in paths:
+        value = _lookup(event, path)
+        if value is not None and value != "":
+            return value
+    return None
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """Returns the key identifying an event: its ID, else its whole content."""
+    event_id = _first(event, EVENT_ID_FIELDS)
+    if event_id is not None:
+        return f"id:{event_id}"
+    return json.dumps(event, sort_keys=True, default=str)
+
+
+def event_time(event: Dict[str, Any]) -> Optional[float]:
+    """Returns the time of an event in seconds since the epoch, if it has one.
+
+    Times are accepted as seconds or milliseconds since the epoch, or as ISO
+    8601 strings; times without a timezone are taken as UTC.
+    """
+    value = _first(event, EVENT_TIME_FIELDS)
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            try:
+                parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+            return parsed.timestamp()
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value / 1000 if value > MILLISECONDS_THRESHOLD else float(value)
+
+
+async def _collect_all(url: str) -> Optional[Dict[str, Any]]:
+    async def fetch(page_token: Optional[str]):
+        if page_token:
+            return await bindings.http_client.get(url, params={"pageToken": page_token})
+        return await bindings.http_client.get(url)
+
+    return await collect_pages(fetch, None, sys.maxsize, sys.maxsize)
+
+
+def _items(response: Optional[Dict[str, Any]]) -> List[Any]:
+    if not isinstance(response, dict):
+        return []
+    items_field = find_items_field(response)
+    return response[items_field] if items_field is not None else []
+
+
+async def list_alert_ids(case_id: str) -> Optional[List[str]]:
+    """Lists the IDs of all the alerts of a case, or None if that fails."""
+    alerts = await _collect_all(Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id))
+    if alerts is None:
+        return None
+    return [
+        str(alert["id"])
+        for alert in _items(alerts)
+        if isinstance(alert, dict) and alert.get("id") is not None
+    ]
+
+
+def merge_events(
+    events_by_alert: List[Tuple[str, List[Any]]],
+) -> List[Dict[str, Any]]:
+    """Deduplicates the events of several alerts and sorts them by time.
+
+    Each event appears once, with the IDs of the alerts involving it under
+    "alertIds". Events without a time come last, in the order they were
+    listed.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for alert_id, events in events_by_alert:
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            key = event_key(event)
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = {**event, ALERT_IDS_FIELD: [alert_id]}
+            elif alert_id not in entry[ALERT_IDS_FIELD]:
+                entry[ALERT_IDS_FIELD].append(alert_id)
+    times = {key: event_time(event) for key, event in merged.items()}
+    # A stable sort keeps the listing order of events with the same time.
+    return [
+        merged[key]
+        for key in sorted(
+            merged,
+            key=lambda key: (times[key] is None, times[key] or 0),
+        )
+    ]
+
+
+async def build_case_timeline(
+    case_id: str,
+    fields: Optional[List[str]],
+    max_events: int,
+    max_concurrency: int,
+) -> Dict[str, Any]:
+    """Fetches the involved events of every alert of a case into one timeline.
+
+    The events of each alert are paged to completion, a bounded number of
+    alerts at a time. An alert whose events cannot be fetched is reported
+    without failing the others.
+
+    Args:
+        case_id: The case.
+        fields: Dotted field paths to keep in each event; None keeps them all.
+            "alertIds" is always kept.
+        max_events: The maximum number of events to return, earliest first.
+        max_concurrency: The maximum number of alerts fetched at the same time.
+
+    Returns:
+        A dict with the sorted "events", "event_count" (before truncation),
+        "truncated", "alert_count" and "failed_alert_ids", or a "Failed"
+        Status and a Message if the alerts of the case cannot be listed.
+    """
+    alert_ids = await list_alert_ids(case_id)
+    if alert_ids is None:
+        return {
+            "Status": "Failed",
+            "Message": f"Failed to list the alerts of case {case_id}.",
+        }
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_events(alert_id: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await _collect_all(
+                Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
+                    CASE_ID=case_id, ALERT_ID=alert_id
+                )
+            )
+
+    results = await asyncio.gather(
+        *(fetch_events(alert_id) for alert_id in alert_ids), return_exceptions=True
+    )
+    events_by_alert = []
+    failed_alert_ids = []
+    for alert_id, result in zip(alert_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Failed to list the events of alert %s: %s", alert_id, result
+            )
+            result = None
+        # The events of an alert that failed midway are kept, but the alert
+        # is reported as failed since some of its events are missing.
+        if (
+            not isinstance(result, dict)
+            or result.get("error")
+            or result.get("truncated")
+        ):
+            failed_alert_ids.append(alert_id)
+        events_by_alert.append((alert_id, _items(result)))
+
+    events = merge_events(events_by_alert)
+    event_count = len(events)
+    events = events[:max_events]
+    if fields:
+        tree = parse_fields([*fields, ALERT_IDS_FIELD])
+        events = select_fields(events, tree)
+    return {
+        "case_id": case_id,
+        "alert_count": len(alert_ids),
+        "failed_alert_ids": failed_alert_ids,
+        "event_count": event_count,
+        "truncated": event_count > max_events,
+        "events": events,
+    }
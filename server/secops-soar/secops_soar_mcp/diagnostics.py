@@ -0,0 +1,71 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tools reporting the health of the server's connection to SOAR."""
+
+from mcp.server.fastmcp import FastMCP
+from secops_soar_mcp import bindings
+
+
+def register_tools(mcp: FastMCP):
+    @mcp.tool()
+    async def get_http_client_stats() -> dict:
+        """Report how requests from this server to the SOAR API are faring.
+
+        SOAR API requests that fail transiently (throttling, server errors,
+        timeouts) are retried with exponential backoff, and every endpoint has a
+        circuit breaker that makes requests fail fast after repeated failures,
+        until SOAR recovers. Requests may be rate limited per endpoint family.
+        Identical GET requests made at the same time are sent once, and
+        read-only case data may be served from a response cache. This tool
+        shows those counters.
+
+        Returns:
+            dict: Under "endpoints", statistics keyed by request method and path
+                  (IDs replaced by "{id}"), each with:
+                  - requests: Requests sent, including retries.
+                  - retries: Requests sent again after a transient failure.
+                  - failures: Requests that failed transiently.
+                  - rejected_by_circuit_breaker: Requests not sent because the
+                    circuit breaker was open.
+                  - coalesced: GET requests that shared the response of an
+                    identical request already in flight.
+                  - rejected_by_rate_limit: Requests not sent because they
+                    would have waited too long for the rate limit.
+                  - circuit_state: "closed" (healthy), "open" (failing fast) or
+                    "half_open" (testing whether SOAR recovered).
+                  - circuit_times_opened: How many times the breaker opened.
+                  Under "rate_limits", when rate limiting is enabled, the
+                  token bucket of each endpoint family (cases, alerts,
+                  entities, actions, other): its rate, available tokens, and
+                  the requests waiting, delayed and rejected, the responses
+                  throttled by SOAR and the total seconds waited.
+                  Under "response_cache", when the response cache is enabled,
+                  its size and its hits, misses, responses revalidated by SOAR
+                  (304 Not Modified) and invalidations after writes to a case.
+                  Under "action_result_cache", when enrichment results are
+                  cached, its size, hits and misses. Under "action_coalescing",
+                  when action executions are coalesced, the number of
+                  executions requested and run.
+
+        **Workflow Integration:**
+        - Use when SOAR tools return empty results or errors, to tell a degraded
+          SOAR API apart from a problem with the request.
+        - If an endpoint's circuit is open, wait before retrying tools that use it.
+        """
+        stats = bindings.http_client.get_stats()
+        if bindings.action_result_cache is not None:
+            stats["action_result_cache"] = bindings.action_result_cache.get_stats()
+        if bindings.action_coalescer is not None:
+            stats["action_coalescing"] = bindings.action_coalescer.get_stats()
+        return stats
@@ -13,120 +13,605 @@
 # limitations under the License.
 """HTTP client for making requests to the SecOps SOAR API."""
 
+import asyncio
 import json
-from typing import Any, Dict
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 from logger_utils import get_logger
+from pydantic import BaseModel, field_validator
+from secops_soar_mcp.resilience import (
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    EndpointStats,
+    TokenBucket,
+    backoff_delay,
+    endpoint_family,
+    endpoint_key,
+    parse_retry_after,
+)
+from secops_soar_mcp.response_cache import CachedResponse, ResponseCache
+from secops_soar_mcp.utils import consts
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, see the "fast" extra.
+    orjson = None
 
 logger = get_logger(__name__)
 
+JsonDecoder = Literal["auto", "orjson", "json"]
+
+
+def json_decoder(name: JsonDecoder) -> Callable[[bytes], Any]:
+    """Returns a function decoding JSON straight from bytes.
+
+    "auto" uses orjson when it is installed, else the standard library.
+
+    Raises:
+        ValueError: If orjson is asked for but not installed.
+    """
+    if name == "orjson" or (name == "auto" and orjson is not None):
+        if orjson is None:
+            raise ValueError(
+                "The orjson JSON decoder is not installed; install secops-soar-mcp[fast]."
+            )
+        return orjson.loads
+    return json.loads
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Hashable:
+    if not params:
+        return ()
+    return tuple(sorted((str(name), str(value)) for name, value in params.items()))
+
+
+class HttpResponse(NamedTuple):
+    """A successful response."""
+
+    status: int
+    headers: Mapping[str, str]
+    data: Any
+
+
+class HttpError(NamedTuple):
+    """A request that SOAR rejected or that was never sent.
+
+    The status is a client error or 429, whose requests SOAR did not process,
+    or None for requests that never reached SOAR: the connection could not be
+    established, or the rate limiter or circuit breaker held them back.
+    """
+
+    status: Optional[int]
+    body: str
+
+
+class HttpClientConfig(BaseModel):
+    """Connection pool, timeout and compression settings of the HTTP client."""
+
+    # Maximum number of open connections, in total and per host.
+    pool_size: int = 100
+    pool_size_per_host: int = 30
+    # Seconds an idle connection is kept alive for reuse.
+    keepalive_timeout: float = 60.0
+    # Seconds resolved host names are cached for.
+    dns_cache_ttl: int = 300
+    # Seconds allowed to establish a connection, and between two reads of a
+    # response. A value of 0 disables the timeout.
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    # Seconds allowed for a whole request, including reading the response.
+    total_timeout: float = 120.0
+    # Whether to ask for gzip/deflate compressed responses.
+    compression: bool = True
+    # Retries of transient failures, and the bounds in seconds of the
+    # exponential backoff between them.
+    max_retries: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 10.0
+    # Consecutive failures after which requests to an endpoint fail fast, and
+    # seconds before a trial request is let through again. A threshold of 0
+    # disables the circuit breaker.
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_reset_timeout: float = 30.0
+    # Whether to cache the responses of read-only case endpoints, and the
+    # maximum number of cached responses.
+    response_cache: bool = False
+    response_cache_size: int = 1024
+    # How to decode JSON responses: with orjson if installed ("auto"), or
+    # explicitly with "orjson" or the standard library "json".
+    json_decoder: JsonDecoder = "auto"
+    # Requests per second allowed to each endpoint family (see
+    # `consts.RATE_LIMIT_FAMILIES`), overridden per family by `rate_limits`,
+    # e.g. "actions=2,cases=20". A rate of 0 disables the limit. Requests
+    # queue for a token, and fail if they would wait over `rate_limit_max_wait`
+    # seconds.
+    rate_limit: float = 0.0
+    rate_limits: Dict[str, float] = {}
+    rate_limit_burst: int = 10
+    rate_limit_max_wait: float = 30.0
+
+    @field_validator("rate_limits", mode="before")
+    @classmethod
+    def _parse_rate_limits(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        rate_limits = {}
+        for rate_limit in value.split(","):
+            if rate_limit.strip():
+                family, _, rate = rate_limit.partition("=")
+                rate_limits[family.strip().lower()] = rate
+        return rate_limits
+
+    @classmethod
+    def from_env(cls) -> "HttpClientConfig":
+        """Builds a config from the SOAR_HTTP_* environment variables."""
+        values = {}
+        for field_name, env_var in consts.ENV_SOAR_HTTP_CLIENT_CONFIG.items():
+            value = os.getenv(env_var)
+            if value is not None and value != "":
+                values[field_name] = value
+        return cls.model_validate(values)
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout or None,
+            connect=self.connect_timeout or None,
+            sock_read=self.read_timeout or None,
+        )
+
 
 class HttpClient:
     """HTTP client for making requests to the SecOps SOAR API."""
 
-    def __init__(self, base_url: str, app_key: str):
+    def __init__(
+        self, base_url: str, app_key: str, config: Optional[HttpClientConfig] = None
+    ):
         self.base_url = base_url
         self.app_key = app_key
+        self.config = config or HttpClientConfig()
         self._session = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats: Dict[str, EndpointStats] = {}
+        self._in_flight_gets: Dict[Hashable, asyncio.Task] = {}
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        self._decode_json = json_decoder(self.config.json_decoder)
+        self._response_cache = None
+        if self.config.response_cache:
+            self._response_cache = ResponseCache(
+                consts.RESPONSE_CACHE_TTL_SECONDS, self.config.response_cache_size
+            )
 
     def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=self.config.pool_size,
+                limit_per_host=self.config.pool_size_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.config.timeout(),
+                auto_decompress=self.config.compression,
+            )
         return self._session
 
     async def _get_headers(self):
-        headers = {}
+        headers = {
+            "Accept-Encoding": "gzip, deflate" if self.config.compression else "identity"
+        }
         if self.app_key:
             headers["AppKey"] = self.app_key
         return headers
 
+    def _endpoint(self, key: str) -> Tuple[CircuitBreaker, EndpointStats]:
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(
+                self.config.circuit_breaker_threshold,
+                self.config.circuit_breaker_reset_timeout,
+            )
+            self._stats[key] = EndpointStats()
+        return self._breakers[key], self._stats[key]
+
+    def _rate_limiter(self, endpoint: str) -> Optional[TokenBucket]:
+        family = endpoint_family(endpoint)
+        rate = self.config.rate_limits.get(family, self.config.rate_limit)
+        if rate <= 0:
+            return None
+        if family not in self._rate_limiters:
+            self._rate_limiters[family] = TokenBucket(
+                rate, self.config.rate_limit_burst
+            )
+        return self._rate_limiters[family]
+
+    def _rate_limit_max_wait(self, timeout: Optional[aiohttp.ClientTimeout]) -> float:
+        """The longest a request may queue: waiting past its timeout is useless."""
+        total = (timeout or self.config.timeout()).total
+        if total is None:
+            return self.config.rate_limit_max_wait
+        return min(self.config.rate_limit_max_wait, total)
+
+    def _retry_delay(
+        self, attempt: int, retry_after: Optional[float]
+    ) -> Optional[float]:
+        """Returns the seconds to wait before a retry, or None to give up."""
+        if retry_after is None:
+            return backoff_delay(
+                attempt, self.config.retry_base_delay, self.config.retry_max_delay
+            )
+        # Waiting longer than the retry delay allows would stall the tool call.
+        if retry_after > self.config.retry_max_delay:
+            return None
+        return retry_after
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        req: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        retry: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Union[HttpResponse, HttpError, None]:
+        """Sends a request, retrying transient failures if `retry` is set.
+
+        Throttled (429) and 5xx responses, timeouts and connection errors are
+        transient: they are retried with exponential backoff, or after the
+        delay given by a Retry-After header, and count as failures of the
+        endpoint's circuit breaker. While the breaker is open, requests to the
+        endpoint fail without being sent.
+
+        When the endpoint's family is rate limited, every attempt first waits
+        for a token, and the request fails if the wait would exceed its
+        deadline. A throttled response holds back the family's requests.
+
+        Returns:
+            The response, an HttpError if SOAR rejected the request or it was
+            never sent, or None if another error occurred, after which SOAR
+            may have processed the request.
+        """
+        key = endpoint_key(method, endpoint)
+        breaker, stats = self._endpoint(key)
+        attempts = self.config.max_retries + 1 if retry else 1
+        headers = {**await self._get_headers(), **(headers or {})}
+        rate_limiter = self._rate_limiter(endpoint)
+        # Whether an earlier attempt failed in a way SOAR may have processed.
+        maybe_processed = False
+        for attempt in range(attempts):
+            if rate_limiter is not None and not await rate_limiter.acquire(
+                self._rate_limit_max_wait(timeout)
+            ):
+                stats.rejected_by_rate_limit += 1
+                logger.warning(
+                    "Rate limit for %s requests reached, not sending %s.",
+                    endpoint_family(endpoint),
+                    key,
+                )
+                if maybe_processed:
+                    return None
+                return HttpError(None, "Rate limit reached; the request was not sent.")
+            if not breaker.allow_request():
+                stats.rejected += 1
+                logger.warning("Circuit breaker for %s is open, failing fast.", key)
+                if maybe_processed:
+                    return None
+                return HttpError(
+                    None, "Circuit breaker open; the request was not sent."
+                )
+            stats.requests += 1
+            retry_after = None
+            error_body = None
+            not_processed = None
+            try:
+                async with self._get_session().request(
+                    method,
+                    self.base_url + endpoint,
+                    json=req,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout or self.config.timeout(),
+                ) as response:
+                    if response.status in RETRYABLE_STATUSES:
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                    if response.status == 429 and rate_limiter is not None:
+                        rate_limiter.throttle(retry_after)
+                    if response.status >= 400:
+                        error_body = await response.text()
+                    response.raise_for_status()  # Raise an exception for 4xx/5xx responses
+                    data = await response.read()
+                breaker.record_success()
+                return HttpResponse(
+                    response.status,
+                    response.headers,
+                    self._decode_json(data) if data else None,
+                )
+            except aiohttp.ClientResponseError as e:
+                logger.debug("HTTP error occurred: %s", e)
+                if e.status not in RETRYABLE_STATUSES:
+                    # SOAR answered; the request itself was at fault.
+                    breaker.record_success()
+                    return HttpError(e.status, error_body or "")
+                if e.status == 429:
+                    not_processed = HttpError(e.status, error_body or "")
+            except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+                logger.debug("Could not connect to %s: %s", endpoint, e)
+                not_processed = HttpError(None, f"Could not connect to SOAR: {e}")
+            except asyncio.TimeoutError:
+                logger.warning("Request to %s timed out.", endpoint)
+            except aiohttp.ClientError as e:
+                logger.debug("A connection error occurred: %s", e)
+            except Exception as e:
+                logger.debug("An error occurred: %s", e)
+                return None
+            breaker.record_failure()
+            stats.failures += 1
+            maybe_processed = maybe_processed or not_processed is None
+            if attempt + 1 == attempts or breaker.state == CircuitBreaker.OPEN:
+                break
+            delay = self._retry_delay(attempt, retry_after)
+            if delay is None:
+                logger.warning(
+                    "Not retrying %s %s: SOAR asked to retry after %.0f seconds.",
+                    method,
+                    endpoint,
+                    retry_after,
+                )
+                break
+            stats.retries += 1
+            logger.debug(
+                "Retrying %s %s in %.2f seconds (attempt %d of %d).",
+                method,
+                endpoint,
+                delay,
+                attempt + 2,
+                attempts,
+            )
+            await asyncio.sleep(delay)
+        return None if maybe_processed else not_processed
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        req: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        retry: bool = False,
+        return_errors: bool = False,
+    ):
+        """Sends a request and returns its JSON body, or None on error.
+
+        A write to a case drops the cached responses of that case.
+        """
+        response = await self._send(
+            method, endpoint, req=req, params=params, timeout=timeout, retry=retry
+        )
+        if method != "GET" and self._response_cache is not None:
+            case_id = self._response_cache.case_id(endpoint)
+            if case_id is not None:
+                self._invalidate_case(case_id)
+        if isinstance(response, HttpError):
+            return response if return_errors else None
+        return response.data if response is not None else None
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        timeout: Optional[aiohttp.ClientTimeout],
+        policy: Tuple[float, Optional[str]],
+        generation: Tuple[int, int],
+    ):
+        """Fetches a cacheable GET response, revalidating a stale cached one.
+
+        The response is not cached if the case was invalidated since
+        `generation`, i.e. while the request was in flight.
+        """
+        ttl, case_id = policy
+        cache_key = (endpoint, _params_key(params))
+        entry = self._response_cache.get(cache_key)
+        response = await self._send(
+            "GET",
+            endpoint,
+            params=params,
+            timeout=timeout,
+            retry=True,
+            headers=entry.conditional_headers() if entry is not None else None,
+        )
+        if not isinstance(response, HttpResponse):
+            return None
+        if response.status == 304 and entry is not None:
+            self._response_cache.revalidated += 1
+            entry.expires_at = time.monotonic() + ttl
+            return entry.data
+        self._response_cache.misses += 1
+        self._response_cache.put(
+            cache_key,
+            CachedResponse(
+                response.data,
+                ttl,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                case_id,
+            ),
+            generation,
+        )
+        return response.data
+
+    def _invalidate_case(self, case_id: str):
+        # Bumps the generation of the case and of the case lists: GETs of
+        # either already in flight may return what the write changed, so
+        # later GETs no longer share them and their responses are not cached.
+        self._response_cache.invalidate_case(case_id)
+
+    def invalidate_case(self, case_id: str):
+        """Drops the cached responses of a case, e.g. after an action ran on it."""
+        if self._response_cache is not None:
+            self._invalidate_case(str(case_id))
+
     async def get(
         self,
         endpoint: str,
         params: Dict[str, Any] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        use_cache: bool = True,
     ):
         """Makes a GET request to the specified endpoint.
 
+        Transient failures are retried. Identical GET requests made while one
+        is in flight share its response instead of being sent again and, when
+        the response cache is enabled, responses of the read-only endpoints
+        in `consts.RESPONSE_CACHE_TTL_SECONDS` are reused until they expire,
+        then revalidated with SOAR. Callers must not modify the returned
+        object.
+
         Args:
             endpoint: The API endpoint to send the request to.
             params: Query parameters as a dictionary.
+            timeout: Overrides the configured timeouts for this request.
+            use_cache: Whether the response may come from the response cache.
+                If not, it is fetched from SOAR, and not cached either.
 
         Returns:
             The response as a JSON object, or None if an error occurred.
         """
-        headers = await self._get_headers()
-        try:
-            async with self._get_session().get(
-                self.base_url + endpoint, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
-        except Exception as e:
-            logger.debug("An error occurred: %s", e)
-        return None
+        policy = generation = None
+        if self._response_cache is not None and use_cache:
+            policy = self._response_cache.policy(endpoint)
+        if policy is not None:
+            entry = self._response_cache.get((endpoint, _params_key(params)))
+            if entry is not None and entry.is_fresh():
+                self._response_cache.hits += 1
+                return entry.data
+            generation = self._response_cache.generation(policy[1])
+
+        # The generation keeps GETs made after a write to their case from
+        # sharing a request sent before it.
+        key = (endpoint, _params_key(params), timeout, generation)
+        task = self._in_flight_gets.get(key)
+        if task is None:
+            if policy is not None:
+                request = self._cached_get(
+                    endpoint, params, timeout, policy, generation
+                )
+            else:
+                request = self._request(
+                    "GET", endpoint, params=params, timeout=timeout, retry=True
+                )
+            task = asyncio.ensure_future(request)
+            self._in_flight_gets[key] = task
+            task.add_done_callback(lambda done: self._forget_in_flight_get(key, done))
+        else:
+            self._endpoint(endpoint_key("GET", endpoint))[1].coalesced += 1
+        # Shield the shared request so a cancelled caller does not cancel it
+        # for every other waiter.
+        return await asyncio.shield(task)
+
+    def _forget_in_flight_get(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight_gets.get(key) is task:
+            del self._in_flight_gets[key]
 
     async def post(
         self,
         endpoint: str,
         req: Dict[str, Any] = None,
         params: Dict[str, Any] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        retry_safe: bool = False,
+        return_errors: bool = False,
     ):
         """Makes a POST request to the specified endpoint.
 
+        POST requests may not be idempotent, so transient failures are only
+        retried when the caller marks the request as safe to repeat.
+
         Args:
             endpoint: The API endpoint to send the request to.
             req: The request body as a dictionary.
             params: Query parameters as a dictionary.
+            timeout: Overrides the configured timeouts for this request.
+            retry_safe: Whether the request can be sent again without side
+                effects, e.g. a search or a read-only action.
+            return_errors: Whether to return an HttpError when SOAR rejects
+                the request or it is never sent, i.e. when SOAR surely did not
+                process it.
 
         Returns:
-            The response as a JSON object, or None if an error occurred.
+            The response as a JSON object, an HttpError if `return_errors` is
+            set and SOAR did not process the request, or None if an error
+            occurred.
         """
-        headers = await self._get_headers()
-        try:
-            async with self._get_session().post(
-                self.base_url + endpoint, json=req, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()
-                data = await response.content.read()
-                decoded_data = data.decode("utf-8")
-                return json.loads(decoded_data)
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
-        except Exception as e:
-            logger.debug("An error occurred: %s", e)
-        return None
+        return await self._request(
+            "POST",
+            endpoint,
+            req=req,
+            params=params,
+            timeout=timeout,
+            retry=retry_safe,
+            return_errors=return_errors,
+        )
 
     async def patch(
         self,
         endpoint: str,
         req: Dict[str, Any] = None,
         params: Dict[str, Any] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
     ):
         """Makes a PATCH request to the specified endpoint.
 
+        Transient failures are retried.
+
         Args:
             endpoint: The API endpoint to send the request to.
             req: The request body as a dictionary.
             params: Query parameters as a dictionary.
+            timeout: Overrides the configured timeouts for this request.
 
         Returns:
             The response as a JSON object, or None if an error occurred.
         """
-        headers = await self._get_headers()
-        try:
-            async with self._get_session().patch(
-                self.base_url + endpoint, json=req, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
-        except Exception as e:
-            logger.debug("An error occurred: %s", e)
-        return None
+        return await self._request(
+            "PATCH", endpoint, req=req, params=params, timeout=timeout, retry=True
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the request counters and circuit breaker state of each
+        endpoint, the rate limiter of each endpoint family, and the response
+        cache counters."""
+        return {
+            "endpoints": {
+                key: self._stats[key].to_dict(breaker)
+                for key, breaker in sorted(self._breakers.items())
+            },
+            "rate_limits": {
+                family: limiter.to_dict()
+                for family, limiter in sorted(self._rate_limiters.items())
+            },
+            "response_cache": (
+                self._response_cache.get_stats()
+                if self._response_cache is not None
+                else None
+            ),
+        }
 
     async def close(self):
         await self._get_session().close()
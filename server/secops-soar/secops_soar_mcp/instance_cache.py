@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process-wide cache of SOAR integration instances."""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient, HttpError
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+# Lower-cased fragments of the error messages SOAR returns when an action
+# references an integration instance that no longer exists.
+INSTANCE_NOT_FOUND_MARKERS = (
+    "instance not found",
+    "instance was not found",
+    "instance does not exist",
+)
+
+
+class IntegrationInstanceCache:
+    """Caches the integration instances configured in SOAR.
+
+    Entries expire after `ttl_seconds`. Concurrent lookups of the same
+    integration share a single in-flight request to SOAR.
+    """
+
+    def __init__(self, http_client: HttpClient, ttl_seconds: float):
+        self._http_client = http_client
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._generations: Dict[str, int] = {}
+
+    async def get_instances(self, integration_name: str) -> List[Dict[str, Any]]:
+        """Returns the instances of an integration, fetching them if needed.
+
+        Args:
+            integration_name: The SOAR identifier of the integration (e.g. "CSV").
+
+        Returns:
+            The list of integration instance objects.
+
+        Raises:
+            RuntimeError: If the instances could not be fetched from SOAR.
+        """
+        entry = self._entries.get(integration_name)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._in_flight.get(integration_name)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(integration_name))
+            self._in_flight[integration_name] = task
+            task.add_done_callback(
+                lambda done: self._forget_in_flight(integration_name, done)
+            )
+        # Shield the shared fetch so a cancelled caller does not cancel it
+        # for every other waiter.
+        return await asyncio.shield(task)
+
+    def invalidate(self, integration_name: Optional[str] = None):
+        """Drops cached instances for one integration, or for all of them."""
+        names = [integration_name] if integration_name else list(self._entries)
+        for name in names:
+            self._entries.pop(name, None)
+            self._in_flight.pop(name, None)
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def invalidate_if_instance_missing(
+        self, integration_name: str, execution_response: Any
+    ) -> bool:
+        """Invalidates an integration if an action failed on a missing instance.
+
+        Only a response, or the body of an HttpError, saying that the instance
+        was not found counts: timeouts, server errors and requests that were
+        never sent (None) say nothing about the instance.
+
+        Returns:
+            True if the cached instances were invalidated.
+        """
+        if isinstance(execution_response, HttpError):
+            execution_response = execution_response.body
+        if execution_response is not None and _mentions_missing_instance(
+            execution_response
+        ):
+            logger.info(
+                "Invalidating cached instances for %s after a failed action.",
+                integration_name,
+            )
+            self.invalidate(integration_name)
+            return True
+        return False
+
+    async def warm_up(self, integration_names: Iterable[str]):
+        """Fetches the instances of the given integrations concurrently."""
+        names = sorted(set(integration_names))
+        if not names:
+            return
+        logger.info("Warming up integration instance cache for: %s", names)
+        results = await asyncio.gather(
+            *(self.get_instances(name) for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to warm up instances for %s: %s", name, result
+                )
+
+    async def _fetch(self, integration_name: str) -> List[Dict[str, Any]]:
+        generation = self._generations.get(integration_name, 0)
+        instance_response = await self._http_client.get(
+            Endpoints.LIST_INTEGRATION_INSTANCES.format(
+                INTEGRATION_NAME=integration_name
+            )
+        )
+        if instance_response is None:
+            raise RuntimeError(
+                f"Failed to list integration instances for {integration_name}"
+            )
+        instances = instance_response.get("integration_instances", [])
+        # Empty results are not cached so that newly configured instances
+        # are picked up on the next call.
+        if instances and generation == self._generations.get(integration_name, 0):
+            self._entries[integration_name] = (
+                time.monotonic() + self._ttl_seconds,
+                instances,
+            )
+        return instances
+
+    def _forget_in_flight(self, integration_name: str, task: asyncio.Task):
+        if self._in_flight.get(integration_name) is task:
+            del self._in_flight[integration_name]
+
+
+def _mentions_missing_instance(execution_response: Any) -> bool:
+    text = str(execution_response).lower()
+    return any(marker in text for marker in INSTANCE_NOT_FOUND_MARKERS)
@@ -0,0 +1,127 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Selection of the integration instance an action runs on."""
+
+import contextlib
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+
+FIRST = "first"
+ROUND_ROBIN = "round_robin"
+LEAST_IN_FLIGHT = "least_in_flight"
+ENVIRONMENT = "environment"
+POLICIES = (FIRST, ROUND_ROBIN, LEAST_IN_FLIGHT, ENVIRONMENT)
+
+
+class InstanceSelector:
+    """Orders the instances of an integration for an action to run on.
+
+    The first instance returned by `order` is the one to use; the others are
+    failover candidates, tried in order if it fails. Instances that failed
+    within the last `failure_cooldown` seconds are ordered last.
+
+    Policies:
+        first: The first instance listed by SOAR.
+        round_robin: Each instance in turn.
+        least_in_flight: The instance running the fewest actions.
+        environment: The instances of the case's environment, then those
+            without an environment, each in turn. Instances of other
+            environments are only used if no other instance exists.
+    """
+
+    def __init__(self, policy: str, failure_cooldown: float):
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown instance selection policy '{policy}'. "
+                f"Allowed values are: {', '.join(POLICIES)}"
+            )
+        self.policy = policy
+        self._failure_cooldown = failure_cooldown
+        self._turns: Counter = Counter()
+        self._in_flight: Counter = Counter()
+        self._failed_until: Dict[str, float] = {}
+
+    def order(
+        self,
+        integration_name: str,
+        instances: List[Dict[str, Any]],
+        environment: Optional[str] = None,
+    ) -> List[str]:
+        """Returns the instance identifiers to try, best first."""
+        identifiers = [
+            instance["identifier"] for instance in instances if instance.get("identifier")
+        ]
+        if self.policy == ROUND_ROBIN:
+            identifiers = self._rotate(integration_name, identifiers)
+        elif self.policy == LEAST_IN_FLIGHT:
+            identifiers.sort(key=lambda identifier: self._in_flight[identifier])
+        elif self.policy == ENVIRONMENT:
+            identifiers = self._by_environment(integration_name, instances, environment)
+        now = time.monotonic()
+        # A stable sort keeps the policy's order within both groups.
+        identifiers.sort(
+            key=lambda identifier: self._failed_until.get(identifier, 0) > now
+        )
+        return identifiers
+
+    @contextlib.contextmanager
+    def track(self, instance_identifier: str) -> Iterator[None]:
+        """Counts an action as in flight on an instance while in the block."""
+        self._in_flight[instance_identifier] += 1
+        try:
+            yield
+        finally:
+            self._in_flight[instance_identifier] -= 1
+            if not self._in_flight[instance_identifier]:
+                del self._in_flight[instance_identifier]
+
+    def report_failure(self, instance_identifier: str):
+        self._failed_until[instance_identifier] = (
+            time.monotonic() + self._failure_cooldown
+        )
+
+    def report_success(self, instance_identifier: str):
+        self._failed_until.pop(instance_identifier, None)
+
+    def _rotate(self, key: str, identifiers: List[str]) -> List[str]:
+        if not identifiers:
+            return identifiers
+        start = self._turns[key] % len(identifiers)
+        self._turns[key] += 1
+        return identifiers[start:] + identifiers[:start]
+
+    def _by_environment(
+        self,
+        integration_name: str,
+        instances: List[Dict[str, Any]],
+        environment: Optional[str],
+    ) -> List[str]:
+        matching, shared, other = [], [], []
+        for instance in instances:
+            identifier = instance.get("identifier")
+            if not identifier:
+                continue
+            instance_environment = instance.get("environment")
+            if not instance_environment:
+                shared.append(identifier)
+            elif environment and instance_environment.lower() == environment.lower():
+                matching.append(identifier)
+            else:
+                other.append(identifier)
+        if not matching and not shared:
+            return self._rotate(integration_name, other)
+        return self._rotate(
+            f"{integration_name}/{environment}", matching
+        ) + self._rotate(integration_name, shared)
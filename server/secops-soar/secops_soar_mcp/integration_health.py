@@ -0,0 +1,223 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Connectivity checks of the enabled marketplace integrations."""
+
+import asyncio
+import datetime
+import os
+import time
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from logger_utils import get_logger
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field, ValidationError
+from secops_soar_mcp import actions, bindings, marketplace_tools
+from secops_soar_mcp.case_entities import list_alert_group_identifiers
+from secops_soar_mcp.utils import consts
+from secops_soar_mcp.utils.utils import normalize_integration_name
+
+logger = get_logger(__name__)
+
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+SKIPPED = "skipped"
+
+# Latest Ping result of each integration, by normalized name, with the
+# monotonic time it was checked at.
+_results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cache_ttl() -> float:
+    return float(
+        os.getenv(
+            consts.ENV_SOAR_PING_CACHE_TTL_SECONDS,
+            consts.DEFAULT_PING_CACHE_TTL_SECONDS,
+        )
+    )
+
+
+async def ping_integration(
+    tool_name: str, case_id: str, alert_group_identifiers: List[str]
+) -> Dict[str, Any]:
+    """Runs the Ping action of an integration.
+
+    Returns:
+        The integration's "status" (healthy, unhealthy, or skipped when its
+        Ping action needs parameters), "latency_ms", "checked_at", and a
+        "message" unless healthy.
+    """
+    checked_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    found = marketplace_tools.find_action(tool_name)
+    if found is None:
+        return {"status": SKIPPED, "checked_at": checked_at, "message": "Unknown tool."}
+    integration_name, action = found
+    try:
+        arguments = marketplace_tools.validate_action_arguments(action, {})
+    except ValidationError:
+        return {
+            "status": SKIPPED,
+            "checked_at": checked_at,
+            "message": f"The Ping action requires parameters; run {tool_name} instead.",
+        }
+    started = time.monotonic()
+    response = await actions.execute_manual_action(
+        integration_name,
+        action.action_name,
+        case_id=case_id,
+        alert_group_identifiers=alert_group_identifiers,
+        script_params=marketplace_tools.build_script_params(action, arguments),
+        scope=marketplace_tools.DEFAULT_SCOPE,
+        retry_safe=action.retry_safe,
+    )
+    result = {
+        "status": UNHEALTHY if actions.is_failure(response) else HEALTHY,
+        "latency_ms": round((time.monotonic() - started) * 1000),
+        "checked_at": checked_at,
+    }
+    if result["status"] == UNHEALTHY:
+        result["message"] = (
+            response.get("Message")
+            if isinstance(response, dict) and response.get("Message")
+            else "The Ping request to SOAR failed."
+        )
+    return result
+
+
+def register_tools(mcp: FastMCP):
+    @mcp.tool()
+    async def ping_integrations(
+        case_id: Annotated[
+            str,
+            Field(
+                ...,
+                description="The ID of a case to run the Ping actions in; SOAR runs actions within a case.",
+            ),
+        ],
+        integrations: Annotated[
+            Optional[List[str]],
+            Field(
+                default=None,
+                description="The integrations to check (e.g. CSV, VirusTotalV3). Defaults to every enabled integration.",
+            ),
+        ],
+        refresh: Annotated[
+            bool,
+            Field(
+                default=False,
+                description="Ping every integration again, ignoring recent results.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=10,
+                ge=1,
+                le=50,
+                description="Maximum number of Ping actions running at the same time.",
+            ),
+        ],
+    ) -> dict:
+        """Check the connectivity of all enabled marketplace integrations at once.
+
+        Runs the Ping action of every enabled integration (or of the given ones) concurrently,
+        instead of calling each integration's Ping tool separately, and returns a health matrix.
+        Results are reused for a few minutes (SOAR_PING_CACHE_TTL_SECONDS), so repeated checks are
+        answered without running the actions again unless `refresh` is set.
+
+        Args:
+            case_id (str): A case to run the Ping actions in, as SOAR executes actions within a case.
+                           The actions do not change the case, but appear in its activity.
+            integrations (Optional[List[str]]): The integrations to check. Defaults to all of them.
+            refresh (bool): Whether to ignore recent results.
+            max_concurrency (int): How many Ping actions may run concurrently.
+
+        Returns:
+            dict: A dictionary containing:
+                  - 'healthy', 'unhealthy', 'skipped': The number of integrations in each state.
+                  - 'integrations': For each integration, its 'status' ("healthy", "unhealthy", or
+                    "skipped" when its Ping action needs parameters or the integration is not
+                    enabled), the Ping 'latency_ms', 'checked_at', whether the result was 'cached',
+                    and a 'message' explaining failures.
+                  If the case's alert groups cannot be listed, a dictionary with a "Failed" Status
+                  and a Message.
+
+        **Workflow Integration:**
+        - Use before running integration actions, or when they fail, to see which integrations are
+          reachable and correctly configured.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Avoid actions of unhealthy integrations, or check their instance configuration in SOAR.
+        """
+        ping_tools = marketplace_tools.list_ping_tools()
+        if integrations is None:
+            selected = {name: name for name in ping_tools}
+        else:
+            selected = {
+                normalize_integration_name(name): name for name in integrations
+            }
+        matrix: Dict[str, Dict[str, Any]] = {}
+        to_ping = []
+        ttl = _cache_ttl()
+        now = time.monotonic()
+        for normalized, name in selected.items():
+            tool_name = ping_tools.get(normalized)
+            if tool_name is None:
+                matrix[name] = {
+                    "status": SKIPPED,
+                    "message": "The integration is not enabled or has no Ping action.",
+                }
+                continue
+            cached = _results.get(normalized)
+            if not refresh and cached is not None and now - cached[0] < ttl:
+                matrix[name] = {**cached[1], "cached": True}
+            else:
+                to_ping.append((normalized, name, tool_name))
+
+        if to_ping:
+            alert_group_identifiers = await list_alert_group_identifiers(
+                bindings.http_client, case_id
+            )
+            if alert_group_identifiers is None:
+                return {
+                    "Status": "Failed",
+                    "Message": f"Failed to list the alert groups of case {case_id}.",
+                }
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def ping(tool_name: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await ping_integration(
+                        tool_name, case_id, alert_group_identifiers
+                    )
+
+            results = await asyncio.gather(
+                *(ping(tool_name) for _, _, tool_name in to_ping),
+                return_exceptions=True,
+            )
+            for (normalized, name, tool_name), result in zip(to_ping, results):
+                if isinstance(result, Exception):
+                    logger.error("Error running %s: %s", tool_name, result)
+                    result = {
+                        "status": UNHEALTHY,
+                        "message": f"Error running the Ping action: {result}",
+                    }
+                elif result["status"] != SKIPPED:
+                    _results[normalized] = (time.monotonic(), result)
+                matrix[name] = {**result, "cached": False}
+
+        counts = {
+            status: sum(1 for entry in matrix.values() if entry["status"] == status)
+            for status in (HEALTHY, UNHEALTHY, SKIPPED)
+        }
+        return {**counts, "integrations": dict(sorted(matrix.items()))}
@@ -0,0 +1,177 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tracking of work running in the background of the server."""
+
+import asyncio
+import collections
+import datetime
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class Job:
+    """A unit of background work and its outcome."""
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, job_id: str, details: Dict[str, Any]):
+        self.job_id = job_id
+        self.details = details
+        self.status = Job.RUNNING
+        self.result: Any = None
+        self.message: Optional[str] = None
+        self.submitted_at = datetime.datetime.now(datetime.timezone.utc)
+        self._started = time.monotonic()
+        self.duration: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status != Job.RUNNING
+
+    def finish(self, status: str, result: Any = None, message: Optional[str] = None):
+        self.status = status
+        self.result = result
+        self.message = message
+        self.duration = time.monotonic() - self._started
+
+    def to_dict(self) -> Dict[str, Any]:
+        job = {
+            "job_id": self.job_id,
+            **self.details,
+            "status": self.status,
+            "submitted_at": self.submitted_at.isoformat(),
+            "duration_seconds": round(
+                self.duration
+                if self.duration is not None
+                else time.monotonic() - self._started,
+                3,
+            ),
+        }
+        if self.status == Job.SUCCEEDED:
+            job["result"] = self.result
+        elif self.message is not None:
+            job["message"] = self.message
+        return job
+
+
+class JobTracker:
+    """Runs jobs as background tasks and keeps their outcomes.
+
+    Finished jobs are kept until `max_finished_jobs` newer jobs have
+    finished, so that their results can still be collected.
+    """
+
+    def __init__(self, max_finished_jobs: int):
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, Job] = {}
+        self._finished: "collections.deque[str]" = collections.deque()
+
+    def submit(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        details: Dict[str, Any],
+        is_failure: Callable[[Any], bool],
+    ) -> Job:
+        """Starts a job.
+
+        Args:
+            run: Returns the awaitable doing the work of the job.
+            details: Describes the job in its reports.
+            is_failure: Tells whether the result of `run` reports a failure.
+
+        Returns:
+            The running job.
+        """
+        job = Job(uuid.uuid4().hex, details)
+        self._jobs[job.job_id] = job
+        job.task = asyncio.ensure_future(self._run(job, run, is_failure))
+        return job
+
+    async def _run(
+        self,
+        job: Job,
+        run: Callable[[], Awaitable[Any]],
+        is_failure: Callable[[Any], bool],
+    ):
+        try:
+            result = await run()
+        except asyncio.CancelledError:
+            job.finish(Job.CANCELLED, message="The job was cancelled.")
+            raise
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.job_id, e)
+            job.finish(Job.FAILED, message=f"Error running job: {e}")
+        else:
+            if is_failure(result):
+                job.finish(Job.FAILED, result=result, message=_failure_message(result))
+            else:
+                job.finish(Job.SUCCEEDED, result=result)
+        finally:
+            self._retire(job)
+
+    def _retire(self, job: Job):
+        self._finished.append(job.job_id)
+        while len(self._finished) > self._max_finished_jobs:
+            self._jobs.pop(self._finished.popleft(), None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def running(self) -> List[Job]:
+        return [job for job in self._jobs.values() if not job.done]
+
+    async def wait(
+        self, jobs: List[Job], timeout: float, wait_for_all: bool
+    ) -> List[Job]:
+        """Waits until one or all of the jobs finish, or the timeout expires.
+
+        Returns:
+            The jobs that finished.
+        """
+        pending = {job.task for job in jobs if not job.done}
+        if pending and timeout > 0:
+            await asyncio.wait(
+                pending,
+                timeout=timeout,
+                return_when=(
+                    asyncio.ALL_COMPLETED if wait_for_all else asyncio.FIRST_COMPLETED
+                ),
+            )
+        return [job for job in jobs if job.done]
+
+    async def close(self):
+        """Cancels the running jobs."""
+        tasks = [job.task for job in self.running()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            if not job.done:
+                # Cancelled before it started running.
+                job.finish(Job.CANCELLED, message="The job was cancelled.")
+
+
+def _failure_message(result: Any) -> str:
+    if isinstance(result, dict) and result.get("Message"):
+        return result["Message"]
+    return "The request to SOAR failed."
@@ -10,4 +10,76 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
-# limitations under the License.
\ No newline at end of file
+# limitations under the License.
+"""Manifests describing the actions of the SOAR marketplace integrations.
+
+Every `<integration>.json` file in this package describes one integration: its
+SOAR identifier and, for each of its actions, the MCP tool name, the SOAR
+action name, a description, the typed action parameters and whether the action
+is read-only, so that it can safely be retried. A manifest is only
+read once its integration is enabled.
+"""
+
+import functools
+from pathlib import Path
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel
+
+MANIFEST_DIR = Path(__file__).parent.resolve()
+MANIFEST_SUFFIX = ".json"
+
+ParameterType = Literal["string", "boolean", "string_list", "json", "email_content"]
+
+
+class ActionParameter(BaseModel):
+    """A parameter of a marketplace action."""
+
+    name: str
+    script_name: str
+    type: ParameterType
+    required: bool
+    description: str
+
+
+class ActionManifest(BaseModel):
+    """A marketplace action exposed as an MCP tool."""
+
+    tool_name: str
+    action_name: str
+    description: str
+    # Whether running the action again has no side effects (e.g. Ping), so a
+    # request that failed transiently can be retried.
+    retry_safe: bool = False
+    parameters: List[ActionParameter]
+
+
+class IntegrationManifest(BaseModel):
+    """All actions of a marketplace integration."""
+
+    integration: str
+    actions: List[ActionManifest]
+
+
+def available_integrations() -> Dict[str, Path]:
+    """Maps normalized integration names to their manifest files."""
+    return {
+        path.stem: path for path in sorted(MANIFEST_DIR.glob("*" + MANIFEST_SUFFIX))
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def load_manifest(integration: str) -> IntegrationManifest:
+    """Loads the manifest of an integration.
+
+    Args:
+        integration: The normalized integration name (e.g. "csv").
+
+    Returns:
+        The parsed integration manifest.
+
+    Raises:
+        FileNotFoundError: If there is no manifest for the integration.
+    """
+    path = MANIFEST_DIR / f"{integration}{MANIFEST_SUFFIX}"
+    return IntegrationManifest.model_validate_json(path.read_bytes())
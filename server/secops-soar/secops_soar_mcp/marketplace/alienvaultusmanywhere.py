@@ -1,262 +0,0 @@
-# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#      https://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
-from secops_soar_mcp.utils.consts import Endpoints
-from secops_soar_mcp.utils.models import ApiManualActionDataModel, EmailContent, TargetEntity
-import json
-from typing import Optional, List, Dict, Union, Annotated
-from pydantic import Field
-from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
-
-
-def register_tools(mcp: FastMCP):
-    # This function registers all tools (actions) for the AlienVaultAnywhere integration.
-
-    @mcp.tool()
-    async def alien_vault_anywhere_get_alarm_details(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], alarm_id: Annotated[str, Field(..., description="The alarm ID. Can be obtained by running connector.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Retrieve details for an alarm by ID
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AlienVaultAnywhere")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AlienVaultAnywhere: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Alarm ID"] = alarm_id
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AlienVaultAnywhere_Get Alarm Details",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AlienVaultAnywhere_Get Alarm Details",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AlienVaultAnywhere_Get Alarm Details for AlienVaultAnywhere: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AlienVaultAnywhere")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def alien_vault_anywhere_ping(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Test connectivity
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AlienVaultAnywhere")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AlienVaultAnywhere: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AlienVaultAnywhere_Ping",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AlienVaultAnywhere_Ping",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AlienVaultAnywhere_Ping for AlienVaultAnywhere: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AlienVaultAnywhere")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def alien_vault_anywhere_list_events(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], account_name: Annotated[str, Field(default=None, description="The account name.")], event_name: Annotated[str, Field(default=None, description="The name of the event.")], source_name: Annotated[str, Field(default=None, description="The source name.")], start_time: Annotated[str, Field(default=None, description="Filtered results will include events that occurred after this timestamp. format: DD/MM/YYYY")], end_time: Annotated[str, Field(default=None, description="Filtered results will include events that occurred before this timestamp. format: DD/MM/YYYY")], suppressed: Annotated[bool, Field(default=None, description="Whether to filter events by the suppressed flag.")], events_limit: Annotated[str, Field(default=None, description="Maximum number of events to return.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Search for AlienVault events.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AlienVaultAnywhere")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AlienVaultAnywhere: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if account_name is not None:
-                script_params["Account Name"] = account_name
-            if event_name is not None:
-                script_params["Event Name"] = event_name
-            if source_name is not None:
-                script_params["Source Name"] = source_name
-            if start_time is not None:
-                script_params["Start Time"] = start_time
-            if end_time is not None:
-                script_params["End Time"] = end_time
-            if suppressed is not None:
-                script_params["Suppressed"] = suppressed
-            if events_limit is not None:
-                script_params["Events Limit"] = events_limit
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AlienVaultAnywhere_List Events",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AlienVaultAnywhere_List Events",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AlienVaultAnywhere_List Events for AlienVaultAnywhere: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AlienVaultAnywhere")
-            return {"Status": "Failed", "Message": "No active instance found."}
@@ -1,569 +0,0 @@
-# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#      https://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
-from secops_soar_mcp.utils.consts import Endpoints
-from secops_soar_mcp.utils.models import ApiManualActionDataModel, EmailContent, TargetEntity
-import json
-from typing import Optional, List, Dict, Union, Annotated
-from pydantic import Field
-from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
-
-
-def register_tools(mcp: FastMCP):
-    # This function registers all tools (actions) for the AmazonMacie integration.
-
-    @mcp.tool()
-    async def amazon_macie_get_findings(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], finding_id: Annotated[str, Field(..., description="Finding ID to get details for. Parameter can take multiple values as a comma separated string.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Get Amazon Macie findings based on specified Finding ID. Note: Action is not working with Siemplify Entities.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Finding ID"] = finding_id
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Get Findings",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Get Findings",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Get Findings for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_list_findings(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], finding_type: Annotated[str, Field(default=None, description="Finding type to search for, for example SensitiveData:S3Object/Credentials or SensitiveData:S3Object/Multiple. Parameter accepts multiple values as a comma separated string. If nothing is specified - return all types of findings.")], time_frame: Annotated[str, Field(default=None, description="Specify a time frame in hours for which to fetch findings.")], severity: Annotated[str, Field(default=None, description="Finding severity to search - High, Medium or Low. Parameter accepts multiple values as a comma separated string. If nothing is specified - return all findings regardless of severity.")], include_archived_findings: Annotated[bool, Field(default=None, description="Specify whether to include archived findings in results or not.")], record_limit: Annotated[str, Field(default=None, description="Specify how many records can be returned by the action.")], sort_by: Annotated[str, Field(default=None, description="Specify a parameter for sorting the data, eg updatedAt")], sort_order: Annotated[List[str], Field(default=None, description="Sort order.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """List Amazon Macie findings based on the specified action input parameters.  Note: Action is not working with Siemplify entities, only with action input parameters.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if finding_type is not None:
-                script_params["Finding Type"] = finding_type
-            if time_frame is not None:
-                script_params["Time Frame"] = time_frame
-            if severity is not None:
-                script_params["Severity"] = severity
-            if include_archived_findings is not None:
-                script_params["Include Archived Findings?"] = include_archived_findings
-            if record_limit is not None:
-                script_params["Record Limit"] = record_limit
-            if sort_by is not None:
-                script_params["Sort By"] = sort_by
-            if sort_order is not None:
-                script_params["Sort Order"] = sort_order
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_List Findings",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_List Findings",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_List Findings for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_delete_custom_data_identifier(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], custom_data_identifier_id: Annotated[str, Field(..., description="Amazon Macie custom data identifier id to delete.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Delete Amazon Macie Custom Data Identifier. Note: Action is not working with Siemplify Entities.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Custom Data Identifier ID"] = custom_data_identifier_id
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Delete Custom Data Identifier",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Delete Custom Data Identifier",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Delete Custom Data Identifier for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_disable_macie(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Disable Amazon Macie service. Note: Action is not working with Siemplify Entities.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Disable Macie",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Disable Macie",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Disable Macie for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_ping(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Test connectivity to the Amazon Macie service with parameters provided at the integration configuration page on the Marketplace tab.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Ping",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Ping",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Ping for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_enable_macie(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Enable Amazon Macie service. Note: Action is not working with Siemplify Entities.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Enable Macie",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Enable Macie",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Enable Macie for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def amazon_macie_create_custom_data_identifier(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], custom_data_identifier_name: Annotated[str, Field(..., description="Amazon Macie new custom data identifier name.")], custom_data_identifier_regular_expression: Annotated[str, Field(..., description="Amazon Macie new custom data identifier regular expression, eg I[a@]mAB[a@]dRequest")], custom_data_identifier_description: Annotated[str, Field(default=None, description="Amazon Macie new custom data identifier description.")], custom_data_identifier_keywords: Annotated[str, Field(default=None, description="Amazon Macie new custom data identifier keywords.")], custom_data_identifier_ignore_words: Annotated[str, Field(default=None, description="Amazon Macie new custom data identifier ignore words.")], custom_data_identifier_maximum_match_distance: Annotated[str, Field(default=None, description="Amazon Macie new custom data identifier maximum match distance. Default value is 50.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Create Amazon Macie Custom Data Identifier. Note: Action is not working with Siemplify Entities.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="AmazonMacie")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for AmazonMacie: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Custom Data Identifier Name"] = custom_data_identifier_name
-            if custom_data_identifier_description is not None:
-                script_params["Custom Data Identifier Description"] = custom_data_identifier_description
-            script_params["Custom Data Identifier Regular Expression"] = custom_data_identifier_regular_expression
-            if custom_data_identifier_keywords is not None:
-                script_params["Custom Data Identifier Keywords"] = custom_data_identifier_keywords
-            if custom_data_identifier_ignore_words is not None:
-                script_params["Custom Data Identifier Ignore Words"] = custom_data_identifier_ignore_words
-            if custom_data_identifier_maximum_match_distance is not None:
-                script_params["Custom Data Identifier Maximum Match Distance"] = custom_data_identifier_maximum_match_distance
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="AmazonMacie_Create Custom Data Identifier",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "AmazonMacie_Create Custom Data Identifier",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action AmazonMacie_Create Custom Data Identifier for AmazonMacie: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for AmazonMacie")
-            return {"Status": "Failed", "Message": "No active instance found."}
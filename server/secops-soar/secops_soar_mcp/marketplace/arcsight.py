@@ -1,832 +0,0 @@
-# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#      https://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
-from secops_soar_mcp.utils.consts import Endpoints
-from secops_soar_mcp.utils.models import ApiManualActionDataModel, EmailContent, TargetEntity
-import json
-from typing import Optional, List, Dict, Union, Annotated
-from pydantic import Field
-from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
-
-
-def register_tools(mcp: FastMCP):
-    # This function registers all tools (actions) for the Arcsight integration.
-
-    @mcp.tool()
-    async def arcsight_search(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], search_query: Annotated[str, Field(..., description="Specify the search query.")], max_items_to_return: Annotated[str, Field(default=None, description="Specify how many items to return in the response.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Search for available resources in ArcSight
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Search Query"] = search_query
-            if max_items_to_return is not None:
-                script_params["Max Items To Return"] = max_items_to_return
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Search",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Search",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Search for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_get_report(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], report_full_path_uri: Annotated[str, Field(..., description="Specify the URI to the report. Example: /All Reports/ArcSight Foundation/MITRE ATT&CK/Mitre ATT&CK Summary")], field_2: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_3: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_4: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_5: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_6: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_7: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_8: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_9: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], field_10: Annotated[str, Field(default=None, description="The dynamic fields for the query to generate the report")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Get details about report in ArcSight.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Report Full Path (URI)"] = report_full_path_uri
-            if field_2 is not None:
-                script_params["Field 2"] = field_2
-            if field_3 is not None:
-                script_params["Field 3"] = field_3
-            if field_4 is not None:
-                script_params["Field 4"] = field_4
-            if field_5 is not None:
-                script_params["Field 5"] = field_5
-            if field_6 is not None:
-                script_params["Field 6"] = field_6
-            if field_7 is not None:
-                script_params["Field 7"] = field_7
-            if field_8 is not None:
-                script_params["Field 8"] = field_8
-            if field_9 is not None:
-                script_params["Field 9"] = field_9
-            if field_10 is not None:
-                script_params["Field 10"] = field_10
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Get Report",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Get Report",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Get Report for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_add_entities_to_active_list(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], active_list_name: Annotated[str, Field(..., description="Specify the name of the active list to which you want to add entities.")], entity_column: Annotated[str, Field(..., description="Specify the name of the column, where entity value should be put.")], additional_fields: Annotated[str, Field(default=None, description="Specify additional fields that should be added alongside the entity in the active list. Format is a JSON object. Example: {\"Column_1\": \"Value_1\",\"Column_2\": \"Value_2\"}")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Add entities to the active list in ArcSight.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Active List Name"] = active_list_name
-            script_params["Entity Column"] = entity_column
-            if additional_fields is not None:
-                script_params["Additional Fields"] = additional_fields
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Add Entities To Active List",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Add Entities To Active List",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Add Entities To Active List for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_get_activelist_entries(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], active_list_uuid: Annotated[str, Field(default=None, description="Specify the UUID of the active list for which you want to retrieve entries. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c. Example: HLZRc9yYBABC-lHtlf3-f0Q==")], active_list_name: Annotated[str, Field(default=None, description="Specify the name of the active list for which you want to retrieve entries. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c.")], map_columns: Annotated[bool, Field(default=None, description="If enabled, action will map columns to the values in the JSON result.")], max_entries_to_return: Annotated[str, Field(default=None, description="Specify how many entries to return.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Retrieve active list entries in ArcSight
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if active_list_uuid is not None:
-                script_params["Active list UUID"] = active_list_uuid
-            if active_list_name is not None:
-                script_params["Active list name"] = active_list_name
-            if map_columns is not None:
-                script_params["Map Columns"] = map_columns
-            if max_entries_to_return is not None:
-                script_params["Max Entries To Return"] = max_entries_to_return
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Get Activelist Entries",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Get Activelist Entries",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Get Activelist Entries for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_change_case_stage(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], case_name: Annotated[str, Field(..., description="Specify the name of the case for which you want to update the stage.")], stage: Annotated[str, Field(..., description="Specify a new stage for the case. Possible values: INITIAL, QUEUED, CLOSED, FINAL, and FOLLOW_UP.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Update the stage of the case in ArcSight.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Case Name"] = case_name
-            script_params["Stage"] = stage
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Change Case Stage",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Change Case Stage",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Change Case Stage for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_ping(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Test Connectivity
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Ping",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Ping",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Ping for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_get_query_results(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], query_id: Annotated[str, Field(default=None, description="Specify the ID of the query for which you want to return results. Note: parameter \u201cQuery ID\u201c takes priority over \u201cQuery Name\u201c. Example: cyUJKRz4BABCFwS9iFPq+aA==")], max_items_to_return: Annotated[str, Field(default=None, description="Specify how many items to return in the response.")], query_name: Annotated[str, Field(default=None, description="Specify the name of the query for which you want to return results. Note: parameter \u201cQuery ID\u201c takes priority over \u201cQuery Name\u201c.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Get results for the provided query in ArcSight
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if query_id is not None:
-                script_params["Query ID"] = query_id
-            if max_items_to_return is not None:
-                script_params["Max Items To Return"] = max_items_to_return
-            if query_name is not None:
-                script_params["Query Name"] = query_name
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Get Query Results",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Get Query Results",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Get Query Results for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_list_resources(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], return_active_lists: Annotated[bool, Field(default=None, description="If enabled, action will return available active lists.")], return_queries: Annotated[bool, Field(default=None, description="If enabled, action will return available queries")], return_cases: Annotated[bool, Field(default=None, description="If enabled, action will return available cases.")], return_reports: Annotated[bool, Field(default=None, description="If enabled, action will return available reports.")], max_resources_to_return: Annotated[str, Field(default=None, description="Specify how many resources to return per type.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """List available queries in ArcSight.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if return_active_lists is not None:
-                script_params["Return Active Lists"] = return_active_lists
-            if return_queries is not None:
-                script_params["Return Queries"] = return_queries
-            if return_cases is not None:
-                script_params["Return Cases"] = return_cases
-            if return_reports is not None:
-                script_params["Return Reports"] = return_reports
-            if max_resources_to_return is not None:
-                script_params["Max Resources To Return"] = max_resources_to_return
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_List Resources",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_List Resources",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_List Resources for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_add_entries_to_activelist(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], columns: Annotated[str, Field(default=None, description="Specify the name of the columns, where you want to put values for the entries. Format: Column_name1;Column_name2")], entries: Annotated[str, Field(default=None, description="Specify the entries. Format entry1_value1|entry1_value2;entry2_value1|entry2_value2")], active_list_uuid: Annotated[str, Field(default=None, description="Specify the UUID of the active list, where you want to add new entries. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c. Example: HLZRc9yYBABC-lHtlf3-f0Q==")], active_list_name: Annotated[str, Field(default=None, description="Specify the name of the active list, where you want to add new entries. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c.")], entries_json: Annotated[Union[str, dict], Field(default=None, description="Specify a list of JSON objects that contain information about the entry. Note: Combination of \u2018Columns' and \u2018Entries\u2019 parameters have priority over 'Entries JSON\u2019. Format: [{\"Column_1\": \"Value_1\", \"Column_2\": \"Value_2\"}, {\"Column_1\": \"Value_3\", \"Column_2\": \"Value_4\"}]")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Add new entry to active list in ArcSight. Column values are separated by delimiter ‘|' and entries are separated by ‘;’ in parameter ‘Entries’. Column names are separated by delimiter ‘;’ in parameter ‘Columns’. You can also use Entries JSON instead of ‘Columns’ + 'Entries’“.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if columns is not None:
-                script_params["Columns"] = columns
-            if entries is not None:
-                script_params["Entries"] = entries
-            if active_list_uuid is not None:
-                script_params["Active List UUID"] = active_list_uuid
-            if active_list_name is not None:
-                script_params["Active list name"] = active_list_name
-            if entries_json is not None:
-                script_params["Entries JSON"] = entries_json
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Add Entries To Activelist",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Add Entries To Activelist",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Add Entries To Activelist for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arcsight_is_value_in_activelist_column(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], column_name: Annotated[str, Field(..., description="Specify the name of the column, where you want to search for the entity.")], active_list_uuid: Annotated[str, Field(default=None, description="Specify the UUID of the active list, where you want to search for entities. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c. Example: HLZRc9yYBABC-lHtlf3-f0Q==")], active_list_name: Annotated[str, Field(default=None, description="Specify the name of the active list, where you want to search for entities. Note: parameter \u201cActive list UUID\u201c takes priority over \u201cActive list name\u201c.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Action checks, if entities were found in ArcSight Activelist
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="Arcsight")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for Arcsight: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            if active_list_uuid is not None:
-                script_params["Active list UUID"] = active_list_uuid
-            script_params["Column name"] = column_name
-            if active_list_name is not None:
-                script_params["Active list name"] = active_list_name
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="Arcsight_Is Value In Activelist Column",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "Arcsight_Is Value In Activelist Column",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action Arcsight_Is Value In Activelist Column for Arcsight: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for Arcsight")
-            return {"Status": "Failed", "Message": "No active instance found."}
@@ -1,188 +0,0 @@
-# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#      https://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
-from secops_soar_mcp.utils.consts import Endpoints
-from secops_soar_mcp.utils.models import ApiManualActionDataModel, EmailContent, TargetEntity
-import json
-from typing import Optional, List, Dict, Union, Annotated
-from pydantic import Field
-from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
-
-
-def register_tools(mcp: FastMCP):
-    # This function registers all tools (actions) for the ArcSightLogger integration.
-
-    @mcp.tool()
-    async def arc_sight_logger_send_query(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], query: Annotated[str, Field(..., description="Specify the query to send to ArcSight Logger event search.")], max_events_to_return: Annotated[str, Field(default=None, description="Specify the amount of events to return. Limit is 10000. This is ArcSight Logger limitation.")], time_frame: Annotated[str, Field(default=None, description="Specify the time frame which will be used to fetch events. \nPossible values:\n1m - 1 minute ago\n1h - 1 hour ago\n1d - 1 day ago\nNote: You can\u2019t combine different values, like 1d2h30m.")], fields_to_fetch: Annotated[str, Field(default=None, description="Specify what fields to fetch from ArcSight Logger. If nothing is specified, then all of the available fields will be returned.")], include_raw_event_data: Annotated[bool, Field(default=None, description="If enabled, raw event data is included in the response.")], local_search_only: Annotated[bool, Field(default=None, description="Indicates that ArcSight Logger event search is local only, and does not include ArcSight Logger peers. Set to false if you want to include peers in the event search.")], discover_fields: Annotated[bool, Field(default=None, description="Indicates that the ArcSight Logger search should try to discover fields in the events found.")], sort: Annotated[str, Field(default=None, description="Specify what sorting method to use.\nPossible values:\nascending\ndescending")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Send a query to get information about related events from ArcSight Logger event log manager.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="ArcSightLogger")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for ArcSightLogger: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-            script_params["Query"] = query
-            if max_events_to_return is not None:
-                script_params["Max Events to Return"] = max_events_to_return
-            if time_frame is not None:
-                script_params["Time Frame"] = time_frame
-            if fields_to_fetch is not None:
-                script_params["Fields to Fetch"] = fields_to_fetch
-            if include_raw_event_data is not None:
-                script_params["Include Raw Event Data"] = include_raw_event_data
-            if local_search_only is not None:
-                script_params["Local Search Only"] = local_search_only
-            if discover_fields is not None:
-                script_params["Discover Fields"] = discover_fields
-            if sort is not None:
-                script_params["Sort"] = sort
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="ArcSightLogger_Send Query",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "ArcSightLogger_Send Query",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action ArcSightLogger_Send Query for ArcSightLogger: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for ArcSightLogger")
-            return {"Status": "Failed", "Message": "No active instance found."}
-
-    @mcp.tool()
-    async def arc_sight_logger_ping(case_id: Annotated[str, Field(..., description="The ID of the case.")], alert_group_identifiers: Annotated[List[str], Field(..., description="Identifiers for the alert groups.")], target_entities: Annotated[List[TargetEntity], PydanticListField(TargetEntity, description="Optional list of specific target entities (Identifier, EntityType) to run the action on.")], scope: Annotated[str, Field(default="All entities", description="Defines the scope for the action.")]) -> dict:
-        """Test connectivity to ArcSight Logger with parameters provided at the integration configuration page on Marketplace tab.
-
-        Returns:
-            dict: A dictionary containing the result of the action execution.
-        """
-        final_target_entities: Optional[List[TargetEntity]] = None
-        final_scope: Optional[str] = None
-        is_predefined_scope: Optional[bool] = None
-    
-        if target_entities:
-            # Specific target entities provided, ignore scope parameter
-            final_target_entities = target_entities
-            final_scope = None
-            is_predefined_scope = False
-        else:
-            # Check if the provided scope is valid
-            if scope not in bindings.valid_scopes:
-                allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
-                return {
-                    "Status": "Failed",
-                    "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
-                }
-            final_target_entities = [] # Pass empty list for entities when using scope
-            final_scope = scope
-            is_predefined_scope = True
-    
-        # Fetch integration instance identifier
-        try:
-            instance_response = await bindings.http_client.get(
-                Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME="ArcSightLogger")
-            )
-            instances = instance_response.get("integration_instances", [])
-        except Exception as e:
-            print(f"Error fetching instance for ArcSightLogger: {e}")
-            return {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
-    
-        if instances:
-            instance_identifier = instances[0].get("identifier")
-            if not instance_identifier:
-                return {"Status": "Failed", "Message": "Instance found but identifier is missing."}
-    
-            script_params = {}
-    
-            # Prepare data model for the API request
-            action_data = ApiManualActionDataModel(
-                alertGroupIdentifiers=alert_group_identifiers,
-                caseId=case_id,
-                targetEntities=final_target_entities,
-                scope=final_scope,
-                isPredefinedScope=is_predefined_scope,
-                actionProvider="Scripts",
-                actionName="ArcSightLogger_Ping",
-                properties={
-                    "IntegrationInstance": instance_identifier,
-                    "ScriptName": "ArcSightLogger_Ping",
-                    "ScriptParametersEntityFields": json.dumps(script_params)
-                }
-            )
-    
-            try:
-                execution_response = await bindings.http_client.post(
-                    Endpoints.EXECUTE_MANUAL_ACTION,
-                    req=action_data.model_dump()
-                )
-                return execution_response
-            except Exception as e:
-                print(f"Error executing action ArcSightLogger_Ping for ArcSightLogger: {e}")
-                return {"Status": "Failed", "Message": f"Error executing action: {e}"}
-        else:
-            print(f"Warning: No active integration instance found for ArcSightLogger")
-            return {"Status": "Failed", "Message": "No active instance found."}
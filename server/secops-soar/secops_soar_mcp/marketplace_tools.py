@@ -0,0 +1,422 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Builds MCP tools for marketplace integration actions from their manifests."""
+
+import functools
+import inspect
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from logger_utils import get_logger
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from secops_soar_mcp import actions, marketplace
+from secops_soar_mcp.action_result_cache import is_cacheable
+from secops_soar_mcp.marketplace import ActionManifest, ActionParameter
+from secops_soar_mcp.utils.lazy_fastmcp import LazyFastMCP
+from secops_soar_mcp.utils.models import EmailContent, TargetEntity
+from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
+
+logger = get_logger(__name__)
+
+PARAMETER_TYPES = {
+    "string": str,
+    "boolean": bool,
+    "string_list": List[str],
+    "json": Union[str, dict],
+    "email_content": EmailContent,
+}
+
+# JSON schemas of the parameter types, as pydantic generates them.
+PARAMETER_TYPE_SCHEMAS = {
+    "string": {"type": "string"},
+    "boolean": {"type": "boolean"},
+    "string_list": {"items": {"type": "string"}, "type": "array"},
+    "json": {
+        "anyOf": [
+            {"type": "string"},
+            {"additionalProperties": True, "type": "object"},
+        ]
+    },
+    "email_content": {"$ref": "#/$defs/EmailContent"},
+}
+
+CASE_ID_DESCRIPTION = "The ID of the case."
+ALERT_GROUP_IDENTIFIERS_DESCRIPTION = "Identifiers for the alert groups."
+TARGET_ENTITIES_DESCRIPTION = "Optional list of specific target entities (Identifier, EntityType) to run the action on."
+SCOPE_DESCRIPTION = "Defines the scope for the action."
+DEFAULT_SCOPE = "All entities"
+REFRESH_CACHE_DESCRIPTION = "Run the action even if its result for the same target entities is cached. A cached result comes from the case given under cached_from_case_id: the action is not run in the current case, so SOAR records no enrichment, insight or entity update there."
+
+# Normalized integration name of every registered marketplace tool.
+_registered_tools: Dict[str, str] = {}
+# Models validating the action parameters of a tool, built on first use.
+_parameters_models: Dict[str, Type[BaseModel]] = {}
+# Connectivity test ("Ping") tool of each registered integration, by the
+# integration's normalized name.
+_ping_tools: Dict[str, str] = {}
+PING_TOOL_SUFFIX = "_ping"
+
+TOOL_DESCRIPTION_SUFFIX = (
+    "\n\nReturns:\n"
+    "    dict: A dictionary containing the result of the action execution."
+)
+
+
+def _parameter(name: str, annotation: Any) -> inspect.Parameter:
+    return inspect.Parameter(
+        name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation
+    )
+
+
+def _action_parameter(parameter: ActionParameter) -> inspect.Parameter:
+    if parameter.required:
+        field = Field(..., description=parameter.description)
+    else:
+        field = Field(default=None, description=parameter.description)
+    return _parameter(
+        parameter.name, Annotated[PARAMETER_TYPES[parameter.type], field]
+    )
+
+
+def _tool_signature(action: ActionManifest) -> inspect.Signature:
+    """Builds the signature FastMCP derives the tool's input schema from."""
+    # Required action parameters come before the optional ones.
+    action_parameters = sorted(action.parameters, key=lambda p: not p.required)
+    return inspect.Signature(
+        [
+            _parameter(
+                "case_id",
+                Annotated[str, Field(..., description=CASE_ID_DESCRIPTION)],
+            ),
+            _parameter(
+                "alert_group_identifiers",
+                Annotated[
+                    List[str],
+                    Field(..., description=ALERT_GROUP_IDENTIFIERS_DESCRIPTION),
+                ],
+            ),
+            *(_action_parameter(parameter) for parameter in action_parameters),
+            _parameter(
+                "target_entities",
+                Annotated[
+                    List[TargetEntity],
+                    PydanticListField(
+                        TargetEntity, description=TARGET_ENTITIES_DESCRIPTION
+                    ),
+                ],
+            ),
+            _parameter(
+                "scope",
+                Annotated[
+                    str,
+                    Field(default=DEFAULT_SCOPE, description=SCOPE_DESCRIPTION),
+                ],
+            ),
+            # Only enrichment tools can be served from the action result cache.
+            *(
+                [
+                    _parameter(
+                        "refresh_cache",
+                        Annotated[
+                            bool,
+                            Field(default=False, description=REFRESH_CACHE_DESCRIPTION),
+                        ],
+                    )
+                ]
+                if is_cacheable(action.action_name)
+                else []
+            ),
+        ],
+        return_annotation=dict,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _model_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    return model.model_json_schema()
+
+
+def _property_schema(
+    name: str, type_schema: Dict[str, Any], description: str, **extra: Any
+) -> Dict[str, Any]:
+    schema = {**type_schema, **extra, "description": description}
+    # pydantic does not set titles on references to other models.
+    if "$ref" not in type_schema:
+        schema["title"] = name.title().replace("_", " ").strip()
+    return dict(sorted(schema.items()))
+
+
+def build_input_schema(action: ActionManifest) -> Dict[str, Any]:
+    """Builds the JSON schema of a tool's arguments without pydantic.
+
+    The result matches the schema FastMCP generates from the signature built
+    by `build_action_tool`, so tools can be listed before they are built.
+    """
+    properties = {
+        "case_id": _property_schema(
+            "case_id", PARAMETER_TYPE_SCHEMAS["string"], CASE_ID_DESCRIPTION
+        ),
+        "alert_group_identifiers": _property_schema(
+            "alert_group_identifiers",
+            PARAMETER_TYPE_SCHEMAS["string_list"],
+            ALERT_GROUP_IDENTIFIERS_DESCRIPTION,
+        ),
+    }
+    required = ["case_id", "alert_group_identifiers"]
+    for parameter in sorted(action.parameters, key=lambda p: not p.required):
+        type_schema = PARAMETER_TYPE_SCHEMAS[parameter.type]
+        if parameter.required:
+            required.append(parameter.name)
+            properties[parameter.name] = _property_schema(
+                parameter.name, type_schema, parameter.description
+            )
+        else:
+            properties[parameter.name] = _property_schema(
+                parameter.name, type_schema, parameter.description, default=None
+            )
+    properties["target_entities"] = _property_schema(
+        "target_entities",
+        {"items": _model_schema(TargetEntity), "type": "array"},
+        TARGET_ENTITIES_DESCRIPTION,
+    )
+    properties["scope"] = _property_schema(
+        "scope",
+        PARAMETER_TYPE_SCHEMAS["string"],
+        SCOPE_DESCRIPTION,
+        default=DEFAULT_SCOPE,
+    )
+    if is_cacheable(action.action_name):
+        properties["refresh_cache"] = _property_schema(
+            "refresh_cache",
+            PARAMETER_TYPE_SCHEMAS["boolean"],
+            REFRESH_CACHE_DESCRIPTION,
+            default=False,
+        )
+    schema = {
+        "properties": properties,
+        "required": required,
+        "title": f"{action.tool_name}Arguments",
+        "type": "object",
+    }
+    if any(parameter.type == "email_content" for parameter in action.parameters):
+        schema = {"$defs": {"EmailContent": _model_schema(EmailContent)}, **schema}
+    return schema
+
+
+def _parameters_model(action: ActionManifest) -> Type[BaseModel]:
+    model = _parameters_models.get(action.tool_name)
+    if model is not None:
+        return model
+    fields = {}
+    for parameter in action.parameters:
+        annotation = PARAMETER_TYPES[parameter.type]
+        if parameter.required:
+            fields[parameter.name] = (annotation, Field(...))
+        else:
+            fields[parameter.name] = (Optional[annotation], Field(default=None))
+    model = create_model(
+        f"{action.tool_name}Parameters", __config__=ConfigDict(extra="forbid"), **fields
+    )
+    _parameters_models[action.tool_name] = model
+    return model
+
+
+def validate_action_arguments(action: ActionManifest, arguments: dict) -> dict:
+    """Validates the action parameters of a tool call, given by argument name.
+
+    Raises:
+        pydantic.ValidationError: If a required parameter is missing, a value
+            has the wrong type or an unknown parameter is given.
+    """
+    validated = _parameters_model(action).model_validate(arguments)
+    return {name: getattr(validated, name) for name in type(validated).model_fields}
+
+
+def build_script_params(action: ActionManifest, arguments: dict) -> dict:
+    """Maps tool arguments to the action parameters sent to SOAR.
+
+    Optional parameters that were not provided are left out.
+    """
+    script_params = {}
+    for parameter in action.parameters:
+        value = arguments.get(parameter.name)
+        if value is None and not parameter.required:
+            continue
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        script_params[parameter.script_name] = value
+    return script_params
+
+
+def build_action_tool(
+    integration_name: str, action: ActionManifest
+) -> Callable[..., Any]:
+    """Builds the tool function that runs a marketplace action.
+
+    Args:
+        integration_name: The SOAR identifier of the integration.
+        action: The manifest of the action.
+
+    Returns:
+        An async function whose signature describes the tool arguments.
+    """
+
+    async def run_action(**arguments) -> dict:
+        return await actions.execute_manual_action(
+            integration_name,
+            action.action_name,
+            case_id=arguments["case_id"],
+            alert_group_identifiers=arguments["alert_group_identifiers"],
+            script_params=build_script_params(action, arguments),
+            target_entities=arguments.get("target_entities"),
+            scope=arguments.get("scope"),
+            retry_safe=action.retry_safe,
+            refresh_cache=arguments.get("refresh_cache", False),
+        )
+
+    run_action.__name__ = action.tool_name
+    run_action.__doc__ = action.description + TOOL_DESCRIPTION_SUFFIX
+    run_action.__signature__ = _tool_signature(action)
+    return run_action
+
+
+def _build_action_tool_by_name(integration: str, tool_name: str) -> Callable[..., Any]:
+    manifest = marketplace.load_manifest(integration)
+    for action in manifest.actions:
+        if action.tool_name == tool_name:
+            return build_action_tool(manifest.integration, action)
+    raise ValueError(f"Tool {tool_name} not found in the {integration} manifest.")
+
+
+def find_action(tool_name: str) -> Optional[Tuple[str, ActionManifest]]:
+    """Looks up a registered marketplace tool.
+
+    Returns:
+        The SOAR identifier of the tool's integration and the action manifest,
+        or None if no enabled integration has a tool with that name.
+    """
+    integration = _registered_tools.get(tool_name)
+    if integration is None:
+        return None
+    manifest = marketplace.load_manifest(integration)
+    for action in manifest.actions:
+        if action.tool_name == tool_name:
+            return manifest.integration, action
+    return None
+
+
+def list_ping_tools() -> Dict[str, str]:
+    """Returns the Ping tool of each enabled integration, by normalized name.
+
+    Ping tools are listed even when hidden from the tool list.
+    """
+    return dict(_ping_tools)
+
+
+def _track_tool(integration: str, tool_name: str, hide_ping_tools: bool) -> bool:
+    """Records a registered tool; returns whether it should be listed."""
+    _registered_tools[tool_name] = integration
+    if tool_name.endswith(PING_TOOL_SUFFIX):
+        _ping_tools[integration] = tool_name
+        return not hide_ping_tools
+    return True
+
+
+def _register_integration(
+    mcp: LazyFastMCP,
+    integration: str,
+    snapshot: Optional[Any],
+    hide_ping_tools: bool,
+) -> Tuple[str, int]:
+    tool_count = 0
+    snapshot_tools = snapshot.get_tools(integration) if snapshot else None
+    if snapshot_tools is not None:
+        for tool_name, tool in snapshot_tools["tools"].items():
+            if not _track_tool(integration, tool_name, hide_ping_tools):
+                continue
+            mcp.add_lazy_tool(
+                tool_name,
+                tool["description"],
+                tool["inputSchema"],
+                functools.partial(_build_action_tool_by_name, integration, tool_name),
+            )
+            tool_count += 1
+        return snapshot_tools["integration"], tool_count
+
+    manifest = marketplace.load_manifest(integration)
+    for action in manifest.actions:
+        if not _track_tool(integration, action.tool_name, hide_ping_tools):
+            continue
+        mcp.add_lazy_tool(
+            action.tool_name,
+            action.description + TOOL_DESCRIPTION_SUFFIX,
+            build_input_schema(action),
+            functools.partial(build_action_tool, manifest.integration, action),
+        )
+        tool_count += 1
+    return manifest.integration, tool_count
+
+
+def register_tools(
+    mcp: LazyFastMCP,
+    integrations: Iterable[str],
+    snapshot: Optional[Any] = None,
+    hide_ping_tools: bool = False,
+) -> List[str]:
+    """Registers the tools of the given marketplace integrations.
+
+    Tools are listed from their manifests, or from the tool schema snapshot
+    when it is up to date, and only built when first called.
+
+    Args:
+        mcp: The MCP server to register the tools on.
+        integrations: Normalized names of the integrations to enable.
+        snapshot: An optional `tool_schema_snapshot.ToolSchemaSnapshot`.
+        hide_ping_tools: Whether to leave the integrations' Ping tools out
+            of the tool list; they remain available to `ping_integrations`.
+
+    Returns:
+        The SOAR identifiers of the integrations whose tools were registered.
+    """
+    available = marketplace.available_integrations()
+    registered_integrations = []
+    for integration in sorted(integrations):
+        if integration not in available:
+            logger.warning("  * No marketplace manifest found for %s.", integration)
+            continue
+        try:
+            integration_name, tool_count = _register_integration(
+                mcp, integration, snapshot, hide_ping_tools
+            )
+        except Exception as e:
+            logger.error(
+                "  * Failed to register tools for %s. Error: %s",
+                integration,
+                e,
+                exc_info=True,
+            )
+            continue
+        logger.info("    Registered %d tools for %s.", tool_count, integration)
+        registered_integrations.append(integration_name)
+    return registered_integrations
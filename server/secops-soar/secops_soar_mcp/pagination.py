@@ -0,0 +1,196 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Walks paginated SOAR list endpoints and merges their pages."""
+
+import asyncio
+import base64
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Resume cursors point into the middle of a SOAR page, so they carry the
+# page's token and the number of its items already returned. Plain SOAR page
+# tokens are accepted wherever a resume cursor is.
+RESUME_CURSOR_PREFIX = "resume:"
+NEXT_PAGE_TOKEN_FIELD = "nextPageToken"
+# The fields holding the items of the pages of the SOAR list endpoints: cases,
+# case alerts, case comments and involved events. They are looked for before
+# any other list field of a page, which may be a field of the page itself.
+ITEMS_FIELDS = ("cases", "caseAlerts", "caseComments", "involvedEvents")
+# Stops runaway walks of an endpoint that keeps returning page tokens.
+MAX_PAGES = 200
+
+FetchPage = Callable[[Optional[str]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def encode_resume_cursor(page_token: Optional[str], offset: int) -> str:
+    """Encodes a position in a paginated listing."""
+    if offset == 0 and page_token:
+        return page_token
+    position = json.dumps({"pageToken": page_token, "offset": offset})
+    return RESUME_CURSOR_PREFIX + base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_page_token(token: Optional[str]) -> Tuple[Optional[str], int]:
+    """Splits a page token or resume cursor into a SOAR page token and offset."""
+    if not token or not token.startswith(RESUME_CURSOR_PREFIX):
+        return token, 0
+    try:
+        position = json.loads(
+            base64.urlsafe_b64decode(token[len(RESUME_CURSOR_PREFIX) :])
+        )
+        return position["pageToken"], int(position["offset"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid resume cursor: {token}")
+
+
+def find_items_field(page: Dict[str, Any]) -> Optional[str]:
+    """Returns the name of the field holding the items of a page.
+
+    That is the first of `ITEMS_FIELDS` the page has, else its first list
+    field.
+    """
+    for name in ITEMS_FIELDS:
+        if isinstance(page.get(name), list):
+            return name
+    for name, value in page.items():
+        if isinstance(value, list):
+            return name
+    return None
+
+
+def _item_size(item: Any) -> int:
+    return len(json.dumps(item, separators=(",", ":"), default=str))
+
+
+def _invalid_cursor(error: ValueError) -> Dict[str, Any]:
+    logger.warning("%s", error)
+    return {"error": f"{error}; pass a nextPageToken returned by this tool."}
+
+
+async def fetch_page(
+    fetch: FetchPage, page_token: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Fetches a single page, starting at a page token or resume cursor.
+
+    Returns an "error" instead of a page if the resume cursor is invalid.
+    """
+    try:
+        soar_token, offset = decode_page_token(page_token)
+    except ValueError as e:
+        return _invalid_cursor(e)
+    page = await fetch(soar_token)
+    if not offset or not isinstance(page, dict):
+        return page
+    items_field = find_items_field(page)
+    if items_field is None:
+        return page
+    return {**page, items_field: page[items_field][offset:]}
+
+
+async def collect_pages(
+    fetch: FetchPage,
+    page_token: Optional[str],
+    max_items: int,
+    max_bytes: int,
+) -> Optional[Dict[str, Any]]:
+    """Fetches consecutive pages and merges their items.
+
+    The next page is requested as soon as a page arrives, so it downloads
+    while the current page is merged. Fetching stops once the listing is
+    exhausted or adding an item would exceed `max_items` items or `max_bytes`
+    bytes of JSON; at least one item is always returned.
+
+    Args:
+        fetch: Fetches the page with the given SOAR page token, or the first
+            page for None.
+        page_token: The page token or resume cursor to start at.
+        max_items: The maximum number of items to return.
+        max_bytes: The maximum size of the returned items, as compact JSON.
+
+    Returns:
+        The first page with the items of all fetched pages merged into its
+        list field, plus "pagesFetched", "truncated" and a "nextPageToken"
+        resume cursor that is None once the listing is exhausted. None if the
+        first page could not be fetched, and an "error" if the resume cursor
+        is invalid.
+    """
+    try:
+        soar_token, offset = decode_page_token(page_token)
+    except ValueError as e:
+        return _invalid_cursor(e)
+    page = await fetch(soar_token)
+    if not isinstance(page, dict):
+        return page
+    items_field = find_items_field(page)
+    if items_field is None:
+        return page
+
+    merged = {
+        name: value
+        for name, value in page.items()
+        if name not in (items_field, NEXT_PAGE_TOKEN_FIELD)
+    }
+    items: List[Any] = []
+    size = 0
+    pages_fetched = 0
+    resume_cursor = None
+    error = None
+    seen_tokens = {soar_token}
+    while True:
+        pages_fetched += 1
+        next_token = page.get(NEXT_PAGE_TOKEN_FIELD) or None
+        prefetch = None
+        if (
+            next_token
+            and next_token not in seen_tokens
+            and pages_fetched < MAX_PAGES
+        ):
+            prefetch = asyncio.ensure_future(fetch(next_token))
+
+        page_items = page.get(items_field) or []
+        for index in range(offset, len(page_items)):
+            item_size = _item_size(page_items[index])
+            if items and (len(items) >= max_items or size + item_size > max_bytes):
+                resume_cursor = encode_resume_cursor(soar_token, index)
+                break
+            items.append(page_items[index])
+            size += item_size
+        if resume_cursor is not None or prefetch is None:
+            if prefetch is not None:
+                prefetch.cancel()
+            elif resume_cursor is None and next_token:
+                # The page limit was reached or SOAR repeated a page token.
+                resume_cursor = next_token
+            break
+
+        page = await prefetch
+        if not isinstance(page, dict):
+            logger.warning("Failed to fetch page %d.", pages_fetched + 1)
+            error = "Failed to fetch the next page; resume from nextPageToken."
+            resume_cursor = next_token
+            break
+        seen_tokens.add(next_token)
+        soar_token, offset = next_token, 0
+
+    merged[items_field] = items
+    merged["pagesFetched"] = pages_fetched
+    merged["truncated"] = resume_cursor is not None
+    merged[NEXT_PAGE_TOKEN_FIELD] = resume_cursor
+    if error:
+        merged["error"] = error
+    return merged
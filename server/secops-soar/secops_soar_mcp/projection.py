@@ -0,0 +1,103 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Trims SOAR responses down to the fields a tool call asked for."""
+
+from typing import Any, Dict, List, Optional
+
+from secops_soar_mcp.pagination import FetchPage, find_items_field
+
+# A field tree: the selected fields of an object, each with the tree of its
+# selected sub-fields, or None to keep the whole value.
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+def parse_fields(fields: List[str]) -> FieldTree:
+    """Turns dotted field paths like "tags.displayName" into a field tree.
+
+    Field names are lower-cased, as they are matched ignoring case.
+    """
+    tree: FieldTree = {}
+    for field in fields:
+        node = tree
+        parts = [part.lower() for part in field.split(".") if part.strip()]
+        for index, part in enumerate(parts):
+            if index == len(parts) - 1:
+                # Selecting a field keeps it whole, even if sub-fields of it
+                # were selected as well.
+                node[part] = None
+            elif part not in node:
+                node[part] = {}
+            elif node[part] is None:
+                break
+            node = node[part]
+    return tree
+
+
+def select_fields(value: Any, tree: FieldTree) -> Any:
+    """Keeps the fields of `tree` in an object, or in every object of a list.
+
+    The value is not modified; the selected fields are copied.
+    """
+    if isinstance(value, list):
+        return [select_fields(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    selected = {}
+    for key, item in value.items():
+        node = tree.get(key.lower(), False)
+        if node is None:
+            selected[key] = item
+        elif node is not False:
+            selected[key] = select_fields(item, node)
+    return selected
+
+
+def project(response: Any, fields: Optional[List[str]]) -> Any:
+    """Keeps the given fields of the items of a SOAR response.
+
+    For a list response, the fields are selected in each item of its items
+    field, and the other top-level fields (e.g. the page token) are kept.
+    Other responses are projected as a whole.
+
+    Args:
+        response: A SOAR response.
+        fields: Dotted field paths, matched ignoring case, e.g.
+            ["id", "displayName", "tags.displayName"]. None or an empty list
+            keeps the response unchanged.
+    """
+    if not fields or not isinstance(response, dict):
+        return response
+    tree = parse_fields(fields)
+    items_field = find_items_field(response)
+    if items_field is None:
+        return select_fields(response, tree)
+    return {
+        key: select_fields(value, tree) if key == items_field else value
+        for key, value in response.items()
+    }
+
+
+def project_pages(fetch: FetchPage, fields: Optional[List[str]]) -> FetchPage:
+    """Wraps a page fetcher to project every page it returns.
+
+    Projecting the pages before they are merged lets pagination budgets count
+    the projected items only.
+    """
+    if not fields:
+        return fetch
+
+    async def fetch_projected(page_token: Optional[str]):
+        return project(await fetch(page_token), fields)
+
+    return fetch_projected
@@ -0,0 +1,242 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retry, circuit breaker and rate limit helpers for the SOAR HTTP client."""
+
+import asyncio
+import email.utils
+import random
+import re
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from secops_soar_mcp.utils.consts import (
+    DEFAULT_RATE_LIMIT_FAMILY,
+    RATE_LIMIT_FAMILIES,
+)
+
+# Responses worth retrying: throttling and transient server errors.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """Groups requests by method and path, ignoring IDs and query parameters.
+
+    For example "GET /api/1p/external/v1/cases/12/comments" and
+    "GET /api/1p/external/v1/cases/34/comments" share the key
+    "GET /api/1p/external/v1/cases/{id}/comments".
+    """
+    path = urlsplit(endpoint).path
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header into a number of seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+class CircuitBreaker:
+    """Fails requests fast after repeated failures of an endpoint.
+
+    The breaker opens after `failure_threshold` consecutive failures. While
+    open, requests are rejected until `reset_timeout` seconds have passed; then
+    a single trial request is let through, which closes the breaker if it
+    succeeds and opens it again if it fails. A threshold of 0 disables it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == self.OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_started_at = None
+        # Half open: let one trial through. A trial that never reported back
+        # (e.g. a cancelled request) is given up on after reset_timeout.
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self.reset_timeout
+        ):
+            return False
+        self._trial_started_at = now
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._trial_started_at = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._trial_started_at = None
+        if not self.failure_threshold:
+            return
+        if (
+            self.state == self.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Returns the rate limit family of an endpoint (e.g. "cases")."""
+    path = urlsplit(endpoint).path.lower()
+    for fragment, family in RATE_LIMIT_FAMILIES:
+        if fragment in path:
+            return family
+    return DEFAULT_RATE_LIMIT_FAMILY
+
+
+class TokenBucket:
+    """Limits the rate of requests, letting bursts of up to `burst` through.
+
+    Tokens accrue at `rate` per second, up to `burst`. Every request takes a
+    token; when none is left, the request reserves the next one and waits for
+    it, so waiting requests are let through in order at the sustained rate.
+    Requests that would wait longer than their deadline are rejected instead.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        # Negative when tokens are reserved by waiting requests.
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self.waiting = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Takes a token, returning the seconds to wait before using it.
+
+        Returns:
+            The delay, or None if it would exceed `max_wait`, in which case no
+            token is taken.
+        """
+        self._refill()
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        if delay > max_wait:
+            self.rejected += 1
+            return None
+        self._tokens -= 1
+        if delay:
+            self.delayed += 1
+            self.wait_seconds += delay
+        return delay
+
+    async def acquire(self, max_wait: float) -> bool:
+        """Waits for a token; returns False if it would take over `max_wait`."""
+        delay = self.reserve(max_wait)
+        if delay is None:
+            return False
+        if delay:
+            self.waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.waiting -= 1
+        return True
+
+    def throttle(self, retry_after: Optional[float]):
+        """Holds back requests after SOAR throttled one.
+
+        Empties the bucket, or reserves enough tokens to stay idle for
+        `retry_after` seconds, so that the requests that follow are spread at
+        the sustained rate instead of being throttled in turn.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -(retry_after or 0) * self.rate, 0.0)
+        self.throttled += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "available_tokens": round(max(0.0, self._tokens), 2),
+            "waiting": self.waiting,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "throttled_by_soar": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+class EndpointStats:
+    """Request counters of an endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        # GET requests that shared the response of an identical one in flight.
+        self.coalesced = 0
+        self.rejected_by_rate_limit = 0
+
+    def to_dict(self, breaker: CircuitBreaker) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "rejected_by_circuit_breaker": self.rejected,
+            "coalesced": self.coalesced,
+            "rejected_by_rate_limit": self.rejected_by_rate_limit,
+            "circuit_state": breaker.state,
+            "circuit_times_opened": breaker.times_opened,
+        }
@@ -0,0 +1,166 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of SOAR API responses to read-only GET requests."""
+
+import collections
+import re
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+_PLACEHOLDER = re.compile(r"\\\{(\w+)\\\}")
+
+
+def _template_pattern(template: str) -> re.Pattern:
+    """Turns an endpoint template like ".../cases/{CASE_ID}" into a regex."""
+    return re.compile(_PLACEHOLDER.sub(r"(?P<\1>[^/?]+)", re.escape(template)))
+
+
+class CachedResponse:
+    """A cached response and the validators to revalidate it with."""
+
+    __slots__ = ("data", "expires_at", "etag", "last_modified", "case_id")
+
+    def __init__(
+        self,
+        data: Any,
+        ttl: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        case_id: Optional[str],
+    ):
+        self.data = data
+        self.expires_at = time.monotonic() + ttl
+        self.etag = etag
+        self.last_modified = last_modified
+        self.case_id = case_id
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.monotonic()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking SOAR to answer 304 if the response is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """A size-bounded LRU cache of GET responses with per-endpoint TTLs.
+
+    Only endpoints matching one of the configured templates are cached.
+    Entries of case-scoped endpoints (templates with a {CASE_ID} placeholder)
+    are tagged with their case, so that a write to a case drops its cached
+    reads, along with the cached case lists. Responses fetched while their
+    case was being written to are not stored.
+    """
+
+    def __init__(self, ttl_seconds: Dict[str, float], max_entries: int):
+        """Initializes the cache.
+
+        Args:
+            ttl_seconds: Maps endpoint templates (see `consts.Endpoints`) to
+                the number of seconds their responses are cached for.
+            max_entries: The maximum number of cached responses.
+        """
+        self._policies: List[Tuple[re.Pattern, float]] = [
+            (_template_pattern(template), ttl)
+            for template, ttl in ttl_seconds.items()
+        ]
+        self._max_entries = max_entries
+        self._entries: "collections.OrderedDict[Hashable, CachedResponse]" = (
+            collections.OrderedDict()
+        )
+        self._generations: Dict[Optional[str], int] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.invalidations = 0
+
+    def policy(self, endpoint: str) -> Optional[Tuple[float, Optional[str]]]:
+        """Returns the TTL and case ID of a cacheable endpoint, else None."""
+        for pattern, ttl in self._policies:
+            match = pattern.fullmatch(endpoint)
+            if match:
+                return ttl, match.groupdict().get("CASE_ID")
+        return None
+
+    def case_id(self, endpoint: str) -> Optional[str]:
+        """Returns the case an endpoint belongs to, if any."""
+        for pattern, _ in self._policies:
+            match = pattern.fullmatch(endpoint)
+            if match and match.groupdict().get("CASE_ID"):
+                return match.group("CASE_ID")
+        return None
+
+    def generation(self, case_id: Optional[str]) -> Tuple[int, int]:
+        """Returns a value that changes whenever a case is invalidated."""
+        return self._epoch, self._generations.get(case_id, 0)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Returns a cached response, fresh or not, marking it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self, key: Hashable, entry: CachedResponse, generation: Tuple[int, int]
+    ):
+        """Stores a response fetched when its case was at `generation`."""
+        if generation != self.generation(entry.case_id):
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_case(self, case_id: str):
+        """Drops the cached responses of a case and the cached case lists."""
+        for tag in (case_id, None):
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.case_id in (case_id, None)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += 1
+        logger.debug(
+            "Dropped %d cached responses after a write to case %s.",
+            len(stale),
+            case_id,
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self._epoch += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "invalidations": self.invalidations,
+        }
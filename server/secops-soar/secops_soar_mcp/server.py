@@ -14,21 +14,38 @@
 """Main entry point for the SOAR MCP server."""
 
 import asyncio
-import importlib
-from pathlib import Path
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
+import os
+from secops_soar_mcp import bindings, instance_selection, transport
 from logger_utils import get_logger, setup_logging
+from secops_soar_mcp.action_jobs import register_tools as register_tools_action_jobs
+from secops_soar_mcp.batch_actions import register_tools as register_tools_batch_actions
 from secops_soar_mcp.case_management import (
     register_tools as register_tools_case_management,
 )
+from secops_soar_mcp.case_queries import register_tools as register_tools_case_queries
+from secops_soar_mcp.diagnostics import register_tools as register_tools_diagnostics
+from secops_soar_mcp.http_client import HttpClientConfig
+from secops_soar_mcp.integration_health import (
+    register_tools as register_tools_integration_health,
+)
+from secops_soar_mcp.marketplace_tools import (
+    register_tools as register_tools_marketplace,
+)
+from secops_soar_mcp.tool_schema_snapshot import load_snapshot
+from secops_soar_mcp.utils import consts
+from secops_soar_mcp.utils.lazy_fastmcp import LazyFastMCP
 from secops_soar_mcp.utils.utils import normalize_integration_name
 import argparse
 
 logger = get_logger(__name__)
-mcp = FastMCP("SecOps SOAR")
+mcp = LazyFastMCP("SecOps SOAR")
 
 register_tools_case_management(mcp)
+register_tools_case_queries(mcp)
+register_tools_diagnostics(mcp)
+register_tools_batch_actions(mcp)
+register_tools_action_jobs(mcp)
+register_tools_integration_health(mcp)
 
 parser = argparse.ArgumentParser(description="SecOps SOAR MCP Server")
 parser.add_argument(
@@ -38,7 +55,189 @@ parser.add_argument(
 parser.add_argument(
     "--verbose", action="store_true", help="Enable verbose (debug) logging"
 )
+parser.add_argument(
+    "--hide-ping-tools",
+    action=argparse.BooleanOptionalAction,
+    help="Leave the Ping tool of every integration out of the tool list; "
+    "connectivity is checked with ping_integrations instead. Defaults to "
+    "SOAR_HIDE_PING_TOOLS.",
+)
+transport_args = parser.add_argument_group(
+    "Transport",
+    "How MCP clients connect. With an HTTP transport, every client shares "
+    "this process, its SOAR connection pool and its caches.",
+)
+transport_args.add_argument(
+    "--transport",
+    choices=transport.TRANSPORTS,
+    help="The MCP transport. Defaults to SOAR_MCP_TRANSPORT, then to stdio.",
+)
+transport_args.add_argument(
+    "--host",
+    help="Address to listen on with an HTTP transport. Defaults to "
+    "SOAR_MCP_HOST, then to 127.0.0.1.",
+)
+transport_args.add_argument(
+    "--allow-remote",
+    action=argparse.BooleanOptionalAction,
+    help="Allow --host to be a non-local address. The server does not "
+    "authenticate its clients, and any client reaching it can run SOAR "
+    "actions with its app key. Defaults to SOAR_MCP_ALLOW_REMOTE.",
+)
+transport_args.add_argument(
+    "--port",
+    type=int,
+    help="Port to listen on with an HTTP transport. Defaults to SOAR_MCP_PORT, "
+    "then to 8000.",
+)
+transport_args.add_argument(
+    "--max-concurrency",
+    type=int,
+    help="Maximum number of concurrent HTTP connections and requests; further "
+    "requests are answered with 503. Defaults to SOAR_MCP_MAX_CONCURRENCY, "
+    "then to no limit.",
+)
+transport_args.add_argument(
+    "--shutdown-timeout",
+    type=float,
+    help="Seconds to wait on shutdown for tool calls and action jobs in flight. "
+    "Defaults to SOAR_MCP_SHUTDOWN_TIMEOUT, then to 60.",
+)
+http_client_args = parser.add_argument_group(
+    "HTTP client",
+    "Connection settings for the SOAR API. Each option defaults to its "
+    "SOAR_HTTP_* environment variable, then to the built-in default.",
+)
+http_client_args.add_argument(
+    "--http-pool-size", type=int, help="Maximum number of open connections."
+)
+http_client_args.add_argument(
+    "--http-pool-size-per-host",
+    type=int,
+    help="Maximum number of open connections to a single host.",
+)
+http_client_args.add_argument(
+    "--http-keepalive-timeout",
+    type=float,
+    help="Seconds an idle connection is kept open for reuse.",
+)
+http_client_args.add_argument(
+    "--http-dns-cache-ttl", type=int, help="Seconds DNS lookups are cached for."
+)
+http_client_args.add_argument(
+    "--http-connect-timeout",
+    type=float,
+    help="Seconds allowed to connect to SOAR (0 disables the timeout).",
+)
+http_client_args.add_argument(
+    "--http-read-timeout",
+    type=float,
+    help="Seconds allowed between two reads of a response (0 disables the timeout).",
+)
+http_client_args.add_argument(
+    "--http-total-timeout",
+    type=float,
+    help="Seconds allowed for a whole request (0 disables the timeout).",
+)
+http_client_args.add_argument(
+    "--http-compression",
+    action=argparse.BooleanOptionalAction,
+    help="Request gzip/deflate compressed responses.",
+)
+http_client_args.add_argument(
+    "--http-max-retries",
+    type=int,
+    help="Retries of requests that failed transiently (0 disables retries).",
+)
+http_client_args.add_argument(
+    "--http-retry-base-delay",
+    type=float,
+    help="Seconds before the first retry; the delay doubles with every retry.",
+)
+http_client_args.add_argument(
+    "--http-retry-max-delay",
+    type=float,
+    help="Maximum seconds between two retries.",
+)
+http_client_args.add_argument(
+    "--http-circuit-breaker-threshold",
+    type=int,
+    help="Consecutive failures after which requests to an endpoint fail fast "
+    "(0 disables the circuit breaker).",
+)
+http_client_args.add_argument(
+    "--http-circuit-breaker-reset-timeout",
+    type=float,
+    help="Seconds an open circuit breaker waits before letting a request through.",
+)
+http_client_args.add_argument(
+    "--http-response-cache",
+    action=argparse.BooleanOptionalAction,
+    help="Cache the responses of read-only case, alert and event endpoints.",
+)
+http_client_args.add_argument(
+    "--http-response-cache-size",
+    type=int,
+    help="Maximum number of cached responses.",
+)
+http_client_args.add_argument(
+    "--http-rate-limit",
+    type=float,
+    help="Requests per second allowed to each endpoint family: cases, alerts, "
+    "entities, actions and other (0 disables rate limiting).",
+)
+http_client_args.add_argument(
+    "--http-rate-limits",
+    help='Requests per second of specific endpoint families, e.g. "actions=2,cases=20".',
+)
+http_client_args.add_argument(
+    "--http-rate-limit-burst",
+    type=int,
+    help="Requests an endpoint family may send at once before being rate limited.",
+)
+http_client_args.add_argument(
+    "--http-rate-limit-max-wait",
+    type=float,
+    help="Seconds a request may wait for the rate limit before failing.",
+)
+http_client_args.add_argument(
+    "--http-json-decoder",
+    choices=["auto", "orjson", "json"],
+    help="How to decode JSON responses; auto uses orjson when it is installed.",
+)
 
+parser.add_argument(
+    "--case-mirror-path",
+    help="SQLite database file of a local mirror of the SOAR cases, kept in "
+    "sync in the background and queried by the mirror tools. Defaults to "
+    "SOAR_CASE_MIRROR_PATH; the mirror is disabled if neither is set.",
+)
+parser.add_argument(
+    "--case-mirror-sync-interval",
+    type=float,
+    help="Seconds between two syncs of the case mirror.",
+)
+
+parser.add_argument(
+    "--instance-selection",
+    choices=instance_selection.POLICIES,
+    help="How to choose the integration instance an action runs on when an "
+    "integration has several. Defaults to SOAR_INSTANCE_SELECTION_POLICY, "
+    "then to first.",
+)
+parser.add_argument(
+    "--action-result-cache",
+    action=argparse.BooleanOptionalAction,
+    help="Reuse the results of enrichment actions run on the same entities "
+    "with the same parameters. Defaults to SOAR_ACTION_RESULT_CACHE.",
+)
+parser.add_argument(
+    "--action-coalescing",
+    action=argparse.BooleanOptionalAction,
+    help="Run concurrent executions of a read-only action on entities of the "
+    "same case, with the same parameters, as one execution on all their "
+    "entities. Defaults to SOAR_ACTION_COALESCING.",
+)
 
 def get_enabled_integrations_set(integrations_arg: str) -> set:
     """Get the set of enabled integrations from the command line arguments.
@@ -67,93 +266,49 @@ def get_enabled_integrations_set(integrations_arg: str) -> set:
     return set()
 
 
-def register_tools(integrations_arg: str):
-    """Register tools for the MCP server.
+def get_http_client_config(args: argparse.Namespace) -> HttpClientConfig:
+    """Get the HTTP client settings from the environment and the command line.
 
     Args:
         args: Parsed command line arguments."""
+    overrides = {
+        field_name: getattr(args, f"http_{field_name}")
+        for field_name in HttpClientConfig.model_fields
+        if getattr(args, f"http_{field_name}", None) is not None
+    }
+    return HttpClientConfig.model_validate(
+        {**HttpClientConfig.from_env().model_dump(), **overrides}
+    )
+
+
+def register_tools(integrations_arg: str, hide_ping_tools: bool = False) -> list:
+    """Register tools for the MCP server.
+
+    Args:
+        integrations_arg: The --integrations command line argument.
+        hide_ping_tools: Whether to leave the integrations' Ping tools out of
+            the tool list.
+
+    Returns:
+        The SOAR identifiers of the integrations whose tools were registered."""
     enabled_integrations_set = get_enabled_integrations_set(integrations_arg)
 
     logger.info("Starting dynamic tool registration...")
     try:
-        script_dir = Path(__file__).parent.resolve()
-
-        marketplace_dir = script_dir / "marketplace"
-
-        if marketplace_dir.is_dir():
-            logger.debug("Scanning for tools in: %s", marketplace_dir)
-
-            init_file = marketplace_dir / "__init__.py"
-            if not init_file.exists():
-                logger.warning(
-                    "Marketplace directory '%s' is missing __init__.py. Tool registration might fail.",
-                    marketplace_dir,
-                )
-
-            for py_file in marketplace_dir.glob("*.py"):
-                if py_file.name == "__init__.py" or not py_file.is_file():
-                    continue
-
-                module_stem = (
-                    py_file.stem
-                )  # The filename without .py (e.g., "csv")
-                if module_stem not in enabled_integrations_set:
-                    continue
-                module_import_path = f"marketplace.{module_stem}"  # The import path (e.g., "marketplace.csv")
-
-                try:
-                    logger.debug(
-                        "  Attempting to import module: %s", module_import_path
-                    )
-                    module = importlib.import_module(module_import_path)
-
-                    if hasattr(module, "register_tools") and callable(
-                        getattr(module, "register_tools")
-                    ):
-                        logger.info(
-                            "    Found register_tools in %s. Registering...",
-                            module_stem,
-                        )
-                        register_function = getattr(module, "register_tools")
-                        register_function(mcp)
-                        logger.debug(
-                            "    Successfully called register_tools for %s.",
-                            module_stem,
-                        )
-                    else:
-                        logger.warning(
-                            "    Module %s found, but it has no callable 'register_tools' function.",
-                            module_stem,
-                        )
-
-                except ImportError as e:
-                    logger.error(
-                        "  * Failed to import module %s. Error: %s",
-                        module_import_path,
-                        e,
-                        exc_info=True,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "  * Failed during registration call for module %s. Error: %s",
-                        module_import_path,
-                        e,
-                        exc_info=True,
-                    )
-
-            logger.info("Finished scanning marketplace directory.")
-        else:
-            logger.warning(
-                "Marketplace directory not found at %s. No tools dynamically registered.",
-                marketplace_dir,
-            )
-
+        snapshot = None
+        snapshot_path = os.getenv(consts.ENV_SOAR_TOOL_SCHEMA_SNAPSHOT)
+        if snapshot_path and enabled_integrations_set:
+            snapshot = load_snapshot(snapshot_path)
+        return register_tools_marketplace(
+            mcp, enabled_integrations_set, snapshot, hide_ping_tools
+        )
     except Exception as e:
         logger.error(
             "An unexpected error occurred during tool registration setup: %s",
             e,
             exc_info=True,
         )
+    return []
 
 
 async def main():
@@ -162,9 +317,60 @@ async def main():
     setup_logging(args.verbose)
     logger.info("Starting SecOps SOAR MCP server")
     try:
-        await bindings.bind()
-        register_tools(args.integrations)
-        await mcp.run_stdio_async()
+        hide_ping_tools = args.hide_ping_tools
+        if hide_ping_tools is None:
+            hide_ping_tools = os.getenv(consts.ENV_SOAR_HIDE_PING_TOOLS, "").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+        # Tools are registered from the marketplace manifests in a thread
+        # while the valid scopes are fetched; the instances of the registered
+        # integrations are then warmed up.
+        registration = asyncio.to_thread(
+            register_tools, args.integrations, hide_ping_tools
+        )
+        await bindings.bind(
+            registration,
+            get_http_client_config(args),
+            args.case_mirror_path,
+            args.case_mirror_sync_interval,
+            args.instance_selection,
+            args.action_result_cache,
+            args.action_coalescing,
+        )
+        transport_name = args.transport or os.getenv(
+            consts.ENV_SOAR_MCP_TRANSPORT, transport.STDIO
+        )
+        if transport_name == transport.STDIO:
+            await mcp.run_stdio_async()
+        else:
+            max_concurrency = args.max_concurrency or os.getenv(
+                consts.ENV_SOAR_MCP_MAX_CONCURRENCY
+            )
+            allow_remote = args.allow_remote
+            if allow_remote is None:
+                allow_remote = os.getenv(
+                    consts.ENV_SOAR_MCP_ALLOW_REMOTE, ""
+                ).lower() in ("1", "true", "yes")
+            await transport.run_http(
+                mcp,
+                transport_name,
+                args.host
+                or os.getenv(consts.ENV_SOAR_MCP_HOST, consts.DEFAULT_MCP_HOST),
+                args.port
+                or int(os.getenv(consts.ENV_SOAR_MCP_PORT, consts.DEFAULT_MCP_PORT)),
+                int(max_concurrency) if max_concurrency else None,
+                args.shutdown_timeout
+                or float(
+                    os.getenv(
+                        consts.ENV_SOAR_MCP_SHUTDOWN_TIMEOUT,
+                        consts.DEFAULT_MCP_SHUTDOWN_TIMEOUT_SECONDS,
+                    )
+                ),
+                "debug" if args.verbose else "info",
+                allow_remote,
+            )
     except Exception as e:
         logger.error("Error: %s", e)
     finally:
@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Precomputed snapshot of the marketplace tool definitions.
+
+The snapshot holds the description and input schema of every marketplace tool
+as FastMCP generates them, so the server can list and build tools without
+parsing manifests or generating schemas at startup. It is written by a build
+step:
+
+    python -m secops_soar_mcp.tool_schema_snapshot /path/to/snapshot
+
+and read by the server when SOAR_TOOL_SCHEMA_SNAPSHOT points to it. The
+snapshot directory holds an `index.json` file with the snapshot version, a
+fingerprint of the libraries that generated the schemas and the hash of every
+manifest, plus one `<integration>.json` file with the tools of each
+integration. Integrations whose manifest changed since the snapshot was built
+fall back to the manifest.
+"""
+
+import argparse
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from logger_utils import get_logger, setup_logging
+from mcp.server.fastmcp.tools import Tool
+from secops_soar_mcp import marketplace, marketplace_tools
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_INDEX_FILE = "index.json"
+
+
+def snapshot_fingerprint() -> str:
+    """Identifies the code that generates tool schemas."""
+    return (
+        f"{SNAPSHOT_VERSION}:pydantic-{metadata.version('pydantic')}"
+        f":mcp-{metadata.version('mcp')}"
+    )
+
+
+def manifest_hash(integration: str) -> str:
+    """Returns the SHA-256 hash of an integration manifest."""
+    path = marketplace.MANIFEST_DIR / f"{integration}{marketplace.MANIFEST_SUFFIX}"
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ToolSchemaSnapshot:
+    """A snapshot of tool definitions, loaded one integration at a time."""
+
+    def __init__(self, path: Path, manifest_hashes: Dict[str, str]):
+        self._path = path
+        self._manifest_hashes = manifest_hashes
+
+    def get_tools(self, integration: str) -> Optional[Dict[str, Any]]:
+        """Returns the snapshot of an integration's tools.
+
+        Args:
+            integration: The normalized integration name (e.g. "csv").
+
+        Returns:
+            A dict with the SOAR integration identifier under "integration" and
+            the tool definitions under "tools", or None if the integration is
+            not in the snapshot or its manifest changed since.
+        """
+        snapshot_hash = self._manifest_hashes.get(integration)
+        if snapshot_hash is None or snapshot_hash != manifest_hash(integration):
+            logger.debug("Tool schema snapshot is stale for %s.", integration)
+            return None
+        with open(self._path / f"{integration}.json", "rb") as f:
+            return json.load(f)
+
+
+def load_snapshot(path: str) -> Optional[ToolSchemaSnapshot]:
+    """Loads a tool schema snapshot.
+
+    Returns:
+        The snapshot, or None if it is missing or was generated by a different
+        snapshot version or library versions.
+    """
+    snapshot_dir = Path(path)
+    try:
+        with open(snapshot_dir / SNAPSHOT_INDEX_FILE, "rb") as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Failed to read tool schema snapshot %s: %s", path, e)
+        return None
+    if index.get("fingerprint") != snapshot_fingerprint():
+        logger.warning(
+            "Ignoring tool schema snapshot %s generated by %s (expected %s).",
+            path,
+            index.get("fingerprint"),
+            snapshot_fingerprint(),
+        )
+        return None
+    return ToolSchemaSnapshot(snapshot_dir, index["manifests"])
+
+
+def build_snapshot(path: str) -> int:
+    """Generates the tool schema snapshot of all marketplace integrations.
+
+    Returns:
+        The number of tools in the snapshot.
+    """
+    snapshot_dir = Path(path)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    manifest_hashes = {}
+    tool_count = 0
+    for integration in marketplace.available_integrations():
+        manifest = marketplace.load_manifest(integration)
+        tools = {}
+        for action in manifest.actions:
+            tool = Tool.from_function(
+                marketplace_tools.build_action_tool(manifest.integration, action),
+                name=action.tool_name,
+            )
+            tools[tool.name] = {
+                "description": tool.description,
+                "inputSchema": tool.parameters,
+            }
+        with open(snapshot_dir / f"{integration}.json", "w") as f:
+            json.dump(
+                {"integration": manifest.integration, "tools": tools},
+                f,
+                separators=(",", ":"),
+            )
+        manifest_hashes[integration] = manifest_hash(integration)
+        tool_count += len(tools)
+    with open(snapshot_dir / SNAPSHOT_INDEX_FILE, "w") as f:
+        json.dump(
+            {"fingerprint": snapshot_fingerprint(), "manifests": manifest_hashes},
+            f,
+            indent=2,
+        )
+    return tool_count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the SecOps SOAR marketplace tool schema snapshot"
+    )
+    parser.add_argument("path", help="Directory to write the snapshot to")
+    args = parser.parse_args()
+    setup_logging(False)
+    tool_count = build_snapshot(args.path)
+    logger.info("Wrote %d tool schemas to %s", tool_count, args.path)
+
+
+if __name__ == "__main__":
+    main()
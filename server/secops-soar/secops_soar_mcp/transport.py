@@ -0,0 +1,233 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Serving the MCP server to many clients over HTTP."""
+
+import asyncio
+import contextlib
+import time
+from typing import Iterator, Optional
+
+import uvicorn
+from logger_utils import get_logger
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from secops_soar_mcp import bindings
+from sse_starlette.sse import AppStatus
+
+logger = get_logger(__name__)
+
+STDIO = "stdio"
+SSE = "sse"
+STREAMABLE_HTTP = "streamable-http"
+TRANSPORTS = (STDIO, SSE, STREAMABLE_HTTP)
+
+# Hosts the server listens on without --allow-remote. FastMCP protects them
+# against DNS rebinding, accepting only requests for a local host name.
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+# Seconds left to clients to close their connections once tool calls drained.
+CONNECTION_CLOSE_TIMEOUT_SECONDS = 5
+# Seconds left to the last tool call responses to be sent before the event
+# streams end.
+RESPONSE_FLUSH_SECONDS = 0.5
+
+
+class ToolCallTracker:
+    """Counts the tool calls in flight, so that shutdown can wait for them."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.closing = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start(self) -> bool:
+        """Records a call starting; returns False if the server is closing."""
+        if self.closing:
+            return False
+        self.in_flight += 1
+        self._idle.clear()
+        return True
+
+    def finish(self):
+        self.in_flight -= 1
+        if not self.in_flight:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Rejects new calls and waits for those in flight.
+
+        Returns:
+            True if every call finished within the timeout.
+        """
+        self.closing = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+def track_tool_calls(mcp: FastMCP) -> ToolCallTracker:
+    """Counts the tool calls handled by an MCP server.
+
+    Once the tracker is draining, tool calls are answered with an error
+    instead of being run.
+    """
+    tracker = ToolCallTracker()
+    handlers = mcp._mcp_server.request_handlers
+    call_tool = handlers[types.CallToolRequest]
+
+    async def tracked_call_tool(request: types.CallToolRequest) -> types.ServerResult:
+        if not tracker.start():
+            return types.ServerResult(
+                types.CallToolResult(
+                    content=[
+                        types.TextContent(
+                            type="text",
+                            text="The server is shutting down; retry the call later.",
+                        )
+                    ],
+                    isError=True,
+                )
+            )
+        try:
+            return await call_tool(request)
+        finally:
+            tracker.finish()
+
+    handlers[types.CallToolRequest] = tracked_call_tool
+    return tracker
+
+
+class DrainingServer(uvicorn.Server):
+    """A uvicorn server that lets tool calls and action jobs finish on shutdown.
+
+    On SIGINT or SIGTERM, new tool calls are rejected, and the server waits up
+    to `drain_timeout` seconds for the tool calls in flight and the running
+    background action jobs before closing the client connections.
+    """
+
+    def __init__(
+        self, config: uvicorn.Config, tool_calls: ToolCallTracker, drain_timeout: float
+    ):
+        super().__init__(config)
+        self._tool_calls = tool_calls
+        self._drain_timeout = drain_timeout
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        with super().capture_signals():
+            yield
+            # uvicorn raises the signals it handled again once stopped, which
+            # would interrupt the cleanup of the bindings; they are handled.
+            # The list is private to uvicorn: if it goes away, the signals are
+            # raised again and the cleanup may be cut short, nothing worse.
+            captured_signals = getattr(self, "_captured_signals", None)
+            if isinstance(captured_signals, list):
+                captured_signals.clear()
+
+    async def shutdown(self, sockets=None):
+        jobs = bindings.job_tracker.running() if bindings.job_tracker else []
+        logger.info(
+            "Shutting down: waiting for %d tool calls and %d action jobs in flight.",
+            self._tool_calls.in_flight,
+            len(jobs),
+        )
+        started = time.monotonic()
+        waits = [self._tool_calls.drain(self._drain_timeout)]
+        if jobs:
+            waits.append(bindings.job_tracker.wait(jobs, self._drain_timeout, True))
+        drained = (await asyncio.gather(*waits))[0]
+        unfinished = len([job for job in jobs if not job.done])
+        if not drained or unfinished:
+            logger.warning(
+                "Shutdown timeout reached with %d tool calls and %d action jobs "
+                "still running; they are cancelled.",
+                self._tool_calls.in_flight,
+                unfinished,
+            )
+        else:
+            logger.info("Drained in %.1f seconds.", time.monotonic() - started)
+        # Ends the event streams, which carry the tool call responses.
+        await asyncio.sleep(RESPONSE_FLUSH_SECONDS)
+        AppStatus.should_exit = True
+        await super().shutdown(sockets)
+
+
+async def run_http(
+    mcp: FastMCP,
+    transport: str,
+    host: str,
+    port: int,
+    max_concurrency: Optional[int],
+    drain_timeout: float,
+    log_level: str,
+    allow_remote: bool = False,
+):
+    """Serves the MCP server over SSE or streamable HTTP until interrupted.
+
+    Every client shares the bindings of this process: its HTTP client and
+    connection pool, instance cache, scopes and caches.
+
+    Args:
+        mcp: The MCP server.
+        transport: SSE or STREAMABLE_HTTP.
+        host: The address to listen on.
+        port: The port to listen on.
+        max_concurrency: The maximum number of concurrent connections and
+            requests, beyond which requests are answered with HTTP 503. None
+            for no limit.
+        drain_timeout: Seconds to wait for calls in flight on shutdown.
+        log_level: The log level of the HTTP server.
+        allow_remote: Whether `host` may be a non-local address.
+
+    Raises:
+        ValueError: If `host` is not local and `allow_remote` is not set.
+    """
+    if host not in LOCAL_HOSTS:
+        if not allow_remote:
+            raise ValueError(
+                f"Refusing to listen on the non-local address {host}: the server "
+                "does not authenticate its clients. Pass --allow-remote (or set "
+                "SOAR_MCP_ALLOW_REMOTE) to listen on it anyway."
+            )
+        logger.warning(
+            "Listening on %s with remote access allowed: any client reaching "
+            "this address can run SOAR actions with the configured app key, "
+            "and DNS rebinding protection is disabled.",
+            host,
+        )
+        # FastMCP only accepts local host names by default; clients of a
+        # remote address send other ones.
+        mcp.settings.transport_security = None
+    # By default, event streams end as soon as uvicorn is asked to exit, cutting
+    # off the responses of the tool calls in flight; DrainingServer ends them
+    # once drained instead.
+    AppStatus.disable_automatic_graceful_drain()
+    app = mcp.sse_app() if transport == SSE else mcp.streamable_http_app()
+    tool_calls = track_tool_calls(mcp)
+    server = DrainingServer(
+        uvicorn.Config(
+            app,
+            host=host,
+            port=port,
+            limit_concurrency=max_concurrency,
+            timeout_graceful_shutdown=CONNECTION_CLOSE_TIMEOUT_SECONDS,
+            log_level=log_level,
+        ),
+        tool_calls,
+        drain_timeout,
+    )
+    logger.info("Serving MCP over %s on %s:%d", transport, host, port)
+    await server.serve()
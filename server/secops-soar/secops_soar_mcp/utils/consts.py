@@ -15,13 +15,86 @@
 
 ENV_SOAR_URL = "SOAR_URL"
 ENV_SOAR_APP_KEY = "SOAR_APP_KEY"
+ENV_SOAR_INSTANCE_CACHE_TTL_SECONDS = "SOAR_INSTANCE_CACHE_TTL_SECONDS"
+ENV_SOAR_SCOPE_REFRESH_INTERVAL_SECONDS = "SOAR_SCOPE_REFRESH_INTERVAL_SECONDS"
+ENV_SOAR_INSTANCE_SELECTION_POLICY = "SOAR_INSTANCE_SELECTION_POLICY"
+ENV_SOAR_TOOL_SCHEMA_SNAPSHOT = "SOAR_TOOL_SCHEMA_SNAPSHOT"
+ENV_SOAR_CASE_MIRROR_PATH = "SOAR_CASE_MIRROR_PATH"
+ENV_SOAR_PING_CACHE_TTL_SECONDS = "SOAR_PING_CACHE_TTL_SECONDS"
+ENV_SOAR_HIDE_PING_TOOLS = "SOAR_HIDE_PING_TOOLS"
+ENV_SOAR_ACTION_RESULT_CACHE = "SOAR_ACTION_RESULT_CACHE"
+ENV_SOAR_CASE_RANKING_WEIGHTS = "SOAR_CASE_RANKING_WEIGHTS"
+ENV_SOAR_ACTION_COALESCING = "SOAR_ACTION_COALESCING"
+ENV_SOAR_ACTION_COALESCING_WINDOW_SECONDS = "SOAR_ACTION_COALESCING_WINDOW_SECONDS"
+ENV_SOAR_MCP_TRANSPORT = "SOAR_MCP_TRANSPORT"
+ENV_SOAR_MCP_HOST = "SOAR_MCP_HOST"
+ENV_SOAR_MCP_ALLOW_REMOTE = "SOAR_MCP_ALLOW_REMOTE"
+ENV_SOAR_MCP_PORT = "SOAR_MCP_PORT"
+ENV_SOAR_MCP_MAX_CONCURRENCY = "SOAR_MCP_MAX_CONCURRENCY"
+ENV_SOAR_MCP_SHUTDOWN_TIMEOUT = "SOAR_MCP_SHUTDOWN_TIMEOUT"
+ENV_SOAR_ACTION_RESULT_CACHE_TTL_SECONDS = "SOAR_ACTION_RESULT_CACHE_TTL_SECONDS"
+ENV_SOAR_ACTION_RESULT_CACHE_TTLS = "SOAR_ACTION_RESULT_CACHE_TTLS"
+ENV_SOAR_CASE_MIRROR_SYNC_INTERVAL_SECONDS = "SOAR_CASE_MIRROR_SYNC_INTERVAL_SECONDS"
+# HttpClientConfig field -> environment variable overriding it.
+ENV_SOAR_HTTP_CLIENT_CONFIG = {
+    "pool_size": "SOAR_HTTP_POOL_SIZE",
+    "pool_size_per_host": "SOAR_HTTP_POOL_SIZE_PER_HOST",
+    "keepalive_timeout": "SOAR_HTTP_KEEPALIVE_TIMEOUT",
+    "dns_cache_ttl": "SOAR_HTTP_DNS_CACHE_TTL",
+    "connect_timeout": "SOAR_HTTP_CONNECT_TIMEOUT",
+    "read_timeout": "SOAR_HTTP_READ_TIMEOUT",
+    "total_timeout": "SOAR_HTTP_TOTAL_TIMEOUT",
+    "compression": "SOAR_HTTP_COMPRESSION",
+    "max_retries": "SOAR_HTTP_MAX_RETRIES",
+    "retry_base_delay": "SOAR_HTTP_RETRY_BASE_DELAY",
+    "retry_max_delay": "SOAR_HTTP_RETRY_MAX_DELAY",
+    "circuit_breaker_threshold": "SOAR_HTTP_CIRCUIT_BREAKER_THRESHOLD",
+    "circuit_breaker_reset_timeout": "SOAR_HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT",
+    "response_cache": "SOAR_HTTP_RESPONSE_CACHE",
+    "response_cache_size": "SOAR_HTTP_RESPONSE_CACHE_SIZE",
+    "rate_limit": "SOAR_HTTP_RATE_LIMIT",
+    "rate_limits": "SOAR_HTTP_RATE_LIMITS",
+    "rate_limit_burst": "SOAR_HTTP_RATE_LIMIT_BURST",
+    "rate_limit_max_wait": "SOAR_HTTP_RATE_LIMIT_MAX_WAIT",
+    "json_decoder": "SOAR_HTTP_JSON_DECODER",
+}
+
+DEFAULT_INSTANCE_CACHE_TTL_SECONDS = 300
+DEFAULT_SCOPE_REFRESH_INTERVAL_SECONDS = 600
+DEFAULT_INSTANCE_SELECTION_POLICY = "first"
+# Seconds an integration instance is tried last after an action failed on it.
+INSTANCE_FAILURE_COOLDOWN_SECONDS = 30
+DEFAULT_CASE_MIRROR_SYNC_INTERVAL_SECONDS = 60
+DEFAULT_PING_CACHE_TTL_SECONDS = 300
+DEFAULT_MCP_HOST = "127.0.0.1"
+DEFAULT_MCP_PORT = 8000
+DEFAULT_MCP_SHUTDOWN_TIMEOUT_SECONDS = 60
+DEFAULT_ACTION_RESULT_CACHE_TTL_SECONDS = 900
+ACTION_RESULT_CACHE_SIZE = 5000
+DEFAULT_ACTION_COALESCING_WINDOW_SECONDS = 0.05
+ACTION_COALESCING_MAX_ENTITIES = 100
+# Default budgets of auto-paginated list tools.
+DEFAULT_PAGINATION_MAX_ITEMS = 500
+DEFAULT_PAGINATION_MAX_BYTES = 200_000
+# Endpoint families sharing a rate limit, by a lower-cased fragment of their
+# paths, matched in order.
+RATE_LIMIT_FAMILIES = (
+    ("executemanualaction", "actions"),
+    ("entit", "entities"),
+    ("alert", "alerts"),
+    ("/cases", "cases"),
+)
+DEFAULT_RATE_LIMIT_FAMILY = "other"
+# Finished action jobs kept for their results to be collected.
+MAX_FINISHED_JOBS = 1000
+DEFAULT_JOB_TIMEOUT_SECONDS = 1800
 
 
 class Endpoints:
     """Endpoints for SOAR."""
 
     EXECUTE_MANUAL_ACTION = "/api/external/v1/cases/ExecuteManualAction"
-    LIST_INTEGRATION_INSTANCES = "/api/1p/external/v1/integrations/{INTEGRATION_NAME}/integrationInstances?$select=identifier"
+    LIST_INTEGRATION_INSTANCES = "/api/1p/external/v1/integrations/{INTEGRATION_NAME}/integrationInstances?$select=identifier,environment"
     BASE_CASE_URL = "/api/1p/external/v1/cases"
     BASE_SPECIFIC_CASE_URL = BASE_CASE_URL + "/{CASE_ID}"
     BASE_CASE_COMMENTS_URL = BASE_SPECIFIC_CASE_URL + "/comments"
@@ -40,3 +113,37 @@ class Endpoints:
     LIST_INVOLVED_EVENTS_BY_ALERT = (
         "/api/1p/external/v1.0/cases/{CASE_ID}/alerts/{ALERT_ID}/involvedEvents"
     )
+
+
+# Read-only GET endpoints whose responses the HTTP client may cache, with the
+# number of seconds a response is reused before being revalidated. Writes to a
+# case through any of these endpoints drop the case's cached responses.
+RESPONSE_CACHE_TTL_SECONDS = {
+    Endpoints.BASE_CASE_URL: 30,
+    Endpoints.BASE_SPECIFIC_CASE_URL: 60,
+    Endpoints.BASE_CASE_COMMENTS_URL: 30,
+    Endpoints.BASE_ALERT_URL: 60,
+    Endpoints.LIST_ALERT_GROUP_IDENTIFIERS_BY_CASE: 300,
+    Endpoints.BASE_SPECIFIC_ALERT_URL: 120,
+    Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT: 300,
+    Endpoints.GET_SCOPES: 3600,
+}
+
+# Enrichment actions, by action type, whose results are cached for longer than
+# the default as the reputation of their entities rarely changes.
+ACTION_RESULT_CACHE_TTL_SECONDS = {
+    "Enrich Hash": 86400,
+    "EnrichHash": 86400,
+    "Enrich File Hash": 86400,
+    "Enrich CVE": 86400,
+    "EnrichCVE": 86400,
+}
+
+# Default weights of the score components of rank_cases.
+CASE_RANKING_WEIGHTS = {
+    "priority": 3.0,
+    "alerts": 2.0,
+    "age": 1.0,
+    "tags": 1.0,
+    "suspicious_entities": 2.0,
+}
@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""FastMCP server that can list tools before building them."""
+
+import inspect
+from typing import Any, Callable, Dict, List
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import Tool as MCPTool
+
+
+class LazyTool:
+    """A tool that is listed from its description and input schema only."""
+
+    __slots__ = ("name", "description", "input_schema", "factory")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        factory: Callable[[], Callable[..., Any]],
+    ):
+        self.name = name
+        self.description = description
+        self.input_schema = input_schema
+        self.factory = factory
+
+
+class LazyFastMCP(FastMCP):
+    """A FastMCP server whose tools can be registered lazily.
+
+    Building a FastMCP tool creates a pydantic model for its arguments and
+    generates its JSON schema, which is costly when thousands of tools are
+    registered. Lazy tools are listed from a precomputed input schema, and
+    only their argument model is built, the first time they are called.
+    Lazy tool functions cannot take a FastMCP Context argument.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_tools: Dict[str, LazyTool] = {}
+
+    def add_lazy_tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        factory: Callable[[], Callable[..., Any]],
+    ):
+        """Registers a tool that is built on its first call.
+
+        Args:
+            name: The tool name.
+            description: The tool description.
+            input_schema: The JSON schema of the tool arguments, as the built
+                tool would report it.
+            factory: Returns the tool function.
+        """
+        self._lazy_tools[name] = LazyTool(name, description, input_schema, factory)
+
+    def materialize_tool(self, name: str) -> bool:
+        """Builds a lazy tool if it has not been built yet.
+
+        Returns:
+            True if the tool was built by this call.
+        """
+        lazy_tool = self._lazy_tools.get(name)
+        if lazy_tool is None:
+            return False
+        fn = lazy_tool.factory()
+        # add_tool would regenerate the input schema from the argument model,
+        # so the tool is registered with the precomputed one instead.
+        self._tool_manager._tools[name] = Tool(
+            fn=fn,
+            name=name,
+            description=lazy_tool.description,
+            parameters=lazy_tool.input_schema,
+            fn_metadata=func_metadata(fn),
+            is_async=inspect.iscoroutinefunction(fn),
+            context_kwarg=None,
+        )
+        del self._lazy_tools[name]
+        return True
+
+    async def list_tools(self) -> List[MCPTool]:
+        tools = await super().list_tools()
+        tools.extend(
+            MCPTool(
+                name=lazy_tool.name,
+                description=lazy_tool.description,
+                inputSchema=lazy_tool.input_schema,
+            )
+            for lazy_tool in self._lazy_tools.values()
+        )
+        return tools
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        self.materialize_tool(name)
+        return await super().call_tool(name, arguments)
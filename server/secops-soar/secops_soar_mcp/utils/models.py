@@ -30,6 +30,23 @@ class TargetEntity(BaseModel):
     EntityType: str
 
 
+class BatchActionTarget(BaseModel):
+    """A case, and the alert groups and entities in it, to run an action on."""
+
+    case_id: str = Field(..., description="The ID of the case.")
+    alert_group_identifiers: List[str] = Field(
+        ..., description="Identifiers for the alert groups."
+    )
+    target_entities: List[TargetEntity] = Field(
+        default_factory=list,
+        description="Specific entities to run the action on. If empty, the action runs on the entities of the scope.",
+    )
+    scope: Optional[str] = Field(
+        default=None,
+        description="The entity scope to run the action on when no target entities are given. Defaults to all entities.",
+    )
+
+
 class ApiManualActionDataModel(BaseModel):
     caseId: int
     targetEntities: List[Any] = Field(default_factory=list)
@@ -1,7 +1,34 @@
-from typing import Type
+import functools
+from typing import Any, Dict, Type
 from pydantic import BaseModel, Field
 from pydantic.json_schema import GenerateJsonSchema
 
+
+@functools.lru_cache(maxsize=None)
+def _items_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    # Use Pydantic's own schema generator to build the schema for the model
+    model_schema = model.model_json_schema()
+
+    # The schema generator might place definitions in a "$defs" block,
+    # so we need to get the actual schema, which might be a reference.
+    # This logic handles both simple and complex (referenced) schemas.
+    definitions = model_schema.pop("$defs", {})
+    return _inline_refs(model_schema, definitions)
+
+
+def _inline_refs(schema: Any, definitions: Dict[str, Any]) -> Any:
+    # Models with nested models reference them through "$defs", which is
+    # dropped above, so the references are replaced by the schemas themselves.
+    if isinstance(schema, list):
+        return [_inline_refs(item, definitions) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    if "$ref" in schema:
+        ref_key = schema["$ref"].split('/')[-1]
+        return _inline_refs(definitions[ref_key], definitions)
+    return {key: _inline_refs(value, definitions) for key, value in schema.items()}
+
+
 def PydanticListField(
     model: Type[BaseModel],
     description: str = "",
@@ -10,21 +37,10 @@ def PydanticListField(
     """
     Creates a Pydantic Field for a list of a given BaseModel,
     manually injecting the correct JSON schema to satisfy the Gemini CLI validator.
+    The model's schema is generated once and reused for every field.
     """
-    # Use Pydantic's own schema generator to build the schema for the model
-    model_schema = model.model_json_schema()
-
-    # The schema generator might place definitions in a "$defs" block,
-    # so we need to get the actual schema, which might be a reference.
-    # This logic handles both simple and complex (referenced) schemas.
-    if "$ref" in model_schema:
-        ref_key = model_schema["$ref"].split('/')[-1]
-        final_schema = model_schema["$defs"][ref_key]
-    else:
-        final_schema = model_schema
-
     return Field(
         default_factory=default_factory,
         description=description,
-        json_schema_extra={"items": final_schema},
-    )
\ No newline at end of file
+        json_schema_extra={"items": _items_schema(model)},
+    )
@@ -26,7 +26,12 @@ import mcp
 import pytest
 from typing import Optional
 
+from secops_soar_mcp import bindings
+from secops_soar_mcp.actions import execute_manual_action
+from secops_soar_mcp.http_client import HttpError
+from secops_soar_mcp.instance_selection import FIRST, InstanceSelector
 from secops_soar_mcp.server import mcp as mcp_server
+from secops_soar_mcp.utils.models import TargetEntity
 
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
@@ -39,6 +44,21 @@ from tests.conftest import setup_bindings
     argnames=["tool_name", "tool_arguments", "expected_substring"],
     argvalues=[
         ("list_cases", None, "cases"),
+        ("list_cases", {"auto_paginate": True, "max_items": 5}, "pagesFetched"),
+        ("get_cases_digest", {"max_cases": 3}, "digests"),
+        ("get_case_timeline", {"case_id": "1", "max_events": 5}, "event_count"),
+        ("rank_case_queue", {"top_k": 3}, "case_count"),
+        (
+            "execute_action_batch",
+            {"action_tool_name": "unknown_tool", "targets": []},
+            "Unknown action tool",
+        ),
+        ("get_job_result", {"job_id": "unknown"}, "Unknown job"),
+        (
+            "ping_integrations",
+            {"case_id": "1", "integrations": ["NotAnIntegration"]},
+            "not enabled",
+        ),
     ],
 )
 async def test_tool(tool_name, tool_arguments, expected_substring):
@@ -75,3 +95,67 @@ async def test_server_connection(setup_bindings):
         tools_result = await client.list_tools()
         assert isinstance(tools_result, mcp.ListToolsResult)
         assert len(tools_result.tools) > 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    argnames=[
+        "action_name",
+        "first_response",
+        "expected_instances",
+        "expected_response",
+    ],
+    argvalues=[
+        # Enrichment actions fail over on any failure.
+        (
+            "VirusTotalV3_Enrich Hash",
+            None,
+            ["instance-1", "instance-2"],
+            {"Status": "Completed"},
+        ),
+        # Other actions only fail over when they surely never ran.
+        ("VirusTotalV3_Submit File", None, ["instance-1"], None),
+        (
+            "VirusTotalV3_Submit File",
+            HttpError(None, "Could not connect to SOAR."),
+            ["instance-1", "instance-2"],
+            {"Status": "Completed"},
+        ),
+    ],
+)
+async def test_action_failover(
+    monkeypatch, action_name, first_response, expected_instances, expected_response
+):
+    """Test that a failed action is retried on the next instance when safe."""
+    tried_instances = []
+
+    async def get_instances(integration_name):
+        return [{"identifier": "instance-1"}, {"identifier": "instance-2"}]
+
+    async def post(endpoint, req=None, **kwargs):
+        instance = req["properties"]["IntegrationInstance"]
+        tried_instances.append(instance)
+        if instance == "instance-1":
+            return first_response
+        return {"Status": "Completed"}
+
+    monkeypatch.setattr(bindings.instance_cache, "get_instances", get_instances)
+    monkeypatch.setattr(bindings.http_client, "post", post)
+    monkeypatch.setattr(bindings, "instance_selector", InstanceSelector(FIRST, 30))
+    monkeypatch.setattr(bindings, "action_result_cache", None)
+    monkeypatch.setattr(bindings, "action_coalescer", None)
+
+    response = await execute_manual_action(
+        "VirusTotalV3",
+        action_name,
+        "1",
+        ["group"],
+        {},
+        [
+            TargetEntity(
+                Identifier="44d88612fea8a8f36de82e1297f1a7d0", EntityType="FILEHASH"
+            )
+        ],
+    )
+    assert tried_instances == expected_instances
+    assert response == expected_response